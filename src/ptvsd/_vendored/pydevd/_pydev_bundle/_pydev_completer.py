@@ -1,8 +1,10 @@
 from collections import namedtuple
 from string import ascii_letters, digits
+import bisect
+import re
 
 from _pydevd_bundle import pydevd_xml
-from _pydevd_bundle.pydevd_constants import IS_PY2
+from _pydevd_bundle.pydevd_constants import IS_PY2, xrange
 import pydevconsole
 
 if IS_PY2:
@@ -151,8 +153,101 @@ class Completer:
         return words
 
 
-def generate_completions(frame, act_tok):
+#=======================================================================================================================
+# CompletionsIndex
+#=======================================================================================================================
+class CompletionsIndex(object):
+    '''
+    The names of a namespace (or the attributes of an object) sorted case-insensitively, so
+    that the names with a given prefix are found with a bisect instead of filtering all the
+    names (the info for each completion is only computed when first requested).
     '''
+
+    def __init__(self, obj, names, getattr=getattr):
+        names = sorted(set(name for name in names if name is not None), key=lambda name: name.lower())
+        self.obj = obj
+        self._getattr = getattr
+        self._names = names
+        self._keys = [name.lower() for name in names]
+        self._name_to_completion = {}
+
+    def __len__(self):
+        return len(self._names)
+
+    def get_completions(self, prefix):
+        '''
+        :return list(tuple(method_name, docstring, parameters, completion_type)):
+            The completions for the names starting with the given prefix (case-insensitive).
+        '''
+        prefix = prefix.lower()
+        keys = self._keys
+        names = []
+        for i in xrange(bisect.bisect_left(keys, prefix), len(keys)):
+            if not keys[i].startswith(prefix):
+                break
+            names.append(self._names[i])
+
+        name_to_completion = self._name_to_completion
+        missing = [name for name in names if name not in name_to_completion]
+        if missing:
+            for completion in dir2(self.obj, missing, self._getattr):
+                name_to_completion[completion[0]] = completion
+
+        return [name_to_completion[name] for name in names if name in name_to_completion]
+
+
+def _get_item(obj, attr):
+    return obj[attr]
+
+
+def _get_completions_index(frame, act_tok, completions_cache):
+    '''
+    :return tuple(CompletionsIndex, str):
+        The index with the completions available for the given activation token and the prefix
+        to be searched in it (or (None, None) if the activation token couldn't be resolved).
+    '''
+    f_globals = frame.f_globals
+    f_locals = frame.f_locals
+    if '.' not in act_tok:
+        # Note: the cache is cleared if the namespace changes during the suspension (i.e.: code
+        # executed in the console or variables set -- see: SuspendedFramesManager.clear_completions_caches).
+        key = (id(frame),)
+        index = completions_cache.get(key)
+        if index is None:
+            namespace = {}
+            for dict_with_comps in [__builtin__.__dict__, f_globals, f_locals]:  # @UndefinedVariable
+                namespace.update(dict_with_comps)
+            index = completions_cache[key] = CompletionsIndex(namespace, namespace.keys(), _get_item)
+        return index, act_tok
+
+    m = re.match(r"(\S+(\.\w+)*)\.(\w*)$", act_tok)
+    if not m:
+        return None, None
+
+    expr, attr = m.group(1, 3)
+    try:
+        obj = eval(expr, f_globals, f_locals)
+    except:
+        return None, None
+
+    key = (id(frame), id(obj))
+    index = completions_cache.get(key)
+    if index is None or index.obj is not obj:
+        names = dir(obj)
+        if hasattr(obj, '__dict__'):
+            names.append('__dict__')
+        if hasattr(obj, '__class__'):
+            names.append('__class__')
+        index = completions_cache[key] = CompletionsIndex(obj, names)
+    return index, attr
+
+
+def generate_completions(frame, act_tok, completions_cache=None):
+    '''
+    :param dict completions_cache:
+        If given, the completions indexes for the frame are kept in it (it may be reused while
+        the frame is suspended to avoid computing the completions again on each request).
+
     :return list(tuple(method_name, docstring, parameters, completion_type))
 
     method_name: str
@@ -164,6 +259,12 @@ def generate_completions(frame, act_tok):
     if frame is None:
         return []
 
+    if completions_cache is not None and not pydevconsole.IPYTHON:
+        index, prefix = _get_completions_index(frame, act_tok, completions_cache)
+        if index is None:
+            return []
+        return index.get_completions(prefix)
+
     # Not using frame.f_globals because of https://sourceforge.net/tracker2/?func=detail&aid=2541355&group_id=85796&atid=577329
     # (Names not resolved in generator expression in method)
     # See message: http://mail.python.org/pipermail/python-list/2009-January/526522.html
@@ -18,6 +18,38 @@ except:
         import io as StringIO
 
 
+_MAX_COMPILED_COMMANDS_CACHE_SIZE = 200
+
+# (source, filename, symbol, compiler flags) -> code (or None if the source is incomplete)
+_compiled_commands_cache = {}
+
+
+def compile_command_cached(compiler, source, filename='<input>', symbol='single'):
+    '''
+    Compiles the given source with the given compiler (i.e.: `codeop.compile_command` or a
+    `codeop.CommandCompiler`) reusing the code previously compiled for the same source (which is
+    common in a debug console, where the same commands are entered whenever the thread is
+    suspended).
+
+    :raises SyntaxError, OverflowError, ValueError:
+        If the source is not valid (errors aren't cached).
+    '''
+    # A CommandCompiler keeps the flags of the __future__ statements already compiled.
+    flags = getattr(getattr(compiler, 'compiler', None), 'flags', 0)
+    key = (source, filename, symbol, flags)
+    try:
+        return _compiled_commands_cache[key]
+    except KeyError:
+        pass
+
+    code = compiler(source, filename, symbol)
+    if '__future__' not in source:  # The compiler must see those to update its flags.
+        if len(_compiled_commands_cache) >= _MAX_COMPILED_COMMANDS_CACHE_SIZE:
+            _compiled_commands_cache.clear()
+        _compiled_commands_cache[key] = code
+    return code
+
+
 # =======================================================================================================================
 # BaseStdIn
 # =======================================================================================================================
@@ -541,6 +541,10 @@ def send_process_created_message():
 
 
 def patch_new_process_functions():
+    # Subprocesses are also debugged: let them reuse the default library roots.
+    from _pydevd_bundle.pydevd_filtering import FilesFiltering
+    FilesFiltering.share_default_library_roots()
+
     # os.execl(path, arg0, arg1, ...)
     # os.execle(path, arg0, arg1, ..., env)
     # os.execlp(file, arg0, arg1, ...)
@@ -656,6 +660,11 @@ class _NewThreadStartupWithTrace:
                 thread_id = get_current_thread_id(t)
                 global_debugger.notify_thread_created(thread_id, t)
                 _on_set_trace_for_new_thread(global_debugger)
+                if global_debugger.defer_tracing:
+                    # Unhandled exceptions are reported through the excepthooks while the
+                    # tracing is deferred.
+                    from _pydevd_bundle.pydevd_excepthooks import wrap_thread_run
+                    wrap_thread_run(t)
 
             if getattr(global_debugger, 'thread_analyser', None) is not None:
                 try:
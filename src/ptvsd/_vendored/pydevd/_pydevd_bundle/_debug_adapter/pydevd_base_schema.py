@@ -85,7 +85,15 @@ def register_event(event):
     return do_register
 
 
+def _load_schema():
+    # The generated schema is big and takes a while to import, so, it's only
+    # loaded when some message class is actually needed.
+    if not _all_messages:
+        from _pydevd_bundle._debug_adapter import pydevd_schema  # @UnusedImport
+
+
 def from_dict(dct, update_ids_from_dap=False):
+    _load_schema()
     msg_type = dct.get('type')
     if msg_type is None:
         raise ValueError('Unable to make sense of message: %s' % (dct,))
@@ -130,6 +138,7 @@ def from_json(json_msg, update_ids_from_dap=False):
 
 
 def get_response_class(request):
+    _load_schema()
     if request.__class__ == dict:
         return _responses_to_types[request['command']]
     return _responses_to_types[request.command]
@@ -141,6 +150,7 @@ def build_response(request, kwargs=None):
     else:
         if 'success' not in kwargs:
             kwargs['success'] = True
+    _load_schema()
     response_class = _responses_to_types[request.command]
     kwargs.setdefault('seq', -1)  # To be overwritten before sending
     return response_class(command=request.command, request_seq=request.seq, **kwargs)
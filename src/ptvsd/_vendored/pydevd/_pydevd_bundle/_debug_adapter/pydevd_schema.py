@@ -12885,6 +12885,1635 @@ class PydevdProcessInfo(BaseSchema):
         return dct
 
 
+@register_request('pydevdStartProfiling')
+@register
+class PydevdStartProfilingRequest(BaseSchema):
+    """
+    The request starts a sampling profiler which periodically collects the stacks of all the threads
+    (without any tracing).
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "pydevdStartProfiling"
+            ]
+        },
+        "arguments": {
+            "type": "PydevdStartProfilingArguments"
+        }
+    }
+    __refs__ = set(['arguments'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string command: 
+        :param integer seq: Sequence number.
+        :param PydevdStartProfilingArguments arguments: 
+        """
+        self.type = 'request'
+        self.command = 'pydevdStartProfiling'
+        self.seq = seq
+        if arguments is None:
+            self.arguments = PydevdStartProfilingArguments()
+        else:
+            self.arguments = PydevdStartProfilingArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  PydevdStartProfilingArguments else arguments
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        seq = self.seq
+        arguments = self.arguments
+        dct = {
+            'type': type,
+            'command': command,
+            'seq': seq,
+        }
+        if arguments is not None:
+            dct['arguments'] = arguments.to_dict(update_ids_to_dap=update_ids_to_dap)
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdStartProfilingArguments(BaseSchema):
+    """
+    Arguments for 'pydevdStartProfiling' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "interval": {
+            "type": "number",
+            "description": "Interval (in seconds) between samples. Default is 0.01."
+        },
+        "clock": {
+            "type": "string",
+            "enum": [
+                "wall",
+                "cpu"
+            ],
+            "description": "Whether samples are weighted by the wall-clock time or by the CPU time used by each thread since the previous sample ('cpu' is only available on Python 3.7 onwards on Linux/Mac). Default is 'wall'."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, interval=None, clock=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param number interval: Interval (in seconds) between samples. Default is 0.01.
+        :param string clock: Whether samples are weighted by the wall-clock time or by the CPU time used by each thread since the previous sample ('cpu' is only available on Python 3.7 onwards on Linux/Mac). Default is 'wall'.
+        """
+        self.interval = interval
+        self.clock = clock
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        interval = self.interval
+        clock = self.clock
+        dct = {
+        }
+        if interval is not None:
+            dct['interval'] = interval
+        if clock is not None:
+            dct['clock'] = clock
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_response('pydevdStartProfiling')
+@register
+class PydevdStartProfilingResponse(BaseSchema):
+    """
+    Response to 'pydevdStartProfiling' request. This is just an acknowledgement, so no body field is
+    required.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "response"
+            ]
+        },
+        "request_seq": {
+            "type": "integer",
+            "description": "Sequence number of the corresponding request."
+        },
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request."
+        },
+        "command": {
+            "type": "string",
+            "description": "The command requested."
+        },
+        "message": {
+            "type": "string",
+            "description": "Contains error message if success == false."
+        },
+        "body": {
+            "type": [
+                "array",
+                "boolean",
+                "integer",
+                "null",
+                "number",
+                "object",
+                "string"
+            ],
+            "description": "Contains request result if success is true and optional error details if success is false."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        :param string command: The command requested.
+        :param integer seq: Sequence number.
+        :param string message: Contains error message if success == false.
+        :param ['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'] body: Contains request result if success is true and optional error details if success is false.
+        """
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        self.seq = seq
+        self.message = message
+        self.body = body
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        seq = self.seq
+        message = self.message
+        body = self.body
+        dct = {
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'seq': seq,
+        }
+        if message is not None:
+            dct['message'] = message
+        if body is not None:
+            dct['body'] = body
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_request('pydevdStopProfiling')
+@register
+class PydevdStopProfilingRequest(BaseSchema):
+    """
+    The request stops the sampling profiler started by 'pydevdStartProfiling' and returns the collected
+    stacks.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "pydevdStopProfiling"
+            ]
+        },
+        "arguments": {
+            "type": "PydevdStopProfilingArguments"
+        }
+    }
+    __refs__ = set(['arguments'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string command: 
+        :param integer seq: Sequence number.
+        :param PydevdStopProfilingArguments arguments: 
+        """
+        self.type = 'request'
+        self.command = 'pydevdStopProfiling'
+        self.seq = seq
+        if arguments is None:
+            self.arguments = PydevdStopProfilingArguments()
+        else:
+            self.arguments = PydevdStopProfilingArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  PydevdStopProfilingArguments else arguments
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        seq = self.seq
+        arguments = self.arguments
+        dct = {
+            'type': type,
+            'command': command,
+            'seq': seq,
+        }
+        if arguments is not None:
+            dct['arguments'] = arguments.to_dict(update_ids_to_dap=update_ids_to_dap)
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdStopProfilingArguments(BaseSchema):
+    """
+    Arguments for 'pydevdStopProfiling' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "format": {
+            "type": "string",
+            "enum": [
+                "collapsed",
+                "speedscope"
+            ],
+            "description": "Format of the returned profile: 'collapsed' (one line per stack with the frames separated by ';' followed by the weight in microseconds) or 'speedscope' (json). Default is 'collapsed'."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, format=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string format: Format of the returned profile: 'collapsed' (one line per stack with the frames separated by ';' followed by the weight in microseconds) or 'speedscope' (json). Default is 'collapsed'.
+        """
+        self.format = format
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        format = self.format  # noqa (assign to builtin)
+        dct = {
+        }
+        if format is not None:
+            dct['format'] = format
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_response('pydevdStopProfiling')
+@register
+class PydevdStopProfilingResponse(BaseSchema):
+    """
+    Response to 'pydevdStopProfiling' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "response"
+            ]
+        },
+        "request_seq": {
+            "type": "integer",
+            "description": "Sequence number of the corresponding request."
+        },
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request."
+        },
+        "command": {
+            "type": "string",
+            "description": "The command requested."
+        },
+        "message": {
+            "type": "string",
+            "description": "Contains error message if success == false."
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "format": {
+                    "type": "string",
+                    "description": "Format of the profile."
+                },
+                "profile": {
+                    "type": "string",
+                    "description": "The profile contents."
+                },
+                "samples": {
+                    "type": "integer",
+                    "description": "Number of samples collected."
+                }
+            },
+            "required": [
+                "format",
+                "profile",
+                "samples"
+            ]
+        }
+    }
+    __refs__ = set(['body'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        :param string command: The command requested.
+        :param PydevdStopProfilingResponseBody body: 
+        :param integer seq: Sequence number.
+        :param string message: Contains error message if success == false.
+        """
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdStopProfilingResponseBody()
+        else:
+            self.body = PydevdStopProfilingResponseBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  PydevdStopProfilingResponseBody else body
+        self.seq = seq
+        self.message = message
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
+        dct = {
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        if message is not None:
+            dct['message'] = message
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_request('pydevdGetConcurrencyEvents')
+@register
+class PydevdGetConcurrencyEventsRequest(BaseSchema):
+    """
+    The request returns the events recorded by the concurrency analyser (which must be enabled with the
+    '--save-threading' or '--save-asyncio' command line flags).
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "pydevdGetConcurrencyEvents"
+            ]
+        },
+        "arguments": {
+            "type": "PydevdGetConcurrencyEventsArguments"
+        }
+    }
+    __refs__ = set(['arguments'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string command: 
+        :param integer seq: Sequence number.
+        :param PydevdGetConcurrencyEventsArguments arguments: 
+        """
+        self.type = 'request'
+        self.command = 'pydevdGetConcurrencyEvents'
+        self.seq = seq
+        if arguments is None:
+            self.arguments = PydevdGetConcurrencyEventsArguments()
+        else:
+            self.arguments = PydevdGetConcurrencyEventsArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  PydevdGetConcurrencyEventsArguments else arguments
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        seq = self.seq
+        arguments = self.arguments
+        dct = {
+            'type': type,
+            'command': command,
+            'seq': seq,
+        }
+        if arguments is not None:
+            dct['arguments'] = arguments.to_dict(update_ids_to_dap=update_ids_to_dap)
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdGetConcurrencyEventsArguments(BaseSchema):
+    """
+    Arguments for 'pydevdGetConcurrencyEvents' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {}
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+    
+        """
+    
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        dct = {
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_response('pydevdGetConcurrencyEvents')
+@register
+class PydevdGetConcurrencyEventsResponse(BaseSchema):
+    """
+    Response to 'pydevdGetConcurrencyEvents' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "response"
+            ]
+        },
+        "request_seq": {
+            "type": "integer",
+            "description": "Sequence number of the corresponding request."
+        },
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request."
+        },
+        "command": {
+            "type": "string",
+            "description": "The command requested."
+        },
+        "message": {
+            "type": "string",
+            "description": "Contains error message if success == false."
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "trace": {
+                    "type": "string",
+                    "description": "The events in the Chrome trace event format (json)."
+                },
+                "events": {
+                    "type": "integer",
+                    "description": "Number of events in the trace."
+                },
+                "dropped": {
+                    "type": "integer",
+                    "description": "Number of events which were dropped because the events buffer was full."
+                }
+            },
+            "required": [
+                "trace",
+                "events",
+                "dropped"
+            ]
+        }
+    }
+    __refs__ = set(['body'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        :param string command: The command requested.
+        :param PydevdGetConcurrencyEventsResponseBody body: 
+        :param integer seq: Sequence number.
+        :param string message: Contains error message if success == false.
+        """
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdGetConcurrencyEventsResponseBody()
+        else:
+            self.body = PydevdGetConcurrencyEventsResponseBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  PydevdGetConcurrencyEventsResponseBody else body
+        self.seq = seq
+        self.message = message
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
+        dct = {
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        if message is not None:
+            dct['message'] = message
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_request('pydevdEvaluateWatches')
+@register
+class PydevdEvaluateWatchesRequest(BaseSchema):
+    """
+    Evaluates a batch of (watch) expressions in a single pass in the suspended thread (as an alternative
+    to an 'evaluate' request for each expression).
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "pydevdEvaluateWatches"
+            ]
+        },
+        "arguments": {
+            "type": "PydevdEvaluateWatchesArguments"
+        }
+    }
+    __refs__ = set(['arguments'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string command: 
+        :param PydevdEvaluateWatchesArguments arguments: 
+        :param integer seq: Sequence number.
+        """
+        self.type = 'request'
+        self.command = 'pydevdEvaluateWatches'
+        if arguments is None:
+            self.arguments = PydevdEvaluateWatchesArguments()
+        else:
+            self.arguments = PydevdEvaluateWatchesArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  PydevdEvaluateWatchesArguments else arguments
+        self.seq = seq
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        arguments = self.arguments
+        seq = self.seq
+        dct = {
+            'type': type,
+            'command': command,
+            'arguments': arguments.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdEvaluateWatchesArguments(BaseSchema):
+    """
+    Arguments for 'pydevdEvaluateWatches' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "expressions": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/PydevdWatchExpression"
+            },
+            "description": "The expressions to evaluate (all the frames must be from the same thread)."
+        },
+        "frameId": {
+            "type": "integer",
+            "description": "The frame in which the expressions without a frameId are evaluated."
+        },
+        "timeout": {
+            "type": "number",
+            "description": "Time budget (in seconds) for the evaluation of each expression (an evaluation which takes longer is interrupted and reported as an error). If not given 1 second is used (0 means no time budget)."
+        },
+        "format": {
+            "description": "Specifies details on how to format the results.",
+            "type": "ValueFormat"
+        }
+    }
+    __refs__ = set(['format'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, expressions, frameId=None, timeout=None, format=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array expressions: The expressions to evaluate (all the frames must be from the same thread).
+        :param integer frameId: The frame in which the expressions without a frameId are evaluated.
+        :param number timeout: Time budget (in seconds) for the evaluation of each expression (an evaluation which takes longer is interrupted and reported as an error). If not given 1 second is used (0 means no time budget).
+        :param ValueFormat format: Specifies details on how to format the results.
+        """
+        self.expressions = expressions
+        if update_ids_from_dap and self.expressions:
+            for o in self.expressions:
+                PydevdWatchExpression.update_dict_ids_from_dap(o)
+        self.frameId = frameId
+        self.timeout = timeout
+        if format is None:
+            self.format = ValueFormat()
+        else:
+            self.format = ValueFormat(update_ids_from_dap=update_ids_from_dap, **format) if format.__class__ !=  ValueFormat else format
+        if update_ids_from_dap:
+            self.frameId = self._translate_id_from_dap(self.frameId)
+        self.kwargs = kwargs
+    
+    
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if 'frameId' in dct:
+            dct['frameId'] = cls._translate_id_from_dap(dct['frameId'])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        expressions = self.expressions
+        frameId = self.frameId
+        timeout = self.timeout
+        format = self.format  # noqa (assign to builtin)
+        if update_ids_to_dap:
+            if frameId is not None:
+                frameId = self._translate_id_to_dap(frameId)
+        dct = {
+            'expressions': [PydevdWatchExpression.update_dict_ids_to_dap(o) for o in expressions] if (update_ids_to_dap and expressions) else expressions,
+        }
+        if frameId is not None:
+            dct['frameId'] = frameId
+        if timeout is not None:
+            dct['timeout'] = timeout
+        if format is not None:
+            dct['format'] = format.to_dict(update_ids_to_dap=update_ids_to_dap)
+        dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'frameId' in dct:
+            dct['frameId'] = cls._translate_id_to_dap(dct['frameId'])
+        return dct
+
+
+@register
+class PydevdWatchExpression(BaseSchema):
+    """
+    An expression to evaluate in a 'pydevdEvaluateWatches' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "expression": {
+            "type": "string",
+            "description": "The expression to evaluate."
+        },
+        "frameId": {
+            "type": "integer",
+            "description": "The frame in which the expression is evaluated (if not given the frameId of the request is used)."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, expression, frameId=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string expression: The expression to evaluate.
+        :param integer frameId: The frame in which the expression is evaluated (if not given the frameId of the request is used).
+        """
+        self.expression = expression
+        self.frameId = frameId
+        if update_ids_from_dap:
+            self.frameId = self._translate_id_from_dap(self.frameId)
+        self.kwargs = kwargs
+    
+    
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if 'frameId' in dct:
+            dct['frameId'] = cls._translate_id_from_dap(dct['frameId'])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        expression = self.expression
+        frameId = self.frameId
+        if update_ids_to_dap:
+            if frameId is not None:
+                frameId = self._translate_id_to_dap(frameId)
+        dct = {
+            'expression': expression,
+        }
+        if frameId is not None:
+            dct['frameId'] = frameId
+        dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'frameId' in dct:
+            dct['frameId'] = cls._translate_id_to_dap(dct['frameId'])
+        return dct
+
+
+@register_response('pydevdEvaluateWatches')
+@register
+class PydevdEvaluateWatchesResponse(BaseSchema):
+    """
+    Response to 'pydevdEvaluateWatches' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "response"
+            ]
+        },
+        "request_seq": {
+            "type": "integer",
+            "description": "Sequence number of the corresponding request."
+        },
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request."
+        },
+        "command": {
+            "type": "string",
+            "description": "The command requested."
+        },
+        "message": {
+            "type": "string",
+            "description": "Contains error message if success == false."
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        "$ref": "#/definitions/PydevdWatchResult"
+                    },
+                    "description": "The result of each expression (in the same order of the requested expressions)."
+                }
+            },
+            "required": [
+                "results"
+            ]
+        }
+    }
+    __refs__ = set(['body'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        :param string command: The command requested.
+        :param PydevdEvaluateWatchesResponseBody body: 
+        :param integer seq: Sequence number.
+        :param string message: Contains error message if success == false.
+        """
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdEvaluateWatchesResponseBody()
+        else:
+            self.body = PydevdEvaluateWatchesResponseBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  PydevdEvaluateWatchesResponseBody else body
+        self.seq = seq
+        self.message = message
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
+        dct = {
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        if message is not None:
+            dct['message'] = message
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdWatchResult(BaseSchema):
+    """
+    The result of an expression evaluated in a 'pydevdEvaluateWatches' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "expression": {
+            "type": "string",
+            "description": "The evaluated expression."
+        },
+        "result": {
+            "type": "string",
+            "description": "The result of the evaluation (or the error if it failed)."
+        },
+        "error": {
+            "type": "string",
+            "description": "Only given if the evaluation failed or timed out."
+        },
+        "type": {
+            "type": "string",
+            "description": "The optional type of the evaluate result."
+        },
+        "presentationHint": {
+            "description": "Properties of a evaluate result that can be used to determine how to render the result in the UI.",
+            "type": "VariablePresentationHint"
+        },
+        "variablesReference": {
+            "type": "integer",
+            "description": "If variablesReference is > 0, the evaluate result is structured and its children can be retrieved by passing variablesReference to the VariablesRequest."
+        },
+        "namedVariables": {
+            "type": "integer",
+            "description": "The number of named child variables."
+        },
+        "indexedVariables": {
+            "type": "integer",
+            "description": "The number of indexed child variables."
+        }
+    }
+    __refs__ = set(['presentationHint'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, expression, result, variablesReference, error=None, type=None, presentationHint=None, namedVariables=None, indexedVariables=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string expression: The evaluated expression.
+        :param string result: The result of the evaluation (or the error if it failed).
+        :param integer variablesReference: If variablesReference is > 0, the evaluate result is structured and its children can be retrieved by passing variablesReference to the VariablesRequest.
+        :param string error: Only given if the evaluation failed or timed out.
+        :param string type: The optional type of the evaluate result.
+        :param VariablePresentationHint presentationHint: Properties of a evaluate result that can be used to determine how to render the result in the UI.
+        :param integer namedVariables: The number of named child variables.
+        :param integer indexedVariables: The number of indexed child variables.
+        """
+        self.expression = expression
+        self.result = result
+        self.variablesReference = variablesReference
+        self.error = error
+        self.type = type
+        if presentationHint is None:
+            self.presentationHint = VariablePresentationHint()
+        else:
+            self.presentationHint = VariablePresentationHint(update_ids_from_dap=update_ids_from_dap, **presentationHint) if presentationHint.__class__ !=  VariablePresentationHint else presentationHint
+        self.namedVariables = namedVariables
+        self.indexedVariables = indexedVariables
+        if update_ids_from_dap:
+            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
+        self.kwargs = kwargs
+    
+    
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_from_dap(dct['variablesReference'])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        expression = self.expression
+        result = self.result
+        variablesReference = self.variablesReference
+        error = self.error
+        type = self.type  # noqa (assign to builtin)
+        presentationHint = self.presentationHint
+        namedVariables = self.namedVariables
+        indexedVariables = self.indexedVariables
+        if update_ids_to_dap:
+            if variablesReference is not None:
+                variablesReference = self._translate_id_to_dap(variablesReference)
+        dct = {
+            'expression': expression,
+            'result': result,
+            'variablesReference': variablesReference,
+        }
+        if error is not None:
+            dct['error'] = error
+        if type is not None:
+            dct['type'] = type
+        if presentationHint is not None:
+            dct['presentationHint'] = presentationHint.to_dict(update_ids_to_dap=update_ids_to_dap)
+        if namedVariables is not None:
+            dct['namedVariables'] = namedVariables
+        if indexedVariables is not None:
+            dct['indexedVariables'] = indexedVariables
+        dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_to_dap(dct['variablesReference'])
+        return dct
+
+
+@register_request('pydevdSourceChunk')
+@register
+class PydevdSourceChunkRequest(BaseSchema):
+    """
+    The request retrieves a chunk of the source for a source reference (as an alternative to a 'source'
+    request for huge sources).
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "pydevdSourceChunk"
+            ]
+        },
+        "arguments": {
+            "type": "PydevdSourceChunkArguments"
+        }
+    }
+    __refs__ = set(['arguments'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string command: 
+        :param PydevdSourceChunkArguments arguments: 
+        :param integer seq: Sequence number.
+        """
+        self.type = 'request'
+        self.command = 'pydevdSourceChunk'
+        if arguments is None:
+            self.arguments = PydevdSourceChunkArguments()
+        else:
+            self.arguments = PydevdSourceChunkArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  PydevdSourceChunkArguments else arguments
+        self.seq = seq
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        arguments = self.arguments
+        seq = self.seq
+        dct = {
+            'type': type,
+            'command': command,
+            'arguments': arguments.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdSourceChunkArguments(BaseSchema):
+    """
+    Arguments for 'pydevdSourceChunk' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "sourceReference": {
+            "type": "integer",
+            "description": "The reference to the source."
+        },
+        "start": {
+            "type": "integer",
+            "description": "The offset (in characters) of the first character to retrieve. If not given 0 is used."
+        },
+        "count": {
+            "type": "integer",
+            "description": "The maximum number of characters to retrieve. If not given 1048576 is used."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, sourceReference, start=None, count=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param integer sourceReference: The reference to the source.
+        :param integer start: The offset (in characters) of the first character to retrieve. If not given 0 is used.
+        :param integer count: The maximum number of characters to retrieve. If not given 1048576 is used.
+        """
+        self.sourceReference = sourceReference
+        self.start = start
+        self.count = count
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        sourceReference = self.sourceReference
+        start = self.start
+        count = self.count
+        dct = {
+            'sourceReference': sourceReference,
+        }
+        if start is not None:
+            dct['start'] = start
+        if count is not None:
+            dct['count'] = count
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_response('pydevdSourceChunk')
+@register
+class PydevdSourceChunkResponse(BaseSchema):
+    """
+    Response to 'pydevdSourceChunk' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "response"
+            ]
+        },
+        "request_seq": {
+            "type": "integer",
+            "description": "Sequence number of the corresponding request."
+        },
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request."
+        },
+        "command": {
+            "type": "string",
+            "description": "The command requested."
+        },
+        "message": {
+            "type": "string",
+            "description": "Contains error message if success == false."
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "content": {
+                    "type": "string",
+                    "description": "Content of the chunk."
+                },
+                "start": {
+                    "type": "integer",
+                    "description": "The offset (in characters) of the chunk."
+                },
+                "totalLength": {
+                    "type": "integer",
+                    "description": "The length (in characters) of the whole source."
+                }
+            },
+            "required": [
+                "content",
+                "start",
+                "totalLength"
+            ]
+        }
+    }
+    __refs__ = set(['body'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        :param string command: The command requested.
+        :param PydevdSourceChunkResponseBody body: 
+        :param integer seq: Sequence number.
+        :param string message: Contains error message if success == false.
+        """
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdSourceChunkResponseBody()
+        else:
+            self.body = PydevdSourceChunkResponseBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  PydevdSourceChunkResponseBody else body
+        self.seq = seq
+        self.message = message
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
+        dct = {
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        if message is not None:
+            dct['message'] = message
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_request('pydevdGetReferrers')
+@register
+class PydevdGetReferrersRequest(BaseSchema):
+    """
+    The request returns the referrers of a variable (or the path of referrers from the variable to a
+    module) using an index built from a snapshot of the heap (the snapshot is taken on the first request
+    and kept until the thread is resumed).
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "pydevdGetReferrers"
+            ]
+        },
+        "arguments": {
+            "type": "PydevdGetReferrersArguments"
+        }
+    }
+    __refs__ = set(['arguments'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string command: 
+        :param PydevdGetReferrersArguments arguments: 
+        :param integer seq: Sequence number.
+        """
+        self.type = 'request'
+        self.command = 'pydevdGetReferrers'
+        if arguments is None:
+            self.arguments = PydevdGetReferrersArguments()
+        else:
+            self.arguments = PydevdGetReferrersArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  PydevdGetReferrersArguments else arguments
+        self.seq = seq
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        arguments = self.arguments
+        seq = self.seq
+        dct = {
+            'type': type,
+            'command': command,
+            'arguments': arguments.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdGetReferrersArguments(BaseSchema):
+    """
+    Arguments for 'pydevdGetReferrers' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "variablesReference": {
+            "type": "integer",
+            "description": "The reference of the variable whose referrers should be returned."
+        },
+        "pathToRoot": {
+            "type": "boolean",
+            "description": "If true, the shortest path of referrers from the variable to a module is returned instead of the direct referrers."
+        },
+        "maxResults": {
+            "type": "integer",
+            "description": "The maximum number of referrers returned (not used for the path to a module). If not given 100 is used."
+        },
+        "refresh": {
+            "type": "boolean",
+            "description": "If true, a new snapshot of the heap is taken."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, variablesReference, pathToRoot=None, maxResults=None, refresh=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param integer variablesReference: The reference of the variable whose referrers should be returned.
+        :param boolean pathToRoot: If true, the shortest path of referrers from the variable to a module is returned instead of the direct referrers.
+        :param integer maxResults: The maximum number of referrers returned (not used for the path to a module). If not given 100 is used.
+        :param boolean refresh: If true, a new snapshot of the heap is taken.
+        """
+        self.variablesReference = variablesReference
+        self.pathToRoot = pathToRoot
+        self.maxResults = maxResults
+        self.refresh = refresh
+        if update_ids_from_dap:
+            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
+        self.kwargs = kwargs
+    
+    
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_from_dap(dct['variablesReference'])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        variablesReference = self.variablesReference
+        pathToRoot = self.pathToRoot
+        maxResults = self.maxResults
+        refresh = self.refresh
+        if update_ids_to_dap:
+            if variablesReference is not None:
+                variablesReference = self._translate_id_to_dap(variablesReference)
+        dct = {
+            'variablesReference': variablesReference,
+        }
+        if pathToRoot is not None:
+            dct['pathToRoot'] = pathToRoot
+        if maxResults is not None:
+            dct['maxResults'] = maxResults
+        if refresh is not None:
+            dct['refresh'] = refresh
+        dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_to_dap(dct['variablesReference'])
+        return dct
+
+
+@register_response('pydevdGetReferrers')
+@register
+class PydevdGetReferrersResponse(BaseSchema):
+    """
+    Response to 'pydevdGetReferrers' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "response"
+            ]
+        },
+        "request_seq": {
+            "type": "integer",
+            "description": "Sequence number of the corresponding request."
+        },
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request."
+        },
+        "command": {
+            "type": "string",
+            "description": "The command requested."
+        },
+        "message": {
+            "type": "string",
+            "description": "Contains error message if success == false."
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "referrers": {
+                    "type": "array",
+                    "items": {
+                        "$ref": "#/definitions/PydevdReferrer"
+                    },
+                    "description": "The referrers (or the path from the referrer of the variable to a module)."
+                },
+                "objects": {
+                    "type": "integer",
+                    "description": "Number of objects in the heap snapshot."
+                },
+                "references": {
+                    "type": "integer",
+                    "description": "Number of references in the heap snapshot."
+                }
+            },
+            "required": [
+                "referrers",
+                "objects",
+                "references"
+            ]
+        }
+    }
+    __refs__ = set(['body'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        :param string command: The command requested.
+        :param PydevdGetReferrersResponseBody body: 
+        :param integer seq: Sequence number.
+        :param string message: Contains error message if success == false.
+        """
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdGetReferrersResponseBody()
+        else:
+            self.body = PydevdGetReferrersResponseBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  PydevdGetReferrersResponseBody else body
+        self.seq = seq
+        self.message = message
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
+        dct = {
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        if message is not None:
+            dct['message'] = message
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdReferrer(BaseSchema):
+    """
+    An object referencing another object.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "name": {
+            "type": "string",
+            "description": "How the referenced object is found in this object (i.e.: the name of a local variable or attribute, the key in a dict, the index in a list)."
+        },
+        "value": {
+            "type": "string",
+            "description": "The representation of the object."
+        },
+        "type": {
+            "type": "string",
+            "description": "The type of the object."
+        },
+        "variablesReference": {
+            "type": "integer",
+            "description": "The reference to inspect the object (may also be used to get its referrers)."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, name, value, type, variablesReference, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string name: How the referenced object is found in this object (i.e.: the name of a local variable or attribute, the key in a dict, the index in a list).
+        :param string value: The representation of the object.
+        :param string type: The type of the object.
+        :param integer variablesReference: The reference to inspect the object (may also be used to get its referrers).
+        """
+        self.name = name
+        self.value = value
+        self.type = type
+        self.variablesReference = variablesReference
+        if update_ids_from_dap:
+            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
+        self.kwargs = kwargs
+    
+    
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_from_dap(dct['variablesReference'])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        name = self.name
+        value = self.value
+        type = self.type  # noqa (assign to builtin)
+        variablesReference = self.variablesReference
+        if update_ids_to_dap:
+            if variablesReference is not None:
+                variablesReference = self._translate_id_to_dap(variablesReference)
+        dct = {
+            'name': name,
+            'value': value,
+            'type': type,
+            'variablesReference': variablesReference,
+        }
+        dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_to_dap(dct['variablesReference'])
+        return dct
+
+
 @register
 class ErrorResponseBody(BaseSchema):
     """
@@ -14803,3 +16432,254 @@ class PydevdSystemInfoResponseBody(BaseSchema):
         }
         dct.update(self.kwargs)
         return dct
+
+
+@register
+class PydevdStopProfilingResponseBody(BaseSchema):
+    """
+    "body" of PydevdStopProfilingResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "format": {
+            "type": "string",
+            "description": "Format of the profile."
+        },
+        "profile": {
+            "type": "string",
+            "description": "The profile contents."
+        },
+        "samples": {
+            "type": "integer",
+            "description": "Number of samples collected."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, format, profile, samples, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string format: Format of the profile.
+        :param string profile: The profile contents.
+        :param integer samples: Number of samples collected.
+        """
+        self.format = format
+        self.profile = profile
+        self.samples = samples
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        format = self.format  # noqa (assign to builtin)
+        profile = self.profile
+        samples = self.samples
+        dct = {
+            'format': format,
+            'profile': profile,
+            'samples': samples,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdGetConcurrencyEventsResponseBody(BaseSchema):
+    """
+    "body" of PydevdGetConcurrencyEventsResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "trace": {
+            "type": "string",
+            "description": "The events in the Chrome trace event format (json)."
+        },
+        "events": {
+            "type": "integer",
+            "description": "Number of events in the trace."
+        },
+        "dropped": {
+            "type": "integer",
+            "description": "Number of events which were dropped because the events buffer was full."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, trace, events, dropped, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string trace: The events in the Chrome trace event format (json).
+        :param integer events: Number of events in the trace.
+        :param integer dropped: Number of events which were dropped because the events buffer was full.
+        """
+        self.trace = trace
+        self.events = events
+        self.dropped = dropped
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        trace = self.trace
+        events = self.events
+        dropped = self.dropped
+        dct = {
+            'trace': trace,
+            'events': events,
+            'dropped': dropped,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdEvaluateWatchesResponseBody(BaseSchema):
+    """
+    "body" of PydevdEvaluateWatchesResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "results": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/PydevdWatchResult"
+            },
+            "description": "The result of each expression (in the same order of the requested expressions)."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, results, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array results: The result of each expression (in the same order of the requested expressions).
+        """
+        self.results = results
+        if update_ids_from_dap and self.results:
+            for o in self.results:
+                PydevdWatchResult.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        results = self.results
+        dct = {
+            'results': [PydevdWatchResult.update_dict_ids_to_dap(o) for o in results] if (update_ids_to_dap and results) else results,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdSourceChunkResponseBody(BaseSchema):
+    """
+    "body" of PydevdSourceChunkResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "content": {
+            "type": "string",
+            "description": "Content of the chunk."
+        },
+        "start": {
+            "type": "integer",
+            "description": "The offset (in characters) of the chunk."
+        },
+        "totalLength": {
+            "type": "integer",
+            "description": "The length (in characters) of the whole source."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, content, start, totalLength, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string content: Content of the chunk.
+        :param integer start: The offset (in characters) of the chunk.
+        :param integer totalLength: The length (in characters) of the whole source.
+        """
+        self.content = content
+        self.start = start
+        self.totalLength = totalLength
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        content = self.content
+        start = self.start
+        totalLength = self.totalLength
+        dct = {
+            'content': content,
+            'start': start,
+            'totalLength': totalLength,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdGetReferrersResponseBody(BaseSchema):
+    """
+    "body" of PydevdGetReferrersResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "referrers": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/PydevdReferrer"
+            },
+            "description": "The referrers (or the path from the referrer of the variable to a module)."
+        },
+        "objects": {
+            "type": "integer",
+            "description": "Number of objects in the heap snapshot."
+        },
+        "references": {
+            "type": "integer",
+            "description": "Number of references in the heap snapshot."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, referrers, objects, references, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array referrers: The referrers (or the path from the referrer of the variable to a module).
+        :param integer objects: Number of objects in the heap snapshot.
+        :param integer references: Number of references in the heap snapshot.
+        """
+        self.referrers = referrers
+        if update_ids_from_dap and self.referrers:
+            for o in self.referrers:
+                PydevdReferrer.update_dict_ids_from_dap(o)
+        self.objects = objects
+        self.references = references
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        referrers = self.referrers
+        objects = self.objects
+        references = self.references
+        dct = {
+            'referrers': [PydevdReferrer.update_dict_ids_to_dap(o) for o in referrers] if (update_ids_to_dap and referrers) else referrers,
+            'objects': objects,
+            'references': references,
+        }
+        dct.update(self.kwargs)
+        return dct
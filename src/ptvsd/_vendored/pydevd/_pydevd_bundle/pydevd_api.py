@@ -8,13 +8,12 @@ from _pydevd_bundle.pydevd_comm import (InternalGetThreadStack, internal_get_com
     InternalGetVariable, InternalGetArray, InternalLoadFullValue,
     internal_get_description, internal_get_frame, internal_evaluate_expression, InternalConsoleExec,
     internal_get_variable_json, internal_change_variable, internal_change_variable_json,
-    internal_evaluate_expression_json, internal_set_expression_json, internal_get_exception_details_json,
-    internal_step_in_thread, internal_run_thread)
+    internal_evaluate_expression_json, internal_evaluate_watches_json, internal_set_expression_json, internal_get_exception_details_json,
+    internal_get_referrers_json, internal_step_in_thread, internal_run_thread)
 from _pydevd_bundle.pydevd_comm_constants import (CMD_THREAD_SUSPEND, file_system_encoding,
     CMD_STEP_INTO_MY_CODE, CMD_STOP_ON_START)
 from _pydevd_bundle.pydevd_constants import (get_current_thread_id, set_protocol, get_protocol,
     HTTP_JSON_PROTOCOL, JSON_PROTOCOL, IS_PY3K, DebugInfoHolder, dict_keys)
-from _pydevd_bundle.pydevd_net_command_factory_json import NetCommandFactoryJson
 from _pydevd_bundle.pydevd_net_command_factory_xml import NetCommandFactory
 import pydevd_file_utils
 from _pydev_bundle import pydev_log
@@ -36,6 +35,8 @@ class PyDevdAPI(object):
     def set_protocol(self, py_db, seq, protocol):
         set_protocol(protocol.strip())
         if get_protocol() in (HTTP_JSON_PROTOCOL, JSON_PROTOCOL):
+            # Imported lazily as it requires the (big) debug adapter protocol schema.
+            from _pydevd_bundle.pydevd_net_command_factory_json import NetCommandFactoryJson
             cmd_factory_class = NetCommandFactoryJson
         else:
             cmd_factory_class = NetCommandFactory
@@ -171,6 +172,7 @@ class PyDevdAPI(object):
     def request_step(self, py_db, thread_id, step_cmd_id):
         t = pydevd_find_thread_by_id(thread_id)
         if t:
+            py_db.start_deferred_tracing()
             py_db.post_method_as_internal_command(
                 thread_id,
                 internal_step_in_thread,
@@ -460,6 +462,14 @@ class PyDevdAPI(object):
         py_db.post_method_as_internal_command(
             thread_id, internal_evaluate_expression_json, request, thread_id)
 
+    def request_evaluate_watches_json(self, py_db, request, thread_id):
+        py_db.post_method_as_internal_command(
+            thread_id, internal_evaluate_watches_json, request, thread_id)
+
+    def request_get_referrers_json(self, py_db, request, thread_id):
+        py_db.post_method_as_internal_command(
+            thread_id, internal_get_referrers_json, request, thread_id)
+
     def request_set_expression_json(self, py_db, request, thread_id):
         py_db.post_method_as_internal_command(
             thread_id, internal_set_expression_json, request, thread_id)
@@ -0,0 +1,134 @@
+'''
+Line tables of code objects (cached per code object).
+
+They're used to validate the lines of breakpoints and the targets of a set next statement
+(so that an invalid jump is rejected without changing `frame.f_lineno`).
+'''
+import bisect
+import sys
+
+try:
+    import dis
+except ImportError:
+    dis = None  # i.e.: Jython
+
+_MAX_LINE_TABLES_CACHE_SIZE = 2000
+
+# The line event of a `for` from the second iteration onwards is at its FOR_ITER, which the
+# interpreter considers to be inside the loop (except in Python 3.8).
+_FOR_ITER_IN_LOOP = sys.version_info[:2] != (3, 8)
+
+# code -> CodeLineTable
+_line_tables_cache = {}
+
+
+def _get_loops(code):
+    '''
+    :return list(tuple(int, int)):
+        The (start, end) offsets of the `for` loops in the given code.
+    '''
+    get_instructions = getattr(dis, 'get_instructions', None)
+    if get_instructions is None:
+        return []  # Python 2 (loops aren't checked).
+    return [(instruction.offset, instruction.argval)
+            for instruction in get_instructions(code) if instruction.opname == 'FOR_ITER']
+
+
+class CodeLineTable(object):
+
+    def __init__(self, code):
+        self.code_name = code.co_name
+
+        # line -> offset of the first instruction of the line
+        self._line_to_offset = {}
+        for offset, line in dis.findlinestarts(code):
+            # Note: the line may be None (or 0) for instructions which have no line.
+            if line and line not in self._line_to_offset:
+                self._line_to_offset[line] = offset
+
+        self.lines = sorted(self._line_to_offset)
+        self._loops = _get_loops(code)
+
+    def _get_loops_at(self, offset):
+        if _FOR_ITER_IN_LOOP:
+            return set(start for start, end in self._loops if start <= offset < end)
+        return set(start for start, end in self._loops if start < offset < end)
+
+    def get_jump_error(self, from_offset, to_line):
+        '''
+        :param int from_offset:
+            The offset of the current instruction (i.e.: `frame.f_lasti`).
+
+        :return str|None:
+            A message saying why it's not possible to jump to the given line or None if the
+            jump seems valid (the interpreter may still reject it, for instance, when jumping
+            into an `except` or `finally` block).
+        '''
+        to_offset = self._line_to_offset.get(to_line)
+        if to_offset is None:
+            return 'Line %s is not a valid jump target in %s.' % (to_line, self.code_name)
+
+        # Jumping out of a loop is ok, but jumping into the body of a loop isn't.
+        if not self._get_loops_at(to_offset).issubset(self._get_loops_at(from_offset)):
+            return "Can't jump into the body of a for loop (line %s)." % (to_line,)
+
+        return None
+
+    def get_jump_targets(self, from_offset):
+        '''
+        :return list(int):
+            The sorted lines to which it's possible to jump from the given offset.
+        '''
+        return [line for line in self.lines if self.get_jump_error(from_offset, line) is None]
+
+    def get_nearest_line(self, line):
+        '''
+        :return int|None:
+            The given line if it's valid, otherwise, the next valid line (or the previous one
+            if there's no valid line after it).
+        '''
+        lines = self.lines
+        i = bisect.bisect_left(lines, line)
+        if i < len(lines):
+            return lines[i]
+        if lines:
+            return lines[-1]
+        return None
+
+
+def get_code_line_table(code):
+    '''
+    :return CodeLineTable|None:
+        The line table for the given code (or None if it's not available in this interpreter).
+    '''
+    try:
+        return _line_tables_cache[code]
+    except KeyError:
+        if dis is None:
+            return None
+
+        if len(_line_tables_cache) >= _MAX_LINE_TABLES_CACHE_SIZE:
+            _line_tables_cache.clear()
+        line_table = _line_tables_cache[code] = CodeLineTable(code)
+        return line_table
+
+
+def get_code_lines(code):
+    '''
+    :return iterable(int):
+        The lines with code in the given code and in the code of the functions and classes
+        defined in it.
+    '''
+    line_table = get_code_line_table(code)
+    if line_table is None:
+        raise NotImplementedError('Unable to get the lines of code objects in this interpreter.')
+
+    for line in line_table.lines:
+        yield line
+
+    # For nested class and function definitions, their respective code objects
+    # are constants referenced by this object.
+    for const in code.co_consts:
+        if isinstance(const, type(code)) and const.co_filename == code.co_filename:
+            for line in get_code_lines(const):
+                yield line
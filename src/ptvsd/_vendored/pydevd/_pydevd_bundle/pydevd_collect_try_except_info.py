@@ -189,3 +189,25 @@ def collect_try_except_info(co, use_func_first_line=False):
             del stack_in_setup[-1]
 
     return try_except_info_lst
+
+
+# id(code) -> (code, list(TryExceptInfo)) (the code is kept alive so that its id isn't reused).
+_code_id_to_try_except_info = {}
+_MAX_CACHED_TRY_EXCEPT_INFO = 1000
+
+
+def collect_try_except_info_cached(co):
+    '''
+    Same as `collect_try_except_info(co)`, but cached per code object (so, the bytecode of
+    a given function is only inspected once).
+    '''
+    try:
+        return _code_id_to_try_except_info[id(co)][1]
+    except KeyError:
+        pass
+
+    try_except_info_lst = collect_try_except_info(co)
+    if len(_code_id_to_try_except_info) >= _MAX_CACHED_TRY_EXCEPT_INFO:
+        _code_id_to_try_except_info.clear()
+    _code_id_to_try_except_info[id(co)] = (co, try_except_info_lst)
+    return try_except_info_lst
@@ -63,7 +63,6 @@ each command has a format:
     * PYDB - pydevd, the python end
 '''
 
-import itertools
 import linecache
 import os
 
@@ -73,14 +72,13 @@ from _pydev_imps._pydev_saved_modules import thread
 from _pydev_imps._pydev_saved_modules import threading
 from socket import AF_INET, SOCK_STREAM, SHUT_RD, SHUT_WR, SOL_SOCKET, SO_REUSEADDR, SHUT_RDWR
 from _pydevd_bundle.pydevd_constants import (DebugInfoHolder, get_thread_id, IS_JYTHON, IS_PY2,
-    IS_PY36_OR_GREATER, STATE_RUN, dict_keys, ASYNC_EVAL_TIMEOUT_SEC, GlobalDebuggerHolder,
+    IS_PY36_OR_GREATER, STATE_RUN, dict_keys, ASYNC_EVAL_TIMEOUT_SEC, DEFAULT_WATCH_EVALUATION_TIMEOUT, DEFAULT_MAX_REFERRERS, GlobalDebuggerHolder,
     get_global_debugger, GetGlobalDebugger, set_global_debugger)  # Keep for backward compatibility @UnusedImport
 from _pydev_bundle.pydev_override import overrides
 import weakref
 from _pydev_bundle._pydev_completer import extract_token_and_qualifier
-from _pydevd_bundle._debug_adapter.pydevd_schema import VariablesResponseBody, \
-    SetVariableResponseBody
-from _pydevd_bundle._debug_adapter import pydevd_base_schema, pydevd_schema
+from _pydevd_bundle._debug_adapter import pydevd_base_schema
+from _pydevd_bundle.pydevd_code_lines import get_code_line_table
 from _pydevd_bundle.pydevd_net_command import NetCommand
 from _pydevd_bundle.pydevd_xml import ExceptionOnEvaluate
 try:
@@ -540,6 +538,7 @@ def internal_reload_code(dbg, seq, module_name):
                 module_name = new_module_name
 
     reloaded_ok = False
+    reload_info = None
 
     if module_name not in sys.modules:
         sys.stderr.write('pydev debugger: Unable to find module to reload: "' + module_name + '".\n')
@@ -549,13 +548,16 @@ def internal_reload_code(dbg, seq, module_name):
     else:
         sys.stderr.write('pydev debugger: Start reloading module: "' + module_name + '" ... \n')
         from _pydevd_bundle import pydevd_reload
-        if pydevd_reload.xreload(sys.modules[module_name]):
-            sys.stderr.write('pydev debugger: reload finished\n')
+        reload_info = pydevd_reload.xreload_module(sys.modules[module_name])
+        stats = '%s of %s functions changed in %.3fs' % (
+            reload_info.functions_changed, reload_info.functions_checked, reload_info.elapsed)
+        if reload_info.found_change:
+            sys.stderr.write('pydev debugger: reload finished (%s)\n' % (stats,))
             reloaded_ok = True
         else:
-            sys.stderr.write('pydev debugger: reload finished without applying any change\n')
+            sys.stderr.write('pydev debugger: reload finished without applying any change (%s)\n' % (stats,))
 
-    cmd = dbg.cmd_factory.make_reloaded_code_message(seq, reloaded_ok)
+    cmd = dbg.cmd_factory.make_reloaded_code_message(seq, reloaded_ok, reload_info)
     dbg.writer.add_command(cmd)
 
 
@@ -660,6 +662,7 @@ def internal_get_variable_json(py_db, request):
     '''
         :param VariablesRequest request:
     '''
+    from _pydevd_bundle._debug_adapter import pydevd_schema
     arguments = request.arguments  # : :type arguments: VariablesArguments
     variables_reference = arguments.variablesReference
     fmt = arguments.format
@@ -675,7 +678,7 @@ def internal_get_variable_json(py_db, request):
         for child_var in variable.get_children_variables(fmt=fmt):
             variables.append(child_var.get_var_data(fmt=fmt))
 
-    body = VariablesResponseBody(variables)
+    body = pydevd_schema.VariablesResponseBody(variables)
     variables_response = pydevd_base_schema.build_response(request, kwargs={'body':body})
     py_db.writer.add_command(NetCommand(CMD_RETURN, 0, variables_response, is_json=True))
 
@@ -774,6 +777,7 @@ def internal_change_variable_json(py_db, request):
 
     :param SetVariableRequest request:
     '''
+    from _pydevd_bundle._debug_adapter import pydevd_schema
     # : :type arguments: SetVariableArguments
     arguments = request.arguments
     variables_reference = arguments.variablesReference
@@ -799,7 +803,7 @@ def internal_change_variable_json(py_db, request):
         return
 
     var_data = child_var.get_var_data(fmt=fmt)
-    body = SetVariableResponseBody(
+    body = pydevd_schema.SetVariableResponseBody(
         value=var_data['value'],
         type=var_data['type'],
         variablesReference=var_data.get('variablesReference'),
@@ -811,7 +815,8 @@ def internal_change_variable_json(py_db, request):
 
 
 def _write_variable_response(py_db, request, value, success, message):
-    body = SetVariableResponseBody('')
+    from _pydevd_bundle._debug_adapter import pydevd_schema
+    body = pydevd_schema.SetVariableResponseBody('')
     variables_response = pydevd_base_schema.build_response(
         request,
         kwargs={
@@ -850,17 +855,10 @@ def internal_get_next_statement_targets(dbg, seq, thread_id, frame_id):
     try:
         frame = dbg.find_frame(thread_id, frame_id)
         if frame is not None:
-            code = frame.f_code
             xml = "<xml>"
-            if hasattr(code, 'co_lnotab'):
-                lineno = code.co_firstlineno
-                lnotab = code.co_lnotab
-                for i in itertools.islice(lnotab, 1, len(lnotab), 2):
-                    if isinstance(i, int):
-                        lineno = lineno + i
-                    else:
-                        # in python 2 elements in co_lnotab are of type str
-                        lineno = lineno + ord(i)
+            line_table = get_code_line_table(frame.f_code)
+            if line_table is not None:
+                for lineno in line_table.get_jump_targets(frame.f_lasti):
                     xml += "<line>%d</line>" % (lineno,)
             else:
                 xml += "<line>%d</line>" % (frame.f_lineno,)
@@ -877,6 +875,7 @@ def internal_get_next_statement_targets(dbg, seq, thread_id, frame_id):
 
 
 def _evaluate_response(py_db, request, result, error_message=''):
+    from _pydevd_bundle._debug_adapter import pydevd_schema
     is_error = isinstance(result, ExceptionOnEvaluate)
     if is_error:
         result = result.result
@@ -895,6 +894,7 @@ def internal_evaluate_expression_json(py_db, request, thread_id):
     '''
     :param EvaluateRequest request:
     '''
+    from _pydevd_bundle._debug_adapter import pydevd_schema
     # : :type arguments: EvaluateArguments
 
     arguments = request.arguments
@@ -957,6 +957,171 @@ def internal_evaluate_expression_json(py_db, request, thread_id):
     py_db.writer.add_command(NetCommand(CMD_RETURN, 0, variables_response, is_json=True))
 
 
+def _evaluate_watch(py_db, frame_tracker, thread_id, frame_id, expression, fmt, watchdog):
+    '''
+    :return dict:
+        The PydevdWatchResult (as a dict) with the result of evaluating the given expression.
+    '''
+    from _pydevd_bundle._debug_adapter import pydevd_schema
+    from _pydevd_bundle.pydevd_timeout import EvaluationTimeoutError
+
+    def error_result(error_message):
+        return pydevd_schema.PydevdWatchResult(
+            expression=expression, result=error_message, variablesReference=0, error=error_message).to_dict()
+
+    if IS_PY2 and isinstance(expression, unicode):
+        try:
+            expression = expression.encode('utf-8')
+        except:
+            return error_result('Expression is not valid utf-8.')
+
+    if frame_tracker is None:
+        # This is not really expected.
+        return error_result('Thread id: %s is not current thread id.' % (thread_id,))
+
+    frame = py_db.find_frame(thread_id, frame_id) if frame_id is not None else None
+    if frame is None:
+        return error_result('Unable to find frame: %s in thread: %s.' % (frame_id, thread_id))
+
+    try:
+        if watchdog is not None:
+            watchdog.start_budget()
+        try:
+            result = pydevd_vars.evaluate_expression(py_db, frame, expression, is_exec=False)
+        finally:
+            if watchdog is not None:
+                watchdog.stop_budget()
+    except EvaluationTimeoutError:
+        return error_result('Evaluation timed out (time budget: %ss).' % (watchdog.timeout,))
+
+    error = None
+    if isinstance(result, ExceptionOnEvaluate):
+        exc = result.result
+        if isinstance(exc, BaseException):
+            error = ''.join(traceback.format_exception_only(type(exc), exc)).strip()
+        else:
+            error = str(exc)
+
+    variable = frame_tracker.obtain_as_variable(expression, result, frame=frame)
+    var_data = variable.get_var_data(fmt=fmt)
+    return pydevd_schema.PydevdWatchResult(
+        expression=expression,
+        result=var_data['value'],
+        error=error,
+        variablesReference=var_data.get('variablesReference', 0),
+        type=var_data.get('type'),
+        presentationHint=var_data.get('presentationHint'),
+        namedVariables=var_data.get('namedVariables'),
+        indexedVariables=var_data.get('indexedVariables'),
+    ).to_dict()
+
+
+def internal_evaluate_watches_json(py_db, request, thread_id):
+    '''
+    Evaluates all the expressions of the request in the suspended thread and sends the results
+    in a single response (each evaluation has its own time budget).
+
+    :param PydevdEvaluateWatchesRequest request:
+    '''
+    from _pydevd_bundle._debug_adapter import pydevd_schema
+    from _pydevd_bundle.pydevd_timeout import EvaluationWatchdog, can_interrupt_evaluations
+    # : :type arguments: PydevdEvaluateWatchesArguments
+
+    arguments = request.arguments
+    fmt = arguments.format
+    if hasattr(fmt, 'to_dict'):
+        fmt = fmt.to_dict()
+    timeout = arguments.timeout
+    if timeout is None:
+        timeout = DEFAULT_WATCH_EVALUATION_TIMEOUT
+
+    frame_tracker = py_db.suspended_frames_manager.get_frame_tracker(thread_id)
+
+    watchdog = None
+    if timeout > 0 and can_interrupt_evaluations():
+        watchdog = EvaluationWatchdog(timeout)
+        watchdog.start()
+
+    results = []
+    try:
+        for watch in arguments.expressions:
+            frame_id = watch.get('frameId')
+            if frame_id is None:
+                frame_id = arguments.frameId
+            results.append(_evaluate_watch(
+                py_db, frame_tracker, thread_id, frame_id, watch.get('expression', ''), fmt, watchdog))
+    finally:
+        if watchdog is not None:
+            watchdog.finish()
+
+    body = pydevd_schema.PydevdEvaluateWatchesResponseBody(results=results)
+    response = pydevd_base_schema.build_response(request, kwargs={'body': body})
+    py_db.writer.add_command(NetCommand(CMD_RETURN, 0, response, is_json=True))
+
+
+def internal_get_referrers_json(py_db, request, thread_id):
+    '''
+    Answers a referrers query using the heap snapshot of the suspended thread (taken in the
+    first query and released when the thread is resumed).
+
+    :param PydevdGetReferrersRequest request:
+    '''
+    from _pydevd_bundle._debug_adapter import pydevd_schema
+    from _pydevd_bundle.pydevd_memory_inspector import HeapSnapshot
+    from _pydevd_bundle.pydevd_safe_repr import SafeRepr
+    # : :type arguments: PydevdGetReferrersArguments
+    arguments = request.arguments
+    max_results = arguments.maxResults if arguments.maxResults is not None else DEFAULT_MAX_REFERRERS
+
+    frame_tracker = py_db.suspended_frames_manager.get_frame_tracker(thread_id)
+    try:
+        variable = py_db.suspended_frames_manager.get_variable(arguments.variablesReference)
+    except KeyError:
+        variable = None
+
+    if frame_tracker is None or variable is None:
+        body = pydevd_schema.PydevdGetReferrersResponseBody(referrers=[], objects=0, references=0)
+        response = pydevd_base_schema.build_response(request, kwargs={
+            'body': body,
+            'success': False,
+            'message': 'Unable to find variable reference: %s' % (arguments.variablesReference,),
+        })
+        py_db.writer.add_command(NetCommand(CMD_RETURN, 0, response, is_json=True))
+        return
+
+    if frame_tracker.heap_snapshot is None or arguments.refresh:
+        frame_tracker.heap_snapshot = None  # Release the previous one before taking a new one.
+        frame_tracker.heap_snapshot = HeapSnapshot()
+    heap_snapshot = frame_tracker.heap_snapshot
+
+    obj = variable.get_value()
+    if arguments.pathToRoot:
+        found = heap_snapshot.get_path_to_root(obj)
+    else:
+        found = heap_snapshot.get_referrers(obj, max_results)
+    obj = None
+
+    safe_repr = SafeRepr()
+    referrers = []
+    for referrer, found_as in found:
+        referrer_variable = frame_tracker.obtain_as_variable(found_as, referrer)
+        referrers.append(pydevd_schema.PydevdReferrer(
+            name=found_as,
+            value=safe_repr(referrer),
+            type=type(referrer).__name__,
+            variablesReference=referrer_variable.get_variable_reference(),
+        ).to_dict())
+    found = referrer = None
+
+    body = pydevd_schema.PydevdGetReferrersResponseBody(
+        referrers=referrers,
+        objects=heap_snapshot.objects_count,
+        references=heap_snapshot.references_count,
+    )
+    response = pydevd_base_schema.build_response(request, kwargs={'body': body})
+    py_db.writer.add_command(NetCommand(CMD_RETURN, 0, response, is_json=True))
+
+
 def internal_evaluate_expression(dbg, seq, thread_id, frame_id, expression, is_exec, trim_if_too_big, attr_to_set_result):
     ''' gets the value of a variable '''
     try:
@@ -980,6 +1145,7 @@ def internal_evaluate_expression(dbg, seq, thread_id, frame_id, expression, is_e
 
 
 def _set_expression_response(py_db, request, result, error_message):
+    from _pydevd_bundle._debug_adapter import pydevd_schema
     body = pydevd_schema.SetExpressionResponseBody(result='', variablesReference=0)
     variables_response = pydevd_base_schema.build_response(request, kwargs={
         'body':body, 'success':False, 'message': error_message})
@@ -987,6 +1153,7 @@ def _set_expression_response(py_db, request, result, error_message):
 
 
 def internal_set_expression_json(py_db, request, thread_id):
+    from _pydevd_bundle._debug_adapter import pydevd_schema
     # : :type arguments: SetExpressionArguments
 
     arguments = request.arguments
@@ -1067,7 +1234,13 @@ def internal_get_completions(dbg, seq, thread_id, frame_id, act_tok, line=-1, co
                     if not isinstance(qualifier, bytes):
                         qualifier = qualifier.encode('utf-8')
 
-                completions = _pydev_completer.generate_completions(frame, act_tok)
+                completions_cache = None
+                frames_tracker = dbg.suspended_frames_manager.get_frame_tracker(thread_id)
+                if frames_tracker is not None:
+                    completions_cache = frames_tracker.completions_cache
+
+                # Note: the qualifier is passed so that only the matching completions are computed.
+                completions = _pydev_completer.generate_completions(frame, act_tok + qualifier, completions_cache)
 
                 # Note that qualifier and start are only actually valid for the
                 # Debug Adapter Protocol (for the line-based protocol, the IDE
@@ -1090,12 +1263,21 @@ def internal_get_completions(dbg, seq, thread_id, frame_id, act_tok, line=-1, co
         dbg.writer.add_command(cmd)
 
 
+def _get_console_cache(dbg, thread_id):
+    # The debug consoles are kept while the thread is suspended (see: pydevd_console.get_interactive_console).
+    frames_tracker = dbg.suspended_frames_manager.get_frame_tracker(thread_id)
+    if frames_tracker is not None:
+        return frames_tracker.console_cache
+    return None
+
+
 def internal_get_description(dbg, seq, thread_id, frame_id, expression):
     ''' Fetch the variable description stub from the debug console
     '''
     try:
         frame = dbg.find_frame(thread_id, frame_id)
-        description = pydevd_console.get_description(frame, thread_id, frame_id, expression)
+        description = pydevd_console.get_description(
+            frame, thread_id, frame_id, expression, _get_console_cache(dbg, thread_id))
         description = pydevd_xml.make_valid_xml_value(quote(description, '/>_= \t'))
         description_xml = '<xml><var name="" type="" value="%s"/></xml>' % description
         cmd = dbg.cmd_factory.make_get_description_message(seq, description_xml)
@@ -1110,6 +1292,7 @@ def build_exception_info_response(dbg, thread_id, request_seq, set_additional_th
     '''
     :return ExceptionInfoResponse
     '''
+    from _pydevd_bundle._debug_adapter import pydevd_schema
     thread = pydevd_find_thread_by_id(thread_id)
     additional_info = set_additional_thread_info(thread)
     topmost_frame = additional_info.get_topmost_frame(thread)
@@ -1314,8 +1497,10 @@ class InternalEvaluateConsoleExpression(InternalThreadCommand):
         try:
             frame = dbg.find_frame(self.thread_id, self.frame_id)
             if frame is not None:
+                dbg.suspended_frames_manager.clear_completions_caches()
                 console_message = pydevd_console.execute_console_command(
-                    frame, self.thread_id, self.frame_id, self.line, self.buffer_output)
+                    frame, self.thread_id, self.frame_id, self.line, self.buffer_output,
+                    _get_console_cache(dbg, self.thread_id))
 
                 cmd = dbg.cmd_factory.make_send_console_message(self.sequence, console_message.to_xml())
             else:
@@ -5,7 +5,7 @@ import traceback
 from code import InteractiveConsole
 
 from _pydev_bundle import _pydev_completer
-from _pydev_bundle.pydev_console_utils import BaseInterpreterInterface, BaseStdIn
+from _pydev_bundle.pydev_console_utils import BaseInterpreterInterface, BaseStdIn, compile_command_cached
 from _pydev_bundle.pydev_imports import Exec
 from _pydev_bundle.pydev_override import overrides
 from _pydevd_bundle import pydevd_save_locals
@@ -138,6 +138,25 @@ class DebugConsole(InteractiveConsole, BaseInterpreterInterface):
     def do_add_exec(self, line):
         return InteractiveConsole.push(self, line)
 
+    @overrides(InteractiveConsole.runsource)
+    def runsource(self, source, filename="<input>", symbol="single"):
+        # Same as InteractiveConsole.runsource, but reusing the code if the source was
+        # compiled before.
+        try:
+            code = compile_command_cached(self.compile, source, filename, symbol)
+        except (OverflowError, SyntaxError, ValueError):
+            # Case 1
+            self.showsyntaxerror(filename)
+            return False
+
+        if code is None:
+            # Case 2
+            return True
+
+        # Case 3
+        self.runcode(code)
+        return False
+
 
     @overrides(InteractiveConsole.runcode)
     def runcode(self, code):
@@ -153,8 +172,11 @@ class DebugConsole(InteractiveConsole, BaseInterpreterInterface):
 
         """
         try:
-            Exec(code, self.frame.f_globals, self.frame.f_locals)
-            pydevd_save_locals.save_locals(self.frame)
+            frame = self.frame
+            f_locals = frame.f_locals
+            locals_snapshot = pydevd_save_locals.take_locals_snapshot(frame, f_locals)
+            Exec(code, frame.f_globals, f_locals)
+            pydevd_save_locals.save_locals_if_changed(frame, f_locals, locals_snapshot)
         except SystemExit:
             raise
         except:
@@ -183,24 +205,42 @@ class InteractiveConsoleCache:
     interactive_console_instance = None
 
 
+def _create_interactive_console(frame, console_message):
+    interactive_console = DebugConsole()
+
+    console_stacktrace = traceback.extract_stack(frame, limit=1)
+    if console_stacktrace:
+        current_context = console_stacktrace[0] # top entry from stacktrace
+        context_message = 'File "%s", line %s, in %s' % (current_context[0], current_context[1], current_context[2])
+        console_message.add_console_message(CONSOLE_OUTPUT, "[Current context]: %s" % (context_message,))
+    return interactive_console
+
+
 #Note: On Jython 2.1 we can't use classmethod or staticmethod, so, just make the functions below free-functions.
-def get_interactive_console(thread_id, frame_id, frame, console_message):
+def get_interactive_console(thread_id, frame_id, frame, console_message, console_cache=None):
     """returns the global interactive console.
     interactive console should have been initialized by this time
+
+    :param dict console_cache:
+        If given, the console is kept in it (keyed by thread and frame id) instead of in the
+        global InteractiveConsoleCache (the frames tracker of a suspended thread provides one
+        which is cleared when the thread is resumed).
+
     :rtype: DebugConsole
     """
+    if console_cache is not None:
+        key = (thread_id, frame_id)
+        interactive_console = console_cache.get(key)
+        if interactive_console is None:
+            interactive_console = console_cache[key] = _create_interactive_console(frame, console_message)
+        return interactive_console
+
     if InteractiveConsoleCache.thread_id == thread_id and InteractiveConsoleCache.frame_id == frame_id:
         return InteractiveConsoleCache.interactive_console_instance
 
-    InteractiveConsoleCache.interactive_console_instance = DebugConsole()
+    InteractiveConsoleCache.interactive_console_instance = _create_interactive_console(frame, console_message)
     InteractiveConsoleCache.thread_id = thread_id
     InteractiveConsoleCache.frame_id = frame_id
-
-    console_stacktrace = traceback.extract_stack(frame, limit=1)
-    if console_stacktrace:
-        current_context = console_stacktrace[0] # top entry from stacktrace
-        context_message = 'File "%s", line %s, in %s' % (current_context[0], current_context[1], current_context[2])
-        console_message.add_console_message(CONSOLE_OUTPUT, "[Current context]: %s" % (context_message,))
     return InteractiveConsoleCache.interactive_console_instance
 
 
@@ -210,7 +250,7 @@ def clear_interactive_console():
     InteractiveConsoleCache.interactive_console_instance = None
 
 
-def execute_console_command(frame, thread_id, frame_id, line, buffer_output=True):
+def execute_console_command(frame, thread_id, frame_id, line, buffer_output=True, console_cache=None):
     """fetch an interactive console instance from the cache and
     push the received command to the console.
 
@@ -218,7 +258,7 @@ def execute_console_command(frame, thread_id, frame_id, line, buffer_output=True
     """
     console_message = ConsoleMessage()
 
-    interpreter = get_interactive_console(thread_id, frame_id, frame, console_message)
+    interpreter = get_interactive_console(thread_id, frame_id, frame, console_message, console_cache)
     more, output_messages, error_messages = interpreter.push(line, frame, buffer_output)
     console_message.update_more(more)
 
@@ -231,9 +271,9 @@ def execute_console_command(frame, thread_id, frame_id, line, buffer_output=True
     return console_message
 
 
-def get_description(frame, thread_id, frame_id, expression):
+def get_description(frame, thread_id, frame_id, expression, console_cache=None):
     console_message = ConsoleMessage()
-    interpreter = get_interactive_console(thread_id, frame_id, frame, console_message)
+    interpreter = get_interactive_console(thread_id, frame_id, frame, console_message, console_cache)
     try:
         interpreter.frame = frame
         return interpreter.getDescription(expression)
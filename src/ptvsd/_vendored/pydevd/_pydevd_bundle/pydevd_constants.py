@@ -151,8 +151,32 @@ INTERACTIVE_MODE_AVAILABLE = sys.platform in ('darwin', 'win32') or os.getenv('D
 SHOW_COMPILE_CYTHON_COMMAND_LINE = os.getenv('PYDEVD_SHOW_COMPILE_CYTHON_COMMAND_LINE', 'False') == 'True'
 
 LOAD_VALUES_ASYNC = os.getenv('PYDEVD_LOAD_VALUES_ASYNC', 'False') == 'True'
+
+# If True, no tracing is set while only unhandled exceptions may stop the debugger (those are
+# reported through sys.excepthook/threading.excepthook), so, the debugged program runs at full
+# speed until a breakpoint is added or a pause/step is requested.
+DEFER_TRACING = os.getenv('PYDEVD_DEFER_TRACING', 'False') == 'True'
+
+# When collecting signatures ('save-signatures' option), sample the calls of each function
+# (at most once every N calls and/or once every N seconds) and send the aggregated types in
+# batches instead of sending a message for each call (0 means that the given criteria is not used).
+SIGNATURES_SAMPLE_CALLS = int(os.getenv('PYDEVD_SIGNATURES_SAMPLE_CALLS', '0'))
+SIGNATURES_SAMPLE_INTERVAL = float(os.getenv('PYDEVD_SIGNATURES_SAMPLE_INTERVAL', '0'))
+
+# The maximum number of entries kept in each of the caches used to normalize/translate paths
+# (see: pydevd_file_utils.PathCache).
+PATH_CACHE_SIZE = int(os.getenv('PYDEVD_PATH_CACHE_SIZE', '10000'))
+
+# The maximum number of characters kept in the cache of the sources sent to the client
+# (see: pydevd_source_cache).
+SOURCE_CACHE_MAX_SIZE = int(os.getenv('PYDEVD_SOURCE_CACHE_MAX_SIZE', str(32 * 1024 * 1024)))
+
 DEFAULT_VALUE = "__pydevd_value_async"
 ASYNC_EVAL_TIMEOUT_SEC = 60
+# Default time budget (in seconds) for each expression in a batched evaluation of watches.
+DEFAULT_WATCH_EVALUATION_TIMEOUT = 1.
+# Default maximum number of referrers returned in a 'pydevdGetReferrers' request.
+DEFAULT_MAX_REFERRERS = 100
 NEXT_VALUE_SEPARATOR = "__pydev_val__"
 BUILTINS_MODULE_NAME = '__builtin__' if IS_PY2 else 'builtins'
 SHOW_DEBUG_INFO_ENV = os.getenv('PYCHARM_DEBUG') == 'True' or os.getenv('PYDEV_DEBUG') == 'True' or os.getenv('PYDEVD_DEBUG') == 'True'
@@ -298,26 +298,17 @@ cdef class PyDBFrame:
                     pydev_log.exception()
 
                 if not should_stop:
-                    # It was not handled by any plugin, lets check exception breakpoints.
-                    exception_breakpoint = main_debugger.get_exception_breakpoint(
-                        exception, main_debugger.break_on_caught_exceptions)
+                    # It was not handled by any plugin, lets check exception breakpoints (the
+                    # breakpoint for a given exception type is cached until breakpoints change).
+                    exception_breakpoint = main_debugger.get_caught_exception_breakpoint(exception)
 
                     if exception_breakpoint is not None:
                         if exception is SystemExit and main_debugger.ignore_system_exit_code(value):
                             return False, frame
 
-                        if exception_breakpoint.condition is not None:
-                            eval_result = main_debugger.handle_breakpoint_condition(info, exception_breakpoint, frame)
-                            if not eval_result:
-                                return False, frame
-
-                        if main_debugger.exclude_exception_by_filter(exception_breakpoint, trace, False):
-                            pydev_log.debug("Ignore exception %s in library %s -- (%s)" % (exception, frame.f_code.co_filename, frame.f_code.co_name))
-                            return False, frame
-
-                        if ignore_exception_trace(trace):
-                            return False, frame
-
+                        # Note: the checks which only look at the traceback come first as they're
+                        # much cheaper than the filters and the condition (and reject most of the
+                        # frames an exception goes through).
                         was_just_raised = just_raised(trace)
                         if was_just_raised:
 
@@ -336,6 +327,18 @@ cdef class PyDBFrame:
                                 if not was_just_raised:
                                     return False, frame  # I.e.: we stop only when it was just raised
 
+                        if ignore_exception_trace(trace):
+                            return False, frame
+
+                        if main_debugger.exclude_exception_by_filter(exception_breakpoint, trace, False):
+                            pydev_log.debug("Ignore exception %s in library %s -- (%s)" % (exception, frame.f_code.co_filename, frame.f_code.co_name))
+                            return False, frame
+
+                        if exception_breakpoint.condition is not None:
+                            eval_result = main_debugger.handle_breakpoint_condition(info, exception_breakpoint, frame)
+                            if not eval_result:
+                                return False, frame
+
                         # If it got here we should stop.
                         should_stop = True
                         try:
@@ -1285,6 +1288,9 @@ cdef class ThreadTracer:
         cdef bint is_stepping;
         cdef tuple abs_path_real_path_and_base;
         cdef PyDBAdditionalThreadInfo additional_info;
+        cdef dict user_code_index;
+        cdef int is_user_code;
+        cdef int back_is_user_code;
         # ENDIF
 
         # DEBUG = 'code_to_debug' in frame.f_code.co_filename
@@ -1316,6 +1322,30 @@ cdef class ThreadTracer:
             if py_db.asyncio_analyser is not None:
                 py_db.asyncio_analyser.log_event(frame)
 
+            if pydev_step_cmd == 144:
+                # Fast path: library code called from library code is skipped with just a lookup
+                # in the user code index (which is per file, keyed by the normalized real path).
+                user_code_index = py_db.user_code_index
+                try:
+                    is_user_code = user_code_index[NORM_PATHS_AND_BASE_CONTAINER[frame.f_code.co_filename][1]]
+                except KeyError:
+                    is_user_code = py_db.index_user_code(frame)
+
+                if not is_user_code:
+                    back_frame = frame.f_back
+                    if back_frame is None:
+                        back_is_user_code = 0
+                    else:
+                        try:
+                            back_is_user_code = user_code_index[NORM_PATHS_AND_BASE_CONTAINER[back_frame.f_code.co_filename][1]]
+                        except KeyError:
+                            back_is_user_code = py_db.index_user_code(back_frame)
+
+                    if not back_is_user_code:
+                        if not _global_notify_skipped_step_in:
+                            notify_skipped_step_in_because_of_filters(py_db, frame)
+                        return None if event == 'call' else NO_FTRACE
+
             # Note: it's important that the context name is also given because we may hit something once
             # in the global context and another in the local context.
             frame_cache_key = (frame.f_code.co_firstlineno, frame.f_code.co_name, frame.f_code.co_filename)
@@ -66,10 +66,12 @@ DONT_TRACE = {
     'pydevd_api.py': PYDEV_FILE,
     'pydevd_base_schema.py': PYDEV_FILE,
     'pydevd_breakpoints.py': PYDEV_FILE,
+    'pydevd_code_lines.py': PYDEV_FILE,
     'pydevd_collect_try_except_info.py': PYDEV_FILE,
     'pydevd_comm.py': PYDEV_FILE,
     'pydevd_comm_constants.py': PYDEV_FILE,
     'pydevd_command_line_handling.py': PYDEV_FILE,
+    'pydevd_concurrency_events.py': PYDEV_FILE,
     'pydevd_concurrency_logger.py': PYDEV_FILE,
     'pydevd_console.py': PYDEV_FILE,
     'pydevd_constants.py': PYDEV_FILE,
@@ -78,6 +80,7 @@ DONT_TRACE = {
     'pydevd_defaults.py': PYDEV_FILE,
     'pydevd_dont_trace.py': PYDEV_FILE,
     'pydevd_dont_trace_files.py': PYDEV_FILE,
+    'pydevd_excepthooks.py': PYDEV_FILE,
     'pydevd_exec.py': PYDEV_FILE,
     'pydevd_exec2.py': PYDEV_FILE,
     'pydevd_extension_api.py': PYDEV_FILE,
@@ -94,6 +97,7 @@ DONT_TRACE = {
     'pydevd_io.py': PYDEV_FILE,
     'pydevd_json_debug_options.py': PYDEV_FILE,
     'pydevd_kill_all_pydevd_threads.py': PYDEV_FILE,
+    'pydevd_memory_inspector.py': PYDEV_FILE,
     'pydevd_modify_bytecode.py': PYDEV_FILE,
     'pydevd_net_command.py': PYDEV_FILE,
     'pydevd_net_command_factory_json.py': PYDEV_FILE,
@@ -107,13 +111,17 @@ DONT_TRACE = {
     'pydevd_reload.py': PYDEV_FILE,
     'pydevd_resolver.py': PYDEV_FILE,
     'pydevd_safe_repr.py': PYDEV_FILE,
+    'pydevd_sampling_profiler.py': PYDEV_FILE,
     'pydevd_save_locals.py': PYDEV_FILE,
     'pydevd_schema.py': PYDEV_FILE,
     'pydevd_schema_log.py': PYDEV_FILE,
     'pydevd_signature.py': PYDEV_FILE,
+    'pydevd_source_cache.py': PYDEV_FILE,
     'pydevd_stackless.py': PYDEV_FILE,
+    'pydevd_step_over.py': PYDEV_FILE,
     'pydevd_suspended_frames.py': PYDEV_FILE,
     'pydevd_thread_wrappers.py': PYDEV_FILE,
+    'pydevd_timeout.py': PYDEV_FILE,
     'pydevd_trace_api.py': PYDEV_FILE,
     'pydevd_trace_dispatch.py': PYDEV_FILE,
     'pydevd_trace_dispatch_regular.py': PYDEV_FILE,
@@ -0,0 +1,99 @@
+'''
+Hooks used to stop on unhandled exceptions while the tracing is deferred (see:
+`pydevd_constants.DEFER_TRACING`), in which case the top-level tracers which usually
+report unhandled exceptions aren't in place.
+
+The frames are still available from the traceback (post-mortem), so, the stack can still
+be inspected when suspended.
+'''
+import sys
+
+from _pydev_bundle import pydev_log
+from _pydev_imps._pydev_saved_modules import threading
+from _pydevd_bundle.pydevd_additional_thread_info import set_additional_thread_info
+from _pydevd_bundle.pydevd_constants import get_global_debugger
+
+_original_excepthook = None
+_original_threading_excepthook = None
+
+
+def _stop_on_unhandled_exception(thread, exc_info):
+    py_db = get_global_debugger()
+    if py_db is None or thread is None:
+        return
+
+    if getattr(thread, 'is_pydev_daemon_thread', False) or getattr(thread, 'pydev_do_not_trace', False):
+        return
+
+    try:
+        additional_info = set_additional_thread_info(thread)
+        if additional_info.suspended_at_unhandled:
+            return  # Already reported by the tracing.
+
+        additional_info.suspended_at_unhandled = True
+        py_db.stop_on_unhandled_exception(py_db, thread, additional_info, exc_info)
+    except:
+        pydev_log.exception('Error stopping at unhandled exception: %s', exc_info[0])
+
+
+def _excepthook(exctype, value, tb):
+    _stop_on_unhandled_exception(threading.current_thread(), (exctype, value, tb))
+    _original_excepthook(exctype, value, tb)
+
+
+def _threading_excepthook(args):
+    if args.exc_type is not SystemExit:  # SystemExit in a thread just finishes it.
+        _stop_on_unhandled_exception(args.thread, (args.exc_type, args.exc_value, args.exc_traceback))
+    _original_threading_excepthook(args)
+
+
+def install_excepthooks():
+    global _original_excepthook
+    global _original_threading_excepthook
+
+    if _original_excepthook is not None:
+        return  # Already installed.
+
+    _original_excepthook = sys.excepthook
+    sys.excepthook = _excepthook
+
+    if hasattr(threading, 'excepthook'):  # Python 3.8 onwards.
+        _original_threading_excepthook = threading.excepthook
+        threading.excepthook = _threading_excepthook
+
+
+def uninstall_excepthooks():
+    global _original_excepthook
+    global _original_threading_excepthook
+
+    if _original_excepthook is not None:
+        if sys.excepthook is _excepthook:
+            sys.excepthook = _original_excepthook
+        _original_excepthook = None
+
+    if _original_threading_excepthook is not None:
+        if threading.excepthook is _threading_excepthook:
+            threading.excepthook = _original_threading_excepthook
+        _original_threading_excepthook = None
+
+
+def wrap_thread_run(thread):
+    '''
+    Before Python 3.8 there's no `threading.excepthook` (unhandled exceptions are printed by
+    `threading.Thread` itself), so, `Thread.run` must be wrapped to see those.
+    '''
+    if hasattr(threading, 'excepthook') or not isinstance(thread, threading.Thread):
+        return
+
+    original_run = thread.run
+
+    def run(*args, **kwargs):
+        try:
+            return original_run(*args, **kwargs)
+        except SystemExit:
+            raise
+        except:
+            _stop_on_unhandled_exception(thread, sys.exc_info())
+            raise
+
+    thread.run = run
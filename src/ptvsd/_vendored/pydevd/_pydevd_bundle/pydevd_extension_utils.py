@@ -1,11 +1,6 @@
 import pkgutil
 import sys
 from _pydev_bundle import pydev_log
-try:
-    import pydevd_plugins.extensions as extensions
-except:
-    pydev_log.exception()
-    extensions = None
 
 
 class ExtensionManager(object):
@@ -16,6 +11,12 @@ class ExtensionManager(object):
 
     def _load_modules(self):
         self.loaded_extensions = []
+        try:
+            import pydevd_plugins.extensions as extensions
+        except:
+            pydev_log.exception()
+            extensions = None
+
         if extensions:
             for module_loader, name, ispkg in pkgutil.walk_packages(extensions.__path__,
                                                                     extensions.__name__ + '.'):
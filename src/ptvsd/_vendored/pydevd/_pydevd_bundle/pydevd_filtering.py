@@ -1,6 +1,6 @@
-import fnmatch
 import glob
 import os.path
+import re
 import sys
 
 from _pydev_bundle import pydev_log
@@ -9,13 +9,11 @@ import json
 from collections import namedtuple
 from _pydev_imps._pydev_saved_modules import threading
 
-try:
-    xrange  # noqa
-except NameError:
-    xrange = range  # noqa
-
 ExcludeFilter = namedtuple('ExcludeFilter', 'name, exclude, is_path')
 
+# Environment variable used to share the default library roots with subprocesses.
+DEFAULT_LIBRARY_ROOTS_ENV = 'PYDEVD_DEFAULT_LIBRARY_ROOTS'
+
 
 def _convert_to_str_and_clear_empty(roots):
     if sys.version_info[0] <= 2:
@@ -33,64 +31,270 @@ def _convert_to_str_and_clear_empty(roots):
     return new_roots
 
 
-def _check_matches(patterns, paths):
-    if not patterns and not paths:
-        # Matched to the end.
-        return True
+# Python 2 doesn't support more than 100 groups in a regular expression.
+_MAX_GROUPS_IN_REGEXP = 90
+
+# fnmatch is case-insensitive if the platform is (note: literal path parts are
+# always compared with case).
+_IGNORE_CASE = os.path.normcase('A') != 'A'
 
-    if (not patterns and paths) or (patterns and not paths):
-        return False
 
-    pattern = patterns[0]
-    path = paths[0]
+def _translate_glob_part(part, sep, ignore_case=_IGNORE_CASE):
+    '''
+    Translates a part of a glob pattern (i.e.: what's between path separators) to a regexp
+    which matches the same as `fnmatch.fnmatch` without ever matching the separator.
+    '''
+    esep = re.escape(sep)
+    i, n = 0, len(part)
+    res = []
+    while i < n:
+        c = part[i]
+        i += 1
+        if c == '*':
+            res.append('[^%s]*' % (esep,))
+
+        elif c == '?':
+            res.append('[^%s]' % (esep,))
+
+        elif c == '[':
+            j = i
+            if j < n and part[j] == '!':
+                j += 1
+            if j < n and part[j] == ']':
+                j += 1
+            while j < n and part[j] != ']':
+                j += 1
+            if j >= n:
+                res.append('\\[')
+                continue
+
+            stuff = part[i:j].replace('\\', '\\\\')
+            i = j + 1
+            negate = stuff[0] == '!'
+            if negate:
+                stuff = stuff[1:]
+            elif stuff[0] == '^':
+                stuff = '\\' + stuff
+
+            if ignore_case:
+                cls = '(?:[%s]|[%s])' % (stuff.lower(), stuff.upper())
+            else:
+                cls = '[%s]' % (stuff,)
 
-    if not glob.has_magic(pattern):
+            if negate:
+                res.append('(?!%s)[^%s]' % (cls, esep))
+            else:
+                res.append('(?!%s)%s' % (esep, cls))
 
-        if pattern != path:
-            return False
+        elif ignore_case and c.lower() != c.upper():
+            res.append('[%s%s]' % (re.escape(c.lower()), re.escape(c.upper())))
 
-    elif pattern == '**':
-        if len(patterns) == 1:
-            return True  # if ** is the last one it matches anything to the right.
+        else:
+            res.append(re.escape(c))
+    return ''.join(res)
 
-        for i in xrange(len(paths)):
-            # Recursively check the remaining patterns as the
-            # current pattern could match any number of paths.
-            if _check_matches(patterns[1:], paths[i:]):
-                return True
 
-    elif not fnmatch.fnmatch(path, pattern):
-        # Current part doesn't match.
-        return False
+def _glob_parts_to_regexp(pattern, sep):
+    patterns = pattern.split(sep)
+    if patterns and patterns[0] == '':
+        patterns = patterns[1:]
+
+    # Note: the subject matched has each path part followed by the separator
+    # (see: _path_to_match_subject), so, an empty list of parts can be
+    # distinguished from a single empty part.
+    esep = re.escape(sep)
+    res = []
+    last = len(patterns) - 1
+    for i, part in enumerate(patterns):
+        if part == '**':
+            if i == last:
+                # If ** is the last one it matches anything to the right (but something must be there).
+                res.append('(?:[^%s]*%s)+' % (esep, esep))
+            else:
+                # Otherwise it can match any number of paths (including none).
+                res.append('(?:[^%s]*%s)*' % (esep, esep))
 
-    return _check_matches(patterns[1:], paths[1:])
+        elif glob.has_magic(part):
+            res.append(_translate_glob_part(part, sep) + esep)
 
+        else:
+            res.append(re.escape(part) + esep)
+    return ''.join(res)
 
-def glob_matches_path(path, pattern, sep=os.sep, altsep=os.altsep):
+
+def _glob_to_regexp(pattern, sep=os.sep, altsep=os.altsep):
+    '''
+    :return str:
+        A regexp (without groups) which matches the subject returned by `_path_to_match_subject`
+        for the paths that the given glob pattern matches.
+    '''
     if altsep:
         pattern = pattern.replace(altsep, sep)
+
+    if len(pattern) > 1 and pattern[1] == ':':
+        # If the path has a drive the pattern drive must match it, otherwise, the pattern
+        # drive is considered to be a part of the path.
+        return '(?:%s\0%s|\0%s)' % (
+            re.escape(pattern[0].lower()), _glob_parts_to_regexp(pattern[2:], sep), _glob_parts_to_regexp(pattern, sep))
+
+    # A drive in the path is ignored if the pattern has no drive.
+    return '[^\0]*\0' + _glob_parts_to_regexp(pattern, sep)
+
+
+def _path_to_match_subject(path, sep=os.sep, altsep=os.altsep):
+    if altsep:
         path = path.replace(altsep, sep)
 
     drive = ''
     if len(path) > 1 and path[1] == ':':
-        drive, path = path[0], path[2:]
-
-    if drive and len(pattern) > 1:
-        if pattern[1] == ':':
-            if drive.lower() != pattern[0].lower():
-                return False
-            pattern = pattern[2:]
+        drive, path = path[0].lower(), path[2:]
 
-    patterns = pattern.split(sep)
     paths = path.split(sep)
-    if paths:
-        if paths[0] == '':
-            paths = paths[1:]
-    if patterns:
-        if patterns[0] == '':
-            patterns = patterns[1:]
+    if paths and paths[0] == '':
+        paths = paths[1:]
+
+    return drive + '\0' + ''.join(p + sep for p in paths)
+
+
+_compiled_globs_cache = {}
+
+
+def glob_matches_path(path, pattern, sep=os.sep, altsep=os.altsep):
+    key = (pattern, sep, altsep)
+    try:
+        compiled = _compiled_globs_cache[key]
+    except KeyError:
+        if len(_compiled_globs_cache) > 1000:
+            _compiled_globs_cache.clear()
+        compiled = _compiled_globs_cache[key] = re.compile(_glob_to_regexp(pattern, sep, altsep) + r'\Z', re.DOTALL)
+
+    return compiled.match(_path_to_match_subject(path, sep, altsep)) is not None
+
+
+class _CompiledExcludeFilters(object):
+    '''
+    All the exclude filters compiled into a single matcher which returns the result of the
+    first filter (in order) matching a given file: path filters are compiled into regexps (an
+    alternation of all the patterns, where the first alternative matching gives the filter)
+    and module filters into a dict (so, only the prefixes of the module name are checked).
+    '''
+
+    def __init__(self, exclude_filters, sep=os.sep, altsep=os.altsep):
+        self._sep = sep
+        self._altsep = altsep
+
+        # List(tuple(compiled regexp, list(filter index)))
+        self._path_regexps = []
+        path_regexps = []
+        path_indexes = []
+
+        # Module name -> (filter index, exclude)
+        self._module_to_index_and_exclude = {}
+
+        for i, exclude_filter in enumerate(exclude_filters):  # : :type exclude_filter: ExcludeFilter
+            if exclude_filter.is_path:
+                path_regexps.append('(%s)' % (_glob_to_regexp(exclude_filter.name, sep, altsep),))
+                path_indexes.append(i)
+                if len(path_regexps) == _MAX_GROUPS_IN_REGEXP:
+                    self._add_path_regexps(path_regexps, path_indexes)
+                    path_regexps = []
+                    path_indexes = []
+            else:
+                self._module_to_index_and_exclude.setdefault(exclude_filter.name, (i, exclude_filter.exclude))
+
+        if path_regexps:
+            self._add_path_regexps(path_regexps, path_indexes)
+
+        self._excludes = [exclude_filter.exclude for exclude_filter in exclude_filters]
+
+    def _add_path_regexps(self, path_regexps, path_indexes):
+        compiled = re.compile('(?:%s)\\Z' % ('|'.join(path_regexps),), re.DOTALL)
+        self._path_regexps.append((compiled, path_indexes))
+
+    def _first_path_filter_index(self, filename):
+        if self._path_regexps:
+            subject = _path_to_match_subject(filename, self._sep, self._altsep)
+            for compiled, path_indexes in self._path_regexps:
+                match = compiled.match(subject)
+                if match is not None:
+                    return path_indexes[match.lastindex - 1]
+        return None
+
+    def _first_module_filter_index(self, module_name):
+        if self._module_to_index_and_exclude and module_name:
+            found = None
+            name = module_name
+            while True:
+                index_and_exclude = self._module_to_index_and_exclude.get(name)
+                if index_and_exclude is not None:
+                    if found is None or index_and_exclude[0] < found:
+                        found = index_and_exclude[0]
+                i = name.rfind('.')
+                if i == -1:
+                    return found
+                name = name[:i]
+        return None
+
+    def exclude_by_filter(self, filename, module_name):
+        path_index = self._first_path_filter_index(filename)
+        module_index = self._first_module_filter_index(module_name)
+        if path_index is None:
+            if module_index is None:
+                return None
+            return self._excludes[module_index]
+
+        if module_index is not None and module_index < path_index:
+            return self._excludes[module_index]
+        return self._excludes[path_index]
+
+
+class _RootsTrie(object):
+    '''
+    The project and library roots in a trie (keyed by path parts), so that the deepest
+    project root and the deepest library root containing a given file are found by a
+    single walk through the parts of the file.
+    '''
+
+    # Keys in a trie node (which can't clash with path parts) storing whether a project
+    # or a library root ends at that node.
+    _PROJECT_ROOT = 0
+    _LIBRARY_ROOT = 1
+
+    def __init__(self, project_roots, library_roots, sep=os.sep):
+        self._sep = sep
+        self._trie = {}
+        for root in project_roots:
+            self._add(root, self._PROJECT_ROOT)
+        for root in library_roots:
+            self._add(root, self._LIBRARY_ROOT)
 
-    return _check_matches(patterns, paths)
+    def _split(self, path):
+        # Note: a trailing separator (i.e.: in '/' or 'c:\\') doesn't create a new part.
+        return path.rstrip(self._sep).split(self._sep)
+
+    def _add(self, root, kind):
+        node = self._trie
+        for part in self._split(root):
+            node = node.setdefault(part, {})
+        node[kind] = True
+
+    def get_deepest_roots(self, filename):
+        '''
+        :return tuple(int, int):
+            The number of path parts of the deepest project root and of the deepest library
+            root containing the given filename (-1 if not found).
+        '''
+        project_depth = library_depth = -1
+        node = self._trie
+        for depth, part in enumerate(self._split(filename)):
+            node = node.get(part)
+            if node is None:
+                break
+            if self._PROJECT_ROOT in node:
+                project_depth = depth
+            if self._LIBRARY_ROOT in node:
+                library_depth = depth
+        return project_depth, library_depth
 
 
 class FilesFiltering(object):
@@ -102,8 +306,10 @@ class FilesFiltering(object):
 
     def __init__(self):
         self._exclude_filters = []
+        self._compiled_exclude_filters = _CompiledExcludeFilters([])
         self._project_roots = []
         self._library_roots = []
+        self._roots_trie = _RootsTrie([], [])
 
         # Filter out libraries?
         self._use_libraries_filter = False
@@ -134,7 +340,7 @@ class FilesFiltering(object):
                 exclude_filters = []
                 for key, val in json.loads(pydevd_filters).items():
                     exclude_filters.append(ExcludeFilter(key, val, True))
-                self._exclude_filters = exclude_filters
+                self.set_exclude_filters(exclude_filters)
             else:
                 # A ';' separated list of strings with globs for the
                 # list of excludes.
@@ -143,11 +349,70 @@ class FilesFiltering(object):
                 for new_filter in filters:
                     if new_filter.strip():
                         new_filters.append(ExcludeFilter(new_filter.strip(), True, True))
-                self._exclude_filters = new_filters
+                self.set_exclude_filters(new_filters)
+
+    # The default library roots which only depend on the interpreter are computed once
+    # (forked children reuse it and spawned children which are also debugged receive it
+    # through the environment if they're running the same interpreter).
+    _default_interpreter_library_roots = None
 
     @classmethod
     def _get_default_library_roots(cls):
         # Provide sensible defaults if not in env vars.
+        roots = list(cls._get_default_interpreter_library_roots())
+
+        sys_path_roots = []
+        for path in sys.path:
+            if os.path.exists(path) and os.path.basename(path) == 'site-packages':
+                sys_path_roots.append(path)
+
+        roots.extend(sys_path_roots)
+        roots.extend([os.path.realpath(path) for path in sys_path_roots])
+
+        return sorted(set(roots))
+
+    @classmethod
+    def _get_interpreter_key(cls):
+        import site
+        user_site = site.getusersitepackages() if hasattr(site, 'getusersitepackages') else None
+        return [sys.executable, sys.prefix, sys.exec_prefix, sys.version, user_site]
+
+    @classmethod
+    def _get_default_interpreter_library_roots(cls):
+        if cls._default_interpreter_library_roots is not None:
+            return cls._default_interpreter_library_roots
+
+        # The variable is removed so that it isn't inherited by subprocesses which aren't
+        # debugged (see: share_default_library_roots).
+        shared = os.environ.pop(DEFAULT_LIBRARY_ROOTS_ENV, None)
+        if shared:
+            try:
+                shared = json.loads(shared)
+                if shared['interpreter'] == cls._get_interpreter_key():
+                    cls._default_interpreter_library_roots = _convert_to_str_and_clear_empty(shared['roots'])
+                    return cls._default_interpreter_library_roots
+            except Exception:
+                pass  # Not valid: just compute it.
+
+        cls._default_interpreter_library_roots = cls._compute_default_interpreter_library_roots()
+        return cls._default_interpreter_library_roots
+
+    @classmethod
+    def share_default_library_roots(cls):
+        '''
+        Makes the default library roots available to the subprocesses (should be called only
+        when subprocesses are also debugged).
+        '''
+        try:
+            os.environ[DEFAULT_LIBRARY_ROOTS_ENV] = json.dumps({
+                'interpreter': cls._get_interpreter_key(),
+                'roots': cls._get_default_interpreter_library_roots(),
+            })
+        except Exception:
+            pydev_log.exception('Unable to share the default library roots with subprocesses.')
+
+    @classmethod
+    def _compute_default_interpreter_library_roots(cls):
         import site
 
         roots = []
@@ -181,10 +446,6 @@ class FilesFiltering(object):
             else:
                 roots.append(site_paths)
 
-        for path in sys.path:
-            if os.path.exists(path) and os.path.basename(path) == 'site-packages':
-                roots.append(path)
-
         roots.extend([os.path.realpath(path) for path in roots])
 
         return sorted(set(roots))
@@ -201,6 +462,7 @@ class FilesFiltering(object):
 
     def set_project_roots(self, project_roots):
         self._project_roots = self._fix_roots(project_roots)
+        self._roots_trie = _RootsTrie(self._project_roots, self._library_roots)
         pydev_log.debug("IDE_PROJECT_ROOTS %s\n" % project_roots)
 
     def _get_project_roots(self):
@@ -208,6 +470,7 @@ class FilesFiltering(object):
 
     def set_library_roots(self, roots):
         self._library_roots = self._fix_roots(roots)
+        self._roots_trie = _RootsTrie(self._project_roots, self._library_roots)
         pydev_log.debug("LIBRARY_ROOTS %s\n" % roots)
 
     def _get_library_roots(self):
@@ -221,16 +484,7 @@ class FilesFiltering(object):
         if not filename.endswith('>'):
             filename = self._normpath(filename)
 
-        found_in_project = []
-        for root in project_roots:
-            if root and filename.startswith(root):
-                found_in_project.append(root)
-
-        found_in_library = []
-        library_roots = self._get_library_roots()
-        for root in library_roots:
-            if root and filename.startswith(root):
-                found_in_library.append(root)
+        project_depth, library_depth = self._roots_trie.get_deepest_roots(filename)
 
         if not project_roots:
             # If we have no project roots configured, consider it being in the project
@@ -242,16 +496,10 @@ class FilesFiltering(object):
                 # standard library.
                 in_project = not filename.startswith('<frozen ')
             else:
-                in_project = not found_in_library
+                in_project = library_depth == -1
         else:
-            in_project = False
-            if found_in_project:
-                if not found_in_library:
-                    in_project = True
-                else:
-                    # Found in both, let's see which one has the bigger path matched.
-                    if max(len(x) for x in found_in_project) > max(len(x) for x in found_in_library):
-                        in_project = True
+            # If found in both, the deepest root matched wins.
+            in_project = project_depth > library_depth
 
         return in_project
 
@@ -272,23 +520,17 @@ class FilesFiltering(object):
     def exclude_by_filter(self, filename, module_name):
         '''
         :return: True if it should be excluded, False if it should be included and None
-            if no rule matched the given file.
+            if no rule matched the given file (if more than one rule matches, the first
+            one in the order given in `set_exclude_filters` is used).
         '''
-        for exclude_filter in self._exclude_filters:  # : :type exclude_filter: ExcludeFilter
-            if exclude_filter.is_path:
-                if glob_matches_path(filename, exclude_filter.name):
-                    return exclude_filter.exclude
-            else:
-                # Module filter.
-                if exclude_filter.name == module_name or module_name.startswith(exclude_filter.name + '.'):
-                    return exclude_filter.exclude
-        return None
+        return self._compiled_exclude_filters.exclude_by_filter(filename, module_name)
 
     def set_exclude_filters(self, exclude_filters):
         '''
         :param list(ExcludeFilter) exclude_filters:
         '''
         self._exclude_filters = exclude_filters
+        self._compiled_exclude_filters = _CompiledExcludeFilters(exclude_filters)
         self.require_module = False
         for exclude_filter in exclude_filters:
             if not exclude_filter.is_path:
@@ -148,26 +148,17 @@ class PyDBFrame:
                     pydev_log.exception()
 
                 if not should_stop:
-                    # It was not handled by any plugin, lets check exception breakpoints.
-                    exception_breakpoint = main_debugger.get_exception_breakpoint(
-                        exception, main_debugger.break_on_caught_exceptions)
+                    # It was not handled by any plugin, lets check exception breakpoints (the
+                    # breakpoint for a given exception type is cached until breakpoints change).
+                    exception_breakpoint = main_debugger.get_caught_exception_breakpoint(exception)
 
                     if exception_breakpoint is not None:
                         if exception is SystemExit and main_debugger.ignore_system_exit_code(value):
                             return False, frame
 
-                        if exception_breakpoint.condition is not None:
-                            eval_result = main_debugger.handle_breakpoint_condition(info, exception_breakpoint, frame)
-                            if not eval_result:
-                                return False, frame
-
-                        if main_debugger.exclude_exception_by_filter(exception_breakpoint, trace, False):
-                            pydev_log.debug("Ignore exception %s in library %s -- (%s)" % (exception, frame.f_code.co_filename, frame.f_code.co_name))
-                            return False, frame
-
-                        if ignore_exception_trace(trace):
-                            return False, frame
-
+                        # Note: the checks which only look at the traceback come first as they're
+                        # much cheaper than the filters and the condition (and reject most of the
+                        # frames an exception goes through).
                         was_just_raised = just_raised(trace)
                         if was_just_raised:
 
@@ -186,6 +177,18 @@ class PyDBFrame:
                                 if not was_just_raised:
                                     return False, frame  # I.e.: we stop only when it was just raised
 
+                        if ignore_exception_trace(trace):
+                            return False, frame
+
+                        if main_debugger.exclude_exception_by_filter(exception_breakpoint, trace, False):
+                            pydev_log.debug("Ignore exception %s in library %s -- (%s)" % (exception, frame.f_code.co_filename, frame.f_code.co_name))
+                            return False, frame
+
+                        if exception_breakpoint.condition is not None:
+                            eval_result = main_debugger.handle_breakpoint_condition(info, exception_breakpoint, frame)
+                            if not eval_result:
+                                return False, frame
+
                         # If it got here we should stop.
                         should_stop = True
                         try:
@@ -0,0 +1,231 @@
+'''
+Referrers analysis based on a snapshot of the heap.
+
+`gc.get_referrers` has to go through all the objects tracked by the gc for each query. A
+`HeapSnapshot` takes a single `gc.get_objects()` snapshot and builds a reverse-reference
+index (kept in compact arrays of object indexes), so, repeated queries for the referrers of
+an object or for a path from an object to a module are answered without walking the heap
+again.
+
+Note: the snapshot keeps all the objects alive, so, it should only be kept while the
+program is suspended.
+'''
+from array import array
+from collections import deque
+from os.path import basename
+import gc
+import types
+
+from _pydevd_bundle.pydevd_constants import dict_iter_items
+
+_frame_type = types.FrameType
+_module_type = types.ModuleType
+
+
+def _is_pydev_frame(obj):
+    return type(obj) is _frame_type and basename(obj.f_code.co_filename).startswith('pydev')
+
+
+def _is_pydev_type(obj_type):
+    module = getattr(obj_type, '__module__', None)
+    return isinstance(module, str) and module.startswith(('_pydev', 'pydev'))
+
+
+def get_found_as(referrer, obj):
+    '''
+    :return str:
+        How the given object is referenced in the referrer (i.e.: the name of the local
+        variable, the key in a dict, the index in a list) or an empty string if unknown.
+    '''
+    try:
+        referrer_type = type(referrer)
+        if referrer_type is _frame_type:
+            for key, val in dict_iter_items(referrer.f_locals):
+                if val is obj:
+                    return str(key)
+
+        elif referrer_type is dict:
+            for key, val in dict_iter_items(referrer):
+                if val is obj:
+                    return str(key)
+
+        elif referrer_type in (tuple, list):
+            for i, x in enumerate(referrer):
+                if x is obj:
+                    return '%s[%s]' % (referrer_type.__name__, i)
+
+        else:
+            referrer_dict = getattr(referrer, '__dict__', None)
+            if referrer_dict is obj:
+                return '__dict__'
+            if type(referrer_dict) is dict:
+                for key, val in dict_iter_items(referrer_dict):
+                    if val is obj:
+                        return str(key)
+    except:
+        pass  # Just ignore any error here (i.e.: ReferenceError, etc.)
+    return ''
+
+
+class HeapSnapshot(object):
+
+    def __init__(self):
+        objects = gc.get_objects()
+        tracked_count = len(objects)
+
+        id_to_index = {}
+        for i, obj in enumerate(objects):
+            id_to_index[id(obj)] = i
+
+        # The references from the debugger frames (including this one) and from the debugger
+        # internal objects (i.e.: the variables tracked while suspended) are skipped.
+        ignore = set()
+        is_pydev_type_cache = {}
+        for i, obj in enumerate(objects):
+            obj_type = type(obj)
+            is_pydev_type = is_pydev_type_cache.get(obj_type)
+            if is_pydev_type is None:
+                is_pydev_type = is_pydev_type_cache[obj_type] = _is_pydev_type(obj_type)
+
+            if is_pydev_type:
+                ignore.add(i)
+                try:
+                    obj_dict = obj.__dict__
+                except:
+                    continue
+                j = id_to_index.get(id(obj_dict))
+                if j is not None:
+                    ignore.add(j)
+
+            elif _is_pydev_frame(obj):
+                ignore.add(i)
+        is_pydev_type_cache = None
+
+        # The edges (referrer index -> referent index). Referents which are not tracked by
+        # the gc (i.e.: str, int) are added to the objects as they're found.
+        sources = array('l')
+        targets = array('l')
+        get_referents = gc.get_referents
+        for i in range(tracked_count):
+            if i in ignore:
+                continue
+            obj = objects[i]
+            for referent in get_referents(obj):
+                j = id_to_index.get(id(referent))
+                if j is None:
+                    j = id_to_index[id(referent)] = len(objects)
+                    objects.append(referent)
+                sources.append(i)
+                targets.append(j)
+        obj = obj_dict = referent = None
+
+        # Reverse index (compressed sparse rows): the referrers of the object at index `i` are
+        # `self._referrers[self._offsets[i]:self._offsets[i + 1]]`.
+        offsets = array('l', [0]) * (len(objects) + 1)
+        for j in targets:
+            offsets[j + 1] += 1
+        for i in range(len(objects)):
+            offsets[i + 1] += offsets[i]
+
+        referrers = array('l', [0]) * len(sources)
+        positions = offsets[:-1]
+        for e in range(len(sources)):
+            j = targets[e]
+            referrers[positions[j]] = sources[e]
+            positions[j] += 1
+
+        self._objects = objects
+        self._id_to_index = id_to_index
+        self._offsets = offsets
+        self._referrers = referrers
+
+    @property
+    def objects_count(self):
+        return len(self._objects)
+
+    @property
+    def references_count(self):
+        return len(self._referrers)
+
+    def _get_index(self, obj):
+        i = self._id_to_index.get(id(obj))
+        if i is None or self._objects[i] is not obj:
+            return None  # Created after the snapshot.
+        return i
+
+    def _iter_referrer_indexes(self, i):
+        referrers = self._referrers
+        for k in range(self._offsets[i], self._offsets[i + 1]):
+            yield referrers[k]
+
+    def get_referrers(self, obj, max_results=None):
+        '''
+        :return list(tuple(object, str)):
+            The objects which referenced the given object when the snapshot was taken and how
+            the object was referenced (see: `get_found_as`).
+
+            Note: when the referrer is the `__dict__` of an instance, the instance is reported.
+        '''
+        i = self._get_index(obj)
+        if i is None:
+            return []
+
+        objects = self._objects
+        ret = []
+        for k in self._iter_referrer_indexes(i):
+            referrer = objects[k]
+            found_as = get_found_as(referrer, obj)
+
+            if type(referrer) is dict:
+                # Report the instance instead of its __dict__ (if the dict is the __dict__ of
+                # some instance).
+                for owner_k in self._iter_referrer_indexes(k):
+                    owner = objects[owner_k]
+                    try:
+                        if getattr(owner, '__dict__', None) is referrer:
+                            referrer = owner
+                            break
+                    except:
+                        pass
+
+            ret.append((referrer, found_as))
+            if max_results is not None and len(ret) >= max_results:
+                break
+        return ret
+
+    def get_path_to_root(self, obj, max_depth=100):
+        '''
+        :return list(tuple(object, str)):
+            The shortest chain of referrers from the given object to a module (found with a
+            breadth-first search), where the first entry is the object referencing the given
+            object and the last one is the module. Each entry has the referrer and how the
+            previous object was referenced in it (see: `get_found_as`).
+
+            An empty list is returned if no module references the object.
+        '''
+        start = self._get_index(obj)
+        if start is None:
+            return []
+
+        objects = self._objects
+        # index -> index of the object it references (towards the searched object).
+        came_from = {start: None}
+        pending = deque([(start, 0)])
+        while pending:
+            i, depth = pending.popleft()
+            if i != start and type(objects[i]) is _module_type:
+                path = []
+                while came_from[i] is not None:
+                    path.append((objects[i], get_found_as(objects[i], objects[came_from[i]])))
+                    i = came_from[i]
+                path.reverse()
+                return path
+
+            if depth >= max_depth:
+                continue
+
+            for k in self._iter_referrer_indexes(i):
+                if k not in came_from:
+                    came_from[k] = i
+                    pending.append((k, depth + 1))
+        return []
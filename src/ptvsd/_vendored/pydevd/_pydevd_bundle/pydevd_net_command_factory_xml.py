@@ -336,9 +336,13 @@ class NetCommandFactory(object):
         except Exception:
             return self.make_error_message(seq, get_exception_traceback_str())
 
-    def make_reloaded_code_message(self, seq, reloaded_ok):
+    def make_reloaded_code_message(self, seq, reloaded_ok, reload_info=None):
         try:
-            return NetCommand(CMD_RELOAD_CODE, seq, '<xml><reloaded ok="%s"></reloaded></xml>' % reloaded_ok)
+            if reload_info is None:
+                return NetCommand(CMD_RELOAD_CODE, seq, '<xml><reloaded ok="%s"></reloaded></xml>' % reloaded_ok)
+
+            return NetCommand(CMD_RELOAD_CODE, seq, '<xml><reloaded ok="%s" elapsed="%.3f" functions_checked="%s" functions_changed="%s"></reloaded></xml>' % (
+                reloaded_ok, reload_info.elapsed, reload_info.functions_checked, reload_info.functions_changed))
         except Exception:
             return self.make_error_message(seq, get_exception_traceback_str())
 
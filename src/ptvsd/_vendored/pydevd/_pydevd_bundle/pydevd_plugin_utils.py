@@ -3,24 +3,23 @@ import types
 from _pydev_bundle import pydev_log
 from _pydevd_bundle import pydevd_trace_api
 
-try:
-    from pydevd_plugins import django_debug
-except:
-    django_debug = None
-    pydev_log.debug('Unable to load django_debug plugin')
-
-try:
-    from pydevd_plugins import jinja2_debug
-except:
-    jinja2_debug = None
-    pydev_log.debug('Unable to load jinja2_debug plugin')
 
 def load_plugins():
+    # Note: the plugins are only imported when actually needed (i.e.: when the client
+    # adds some django/jinja2 breakpoint), so that they don't affect the startup time.
     plugins = []
-    if django_debug is not None:
+    try:
+        from pydevd_plugins import django_debug
+    except:
+        pydev_log.debug('Unable to load django_debug plugin')
+    else:
         plugins.append(django_debug)
 
-    if jinja2_debug is not None:
+    try:
+        from pydevd_plugins import jinja2_debug
+    except:
+        pydev_log.debug('Unable to load jinja2_debug plugin')
+    else:
         plugins.append(jinja2_debug)
     return plugins
 
@@ -1,15 +1,15 @@
 import bisect
 import itertools
 import json
-import linecache
 import os
 import platform
 import sys
-import types
+from collections import OrderedDict
 from functools import partial
 
 import pydevd_file_utils
 from _pydev_bundle import pydev_log
+from _pydev_imps._pydev_saved_modules import threading
 from _pydevd_bundle._debug_adapter import pydevd_base_schema, pydevd_schema
 from _pydevd_bundle._debug_adapter.pydevd_schema import (
     CompletionsResponseBody, EvaluateResponseBody, ExceptionOptions,
@@ -19,6 +19,7 @@ from _pydevd_bundle._debug_adapter.pydevd_schema import (
 	VariablesResponseBody, SetBreakpointsResponseBody)
 from _pydevd_bundle.pydevd_api import PyDevdAPI
 from _pydevd_bundle.pydevd_breakpoints import get_exception_class
+from _pydevd_bundle.pydevd_code_lines import get_code_line_table, get_code_lines
 from _pydevd_bundle.pydevd_comm_constants import (
     CMD_PROCESS_EVENT, CMD_RETURN, CMD_SET_NEXT_STATEMENT, CMD_STEP_INTO,
 	CMD_STEP_INTO_MY_CODE, CMD_STEP_OVER, CMD_STEP_OVER_MY_CODE,
@@ -29,40 +30,64 @@ from _pydevd_bundle.pydevd_constants import (
 from _pydevd_bundle.pydevd_filtering import ExcludeFilter
 from _pydevd_bundle.pydevd_json_debug_options import _extract_debug_options
 from _pydevd_bundle.pydevd_net_command import NetCommand
+from _pydevd_bundle.pydevd_sampling_profiler import (SamplingProfiler, CLOCK_WALL, CLOCK_CPU, DEFAULT_INTERVAL,
+    can_use_cpu_clock)
+from _pydevd_bundle.pydevd_source_cache import get_source_cache, DEFAULT_SOURCE_CHUNK_SIZE
 from _pydevd_bundle.pydevd_utils import convert_dap_log_message_to_expression
 
-try:
-    import dis
-except ImportError:
-
-    def _get_code_lines(code):
-        raise NotImplementedError
-
-else:
-
-    def _get_code_lines(code):
-        if not isinstance(code, types.CodeType):
-            path = code
-            with open(path) as f:
-                src = f.read()
-            code = compile(src, path, 'exec', 0, dont_inherit=True)
-            return _get_code_lines(code)
-
-        def iterate():
-            # First, get all line starts for this code object. This does not include
-            # bodies of nested class and function definitions, as they have their
-            # own objects.
-            for _, lineno in dis.findlinestarts(code):
-                yield lineno
-
-            # For nested class and function definitions, their respective code objects
-            # are constants referenced by this object.
-            for const in code.co_consts:
-                if isinstance(const, types.CodeType) and const.co_filename == code.co_filename:
-                    for lineno in _get_code_lines(const):
-                        yield lineno
-
-        return iterate()
+def _get_module_code(filename):
+    '''
+    :return code:
+        The code object for the given file (reusing the bytecode cached by the import system if
+        some loaded module was imported from it and it's still up to date).
+    '''
+    normalized = os.path.normcase(os.path.abspath(filename))
+    for module in list(sys.modules.values()):
+        try:
+            loader = getattr(module, '__loader__', None)
+            path = getattr(loader, 'path', None)
+            if not path or os.path.normcase(os.path.abspath(path)) != normalized:
+                continue
+            code = loader.get_code(loader.name)
+        except Exception:
+            continue
+        if code is not None:
+            return code
+
+    with open(filename) as f:
+        src = f.read()
+    return compile(src, filename, 'exec', 0, dont_inherit=True)
+
+
+# The IDE sends the breakpoints for a file again on each change, so, the valid lines are
+# cached (as the file needs to be compiled to get those).
+# filename -> (mtime, size, sorted lines)
+_valid_breakpoint_lines_cache = OrderedDict()
+_valid_breakpoint_lines_cache_lock = threading.Lock()
+_MAX_VALID_BREAKPOINT_LINES_CACHE_SIZE = 100
+
+
+def _get_valid_breakpoint_lines(filename):
+    '''
+    :return list(int):
+        The sorted lines where a breakpoint may be hit in the given file.
+    '''
+    stat = os.stat(filename)
+    with _valid_breakpoint_lines_cache_lock:
+        cached = _valid_breakpoint_lines_cache.pop(filename, None)
+        if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+            # Re-add it so that it's the last one to be removed.
+            _valid_breakpoint_lines_cache[filename] = cached
+            return cached[2]
+
+    # Note: the line may be 0 (or None) for instructions which have no line.
+    lines = sorted(set(line for line in get_code_lines(_get_module_code(filename)) if line))
+
+    with _valid_breakpoint_lines_cache_lock:
+        _valid_breakpoint_lines_cache[filename] = (stat.st_mtime, stat.st_size, lines)
+        while len(_valid_breakpoint_lines_cache) > _MAX_VALID_BREAKPOINT_LINES_CACHE_SIZE:
+            _valid_breakpoint_lines_cache.popitem(last=False)
+    return lines
 
 
 def _convert_rules_to_exclude_filters(rules, filename_to_server, on_error):
@@ -154,6 +179,7 @@ class _PyDevJsonCommandProcessor(object):
         self._next_breakpoint_id = partial(next, itertools.count(0))
         self._goto_targets_map = IDMap()
         self._launch_or_attach_request_done = False
+        self._sampling_profiler = None
 
     def process_net_command_json(self, py_db, json_contents):
         '''
@@ -461,6 +487,9 @@ class _PyDevJsonCommandProcessor(object):
         :param DisconnectRequest request:
         '''
         self._launch_or_attach_request_done = False
+        if self._sampling_profiler is not None:
+            self._sampling_profiler.stop()
+            self._sampling_profiler = None
         py_db.enable_output_redirection(False, False)
         self.api.request_disconnect(py_db, resume_threads=True)
 
@@ -494,7 +523,7 @@ class _PyDevJsonCommandProcessor(object):
 
         # Validate breakpoints and adjust their positions.
         try:
-            lines = sorted(_get_code_lines(filename))
+            lines = _get_valid_breakpoint_lines(filename)
         except Exception:
             pass
         else:
@@ -716,6 +745,56 @@ class _PyDevJsonCommandProcessor(object):
                 })
             return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
+    def on_pydevdevaluatewatches_request(self, py_db, request):
+        '''
+        :param PydevdEvaluateWatchesRequest request:
+        '''
+        # : :type arguments: PydevdEvaluateWatchesArguments
+        arguments = request.arguments
+
+        # All the expressions are evaluated in the thread of the first frame.
+        thread_id = None
+        frame_ids = [arguments.frameId] + [watch.get('frameId') for watch in arguments.expressions]
+        for frame_id in frame_ids:
+            if frame_id is not None:
+                thread_id = py_db.suspended_frames_manager.get_thread_id_for_variable_reference(frame_id)
+                break
+
+        if thread_id is not None:
+            self.api.request_evaluate_watches_json(py_db, request, thread_id)
+        else:
+            body = pydevd_schema.PydevdEvaluateWatchesResponseBody([])
+            response = pydevd_base_schema.build_response(
+                request,
+                kwargs={
+                    'body': body,
+                    'success': False,
+                    'message': 'Unable to find thread for evaluation.'
+                })
+            return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+    def on_pydevdgetreferrers_request(self, py_db, request):
+        '''
+        :param PydevdGetReferrersRequest request:
+        '''
+        # : :type arguments: PydevdGetReferrersArguments
+        arguments = request.arguments
+        thread_id = py_db.suspended_frames_manager.get_thread_id_for_variable_reference(
+            arguments.variablesReference)
+
+        if thread_id is not None:
+            self.api.request_get_referrers_json(py_db, request, thread_id)
+        else:
+            body = pydevd_schema.PydevdGetReferrersResponseBody([], 0, 0)
+            response = pydevd_base_schema.build_response(
+                request,
+                kwargs={
+                    'body': body,
+                    'success': False,
+                    'message': 'Unable to find thread for variable reference: %s' % (arguments.variablesReference,)
+                })
+            return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
     def on_setexpression_request(self, py_db, request):
         # : :type arguments: SetExpressionArguments
         arguments = request.arguments
@@ -814,23 +893,7 @@ class _PyDevJsonCommandProcessor(object):
         if source_reference != 0:
             server_filename = pydevd_file_utils.get_server_filename_from_source_reference(source_reference)
             if server_filename:
-                # Try direct file access first - it's much faster when available.
-                try:
-                    with open(server_filename, 'r') as stream:
-                        content = stream.read()
-                except:
-                    pass
-
-                if content is None:
-                    # File might not exist at all, or we might not have a permission to read it,
-                    # but it might also be inside a zipfile, or an IPython cell. In this case,
-                    # linecache might still be able to retrieve the source.
-                    lines = (linecache.getline(server_filename, i) for i in itertools.count(1))
-                    lines = itertools.takewhile(bool, lines)  # empty lines are '\n', EOF is ''
-
-                    # If we didn't get at least one line back, reset it to None so that it's
-                    # reported as error below, and not as an empty file.
-                    content = ''.join(lines) or None
+                content = get_source_cache().get_contents(server_filename)
 
         body = SourceResponseBody(content or '')
         response_args = {'body': body}
@@ -847,20 +910,93 @@ class _PyDevJsonCommandProcessor(object):
         response = pydevd_base_schema.build_response(request, kwargs=response_args)
         return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
+    def on_pydevdsourcechunk_request(self, py_db, request):
+        '''
+        :param PydevdSourceChunkRequest request:
+        '''
+        arguments = request.arguments  # : :type arguments: PydevdSourceChunkArguments
+        source_reference = arguments.sourceReference
+        start = arguments.start or 0
+        count = arguments.count if arguments.count is not None else DEFAULT_SOURCE_CHUNK_SIZE
+        content = None
+        message = None
+        if start < 0 or count < 0:
+            message = 'Invalid chunk (start: %s, count: %s)' % (start, count)
+        else:
+            server_filename = pydevd_file_utils.get_server_filename_from_source_reference(source_reference)
+            if not server_filename:
+                message = 'Invalid sourceReference %d' % (source_reference,)
+            else:
+                content = get_source_cache().get_contents(server_filename)
+                if content is None:
+                    message = 'Unable to retrieve source for %s' % (server_filename,)
+
+        if content is None:
+            body = pydevd_schema.PydevdSourceChunkResponseBody('', start, 0)
+            response_args = {'body': body, 'success': False, 'message': message}
+        else:
+            body = pydevd_schema.PydevdSourceChunkResponseBody(content[start:start + count], start, len(content))
+            response_args = {'body': body}
+
+        response = pydevd_base_schema.build_response(request, kwargs=response_args)
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
     def on_gototargets_request(self, py_db, request):
         path = request.arguments.source.path
         line = request.arguments.line
-        target_id = self._goto_targets_map.obtain_key((path, line))
-        target = {
-            'id': target_id,
-            'label': '%s:%s' % (path, line),
-            'line': line
-        }
-        body = GotoTargetsResponseBody(targets=[target])
+
+        lines = [line]
+        error = None
+        frame = self._find_suspended_frame_with_line(py_db, path, line)
+        if frame is not None:
+            line_table = get_code_line_table(frame.f_code)
+            if line_table is not None:
+                error = line_table.get_jump_error(frame.f_lasti, line)
+                if error is None:
+                    # The requested line first (clients jump to the first target) and then
+                    # all the other valid targets in the frame.
+                    lines.extend(
+                        target_line for target_line in line_table.get_jump_targets(frame.f_lasti)
+                        if target_line != line)
+            frame = None
+
+        if error is not None:
+            body = GotoTargetsResponseBody(targets=[])
+            response_args = {'body': body, 'success': False, 'message': error}
+            response = pydevd_base_schema.build_response(request, kwargs=response_args)
+            return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+        targets = []
+        for target_line in lines:
+            targets.append({
+                'id': self._goto_targets_map.obtain_key((path, target_line)),
+                'label': '%s:%s' % (path, target_line),
+                'line': target_line,
+            })
+        body = GotoTargetsResponseBody(targets=targets)
         response_args = {'body': body}
         response = pydevd_base_schema.build_response(request, kwargs=response_args)
         return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
+    def _find_suspended_frame_with_line(self, py_db, path, line):
+        '''
+        :return frame|None:
+            The topmost frame of a suspended thread in the given file whose code contains
+            the given line.
+        '''
+        try:
+            filename = self.api.filename_to_server(path)
+        except Exception:
+            return None
+
+        for frame in py_db.suspended_frames_manager.get_suspended_topmost_frames():
+            if pydevd_file_utils.get_abs_path_real_path_and_base_from_frame(frame)[1] != filename:
+                continue
+            line_table = get_code_line_table(frame.f_code)
+            if line_table is not None and line_table.lines and line_table.lines[0] <= line <= line_table.lines[-1]:
+                return frame
+        return None
+
     def on_goto_request(self, py_db, request):
         target_id = int(request.arguments.targetId)
         thread_id = request.arguments.threadId
@@ -946,5 +1082,87 @@ class _PyDevJsonCommandProcessor(object):
         response = pydevd_base_schema.build_response(request, kwargs={'body': body})
         return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
+    def on_pydevdstartprofiling_request(self, py_db, request):
+        arguments = request.arguments  # : :type arguments: PydevdStartProfilingArguments
+        interval = arguments.interval if arguments.interval is not None else DEFAULT_INTERVAL
+        clock = arguments.clock if arguments.clock is not None else CLOCK_WALL
+
+        message = None
+        if self._sampling_profiler is not None:
+            message = 'Profiling already started.'
+        elif interval <= 0:
+            message = 'Expected interval to be > 0. Found: %s' % (interval,)
+        elif clock not in (CLOCK_WALL, CLOCK_CPU):
+            message = 'Unexpected clock: %s' % (clock,)
+        elif clock == CLOCK_CPU and not can_use_cpu_clock():
+            message = 'The cpu clock is not available in this platform.'
+
+        if message is not None:
+            response = pydevd_base_schema.build_response(
+                request, kwargs={'body': {}, 'success': False, 'message': message})
+            return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+        self._sampling_profiler = SamplingProfiler(interval, clock)
+        self._sampling_profiler.start()
+
+        response = pydevd_base_schema.build_response(request, kwargs={'body': {}})
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+    def on_pydevdstopprofiling_request(self, py_db, request):
+        arguments = request.arguments  # : :type arguments: PydevdStopProfilingArguments
+        profile_format = arguments.format if arguments.format is not None else 'collapsed'
+
+        message = None
+        if self._sampling_profiler is None:
+            message = 'Profiling not started.'
+        elif profile_format not in ('collapsed', 'speedscope'):
+            message = 'Unexpected format: %s' % (profile_format,)
+
+        if message is not None:
+            body = pydevd_schema.PydevdStopProfilingResponseBody(format=profile_format, profile='', samples=0)
+            response = pydevd_base_schema.build_response(
+                request, kwargs={'body': body, 'success': False, 'message': message})
+            return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+        sampling_profiler = self._sampling_profiler
+        self._sampling_profiler = None
+        sampling_profiler.stop()
+
+        if profile_format == 'speedscope':
+            profile = json.dumps(sampling_profiler.to_speedscope())
+        else:
+            profile = sampling_profiler.to_collapsed()
+
+        body = pydevd_schema.PydevdStopProfilingResponseBody(
+            format=profile_format,
+            profile=profile,
+            samples=sampling_profiler.samples,
+        )
+        response = pydevd_base_schema.build_response(request, kwargs={'body': body})
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+    def on_pydevdgetconcurrencyevents_request(self, py_db, request):
+        if py_db.thread_analyser is None and py_db.asyncio_analyser is None:
+            body = pydevd_schema.PydevdGetConcurrencyEventsResponseBody(trace='', events=0, dropped=0)
+            response = pydevd_base_schema.build_response(
+                request,
+                kwargs={
+                    'body': body,
+                    'success': False,
+                    'message': 'The concurrency analyser is not enabled.'
+                })
+            return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+        from pydevd_concurrency_analyser.pydevd_concurrency_events import get_concurrency_events
+        concurrency_events = get_concurrency_events()
+        trace = concurrency_events.to_chrome_trace()
+        body = pydevd_schema.PydevdGetConcurrencyEventsResponseBody(
+            trace=json.dumps(trace),
+            events=len(trace['traceEvents']),
+            dropped=concurrency_events.dropped,
+        )
+        response = pydevd_base_schema.build_response(request, kwargs={'body': body})
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
 
 process_net_command_json = _PyDevJsonCommandProcessor(pydevd_base_schema.from_json).process_net_command_json
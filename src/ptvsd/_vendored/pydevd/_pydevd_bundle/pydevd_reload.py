@@ -99,12 +99,14 @@ target namespace.
 """
 
 import imp
+import operator
 from _pydev_bundle.pydev_imports import Exec
 from _pydevd_bundle import pydevd_dont_trace
 import sys
 import traceback
 import types
 from _pydev_bundle import pydev_log
+from _pydev_imps._pydev_saved_modules import time
 
 NO_DEBUG = 0
 LEVEL1 = 1
@@ -149,16 +151,47 @@ def notify_error(*args):
     write_err(*args)
 
 
+def _get_fingerprint_attrs():
+    code = _get_fingerprint_attrs.__code__ if hasattr(_get_fingerprint_attrs, '__code__') else _get_fingerprint_attrs.func_code
+    attrs = []
+    for d in dir(code):
+        # Line numbers and the qualified name (which has the name of the class where the
+        # function is defined) aren't taken into account. Methods (i.e.: co_lines, replace)
+        # are skipped too and constants are handled separately (to handle nested code objects).
+        if d.startswith('_') or 'lineno' in d or d in ('co_qualname', 'co_consts') or callable(getattr(code, d)):
+            continue
+        attrs.append(d)
+    return tuple(attrs)
+
+
+_get_fingerprint_values = operator.attrgetter(*_get_fingerprint_attrs())
+
+
+#=======================================================================================================================
+# code_fingerprint
+#=======================================================================================================================
+def code_fingerprint(code):
+    '''
+    :return tuple:
+        A fingerprint of the code object (its bytecode, constants, names, etc.), so, code objects
+        which have the same fingerprint are equivalent (nested code objects in the constants are
+        replaced by their own fingerprint).
+    '''
+    consts = code.co_consts
+    # Types are also compared as 1 == 1.0 == True.
+    consts_types = tuple(map(type, consts))
+    if types.CodeType in consts_types:
+        consts = tuple(
+            code_fingerprint(const) if const_type is types.CodeType else const
+            for const, const_type in zip(consts, consts_types))
+    return _get_fingerprint_values(code) + (consts, consts_types)
+
+
 #=======================================================================================================================
 # code_objects_equal
 #=======================================================================================================================
 def code_objects_equal(code0, code1):
-    for d in dir(code0):
-        if d.startswith('_') or 'lineno' in d:
-            continue
-        if getattr(code0, d) != getattr(code1, d):
-            return False
-    return True
+    return code_fingerprint(code0) == code_fingerprint(code1)
 
 
 #=======================================================================================================================
@@ -171,12 +204,21 @@ def xreload(mod):
 
     Returns a boolean indicating whether a change was done.
     """
+    return xreload_module(mod).found_change
+
+
+def xreload_module(mod):
+    """Reload a module in place, updating classes, methods and functions.
+
+    mod: a module object
+
+    Returns the Reload applied (with the info on what changed and the time it took).
+    """
     r = Reload(mod)
     r.apply()
-    found_change = r.found_change
-    r = None
+    r.mod = None
     pydevd_dont_trace.clear_trace_filter_cache()
-    return found_change
+    return r
 
 # This isn't actually used... Initially I planned to reload variables which are immutable on the
 # namespace, but this can destroy places where we're saving state, which may not be what we want,
@@ -201,7 +243,21 @@ class Reload:
         self.mod = mod
         self.found_change = False
 
+        # Number of functions whose code was compared and number of functions whose code changed.
+        self.functions_checked = 0
+        self.functions_changed = 0
+
+        # Time (in seconds) to reload the module.
+        self.elapsed = 0.
+
     def apply(self):
+        initial_time = time.time()
+        try:
+            self._apply()
+        finally:
+            self.elapsed = time.time() - initial_time
+
+    def _apply(self):
         mod = self.mod
         self._on_finish_callbacks = []
         try:
@@ -367,9 +423,11 @@ class Reload:
     # All of the following functions have the same signature as _update()
 
     def _update_function(self, oldfunc, newfunc):
-        """Update a function object."""
-        oldfunc.__doc__ = newfunc.__doc__
-        oldfunc.__dict__.update(newfunc.__dict__)
+        """Update a function object (only what changed is updated)."""
+        if oldfunc.__doc__ != newfunc.__doc__:
+            oldfunc.__doc__ = newfunc.__doc__
+        if newfunc.__dict__:
+            oldfunc.__dict__.update(newfunc.__dict__)
 
         try:
             newfunc.__code__
@@ -380,15 +438,25 @@ class Reload:
 
         old_code = getattr(oldfunc, attr_name)
         new_code = getattr(newfunc, attr_name)
+        self.functions_checked += 1
         if not code_objects_equal(old_code, new_code):
             notify_info0('Updated function code:', oldfunc)
             setattr(oldfunc, attr_name, new_code)
+            self.functions_changed += 1
             self.found_change = True
 
-        try:
-            oldfunc.__defaults__ = newfunc.__defaults__
-        except AttributeError:
-            oldfunc.func_defaults = newfunc.func_defaults
+        for defaults_attr_name in ('__defaults__', '__kwdefaults__'):
+            if not hasattr(newfunc, defaults_attr_name):
+                continue  # i.e.: no __kwdefaults__ on Python 2.
+
+            old_defaults = getattr(oldfunc, defaults_attr_name)
+            new_defaults = getattr(newfunc, defaults_attr_name)
+            try:
+                changed = old_defaults != new_defaults
+            except:
+                changed = True
+            if changed:
+                setattr(oldfunc, defaults_attr_name, new_defaults)
 
         return oldfunc
 
@@ -0,0 +1,267 @@
+'''
+A sampling profiler which periodically collects the stacks of all the threads through
+`sys._current_frames()` (so, no tracing is needed and the profiled code runs at full speed).
+
+The samples of each thread are aggregated in a trie keyed by code objects, so, the memory
+used is proportional to the number of distinct stacks and not to the number of samples.
+
+The result may be exported in the collapsed stacks format (as used by flamegraph.pl and
+other flame graph tools) or in the speedscope format (https://www.speedscope.app).
+'''
+import sys
+
+from _pydev_bundle import pydev_log
+from _pydev_imps._pydev_saved_modules import threading
+from _pydev_imps._pydev_saved_modules import time
+from _pydevd_bundle.pydevd_comm import PyDBDaemonThread
+from _pydevd_bundle.pydevd_constants import dict_iter_items, dict_iter_values
+from pydevd_file_utils import get_abs_path_real_path_and_base_from_file
+
+try:
+    # Python 3.7 onwards (Unix only).
+    _pthread_getcpuclockid = time.pthread_getcpuclockid
+    _clock_gettime = time.clock_gettime
+except AttributeError:
+    _pthread_getcpuclockid = None
+
+DEFAULT_INTERVAL = 0.01
+
+CLOCK_WALL = 'wall'
+CLOCK_CPU = 'cpu'
+
+
+def can_use_cpu_clock():
+    '''
+    :return bool:
+        Whether the CPU time of each thread is available (needed for CLOCK_CPU).
+    '''
+    return _pthread_getcpuclockid is not None
+
+
+def _get_thread_cpu_time(thread_id):
+    try:
+        return _clock_gettime(_pthread_getcpuclockid(thread_id))
+    except (OSError, OverflowError):
+        return None  # The thread finished in the meanwhile.
+
+
+class _StackTrie(object):
+    '''
+    Each node is a list with [weight, children], where `weight` is the weight of the samples
+    whose innermost frame is the node and `children` maps a code object to the child node.
+    '''
+
+    def __init__(self, thread_name):
+        self.thread_name = thread_name
+        self._root = [0, {}]
+
+    def add(self, codes, weight):
+        '''
+        :param list(code) codes:
+            The codes of the stack (from the outermost to the innermost frame).
+        '''
+        node = self._root
+        for code in codes:
+            children = node[1]
+            try:
+                node = children[code]
+            except KeyError:
+                node = children[code] = [0, {}]
+        node[0] += weight
+
+    def iter_stacks(self):
+        '''
+        :return iterable(tuple(tuple(code), int)):
+            The stacks (from the outermost to the innermost frame) and their weight.
+        '''
+        pending = [((), self._root)]
+        while pending:
+            codes, node = pending.pop()
+            weight, children = node
+            if weight:
+                yield codes, weight
+            for code, child in dict_iter_items(children):
+                pending.append((codes + (code,), child))
+
+
+class SamplingProfiler(PyDBDaemonThread):
+
+    def __init__(self, interval=DEFAULT_INTERVAL, clock=CLOCK_WALL):
+        '''
+        :param float interval:
+            The interval (in seconds) between samples.
+
+        :param str clock:
+            CLOCK_WALL to weight each sample by the wall-clock time elapsed since the previous
+            sample or CLOCK_CPU to weight the sample of each thread by the CPU time used by that
+            thread since the previous sample (so, periods where a thread is waiting aren't
+            accounted). CLOCK_CPU is only available if `can_use_cpu_clock()`.
+        '''
+        if clock == CLOCK_CPU and not can_use_cpu_clock():
+            raise ValueError('The CPU time of each thread is not available in this platform.')
+
+        PyDBDaemonThread.__init__(self)
+        self.setName('pydevd.SamplingProfiler')
+        self.interval = interval
+        self.clock = clock
+        self.samples = 0
+
+        self._thread_id_to_trie = {}
+        # Thread id -> CPU time of the thread in the previous sample (only for CLOCK_CPU).
+        self._thread_id_to_cpu_time = {}
+        self._stop_event = threading.Event()
+
+    def _on_run(self):
+        if self.clock == CLOCK_CPU:
+            # The CPU time used before profiling started isn't accounted.
+            for thread_id in sys._current_frames():
+                cpu_time = _get_thread_cpu_time(thread_id)
+                if cpu_time is not None:
+                    self._thread_id_to_cpu_time[thread_id] = cpu_time
+
+        last_time = time.time()
+        while not self.killReceived:
+            self._stop_event.wait(self.interval)
+            if self._stop_event.is_set():
+                break
+
+            curr_time = time.time()
+            # Weights are kept in microseconds.
+            weight = int((curr_time - last_time) * 1000000)
+            last_time = curr_time
+            try:
+                self._take_sample(weight)
+            except:
+                pydev_log.exception('Error taking sample.')
+
+    def _take_sample(self, weight):
+        '''
+        :param int weight:
+            The wall-clock time (in microseconds) since the previous sample (used as the weight
+            of the sample of each thread for CLOCK_WALL).
+        '''
+        thread_id_to_thread = dict((t.ident, t) for t in threading.enumerate())
+        thread_id_to_trie = self._thread_id_to_trie
+
+        use_cpu_clock = self.clock == CLOCK_CPU
+        last_thread_id_to_cpu_time = self._thread_id_to_cpu_time
+        thread_id_to_cpu_time = {}
+
+        for thread_id, frame in dict_iter_items(sys._current_frames()):
+            thread = thread_id_to_thread.get(thread_id)
+            if getattr(thread, 'is_pydev_daemon_thread', False):
+                continue
+
+            if use_cpu_clock:
+                cpu_time = _get_thread_cpu_time(thread_id)
+                if cpu_time is None:
+                    continue
+                thread_id_to_cpu_time[thread_id] = cpu_time
+                # A thread which wasn't there in the previous sample started after it.
+                thread_weight = int((cpu_time - last_thread_id_to_cpu_time.get(thread_id, 0.)) * 1000000)
+            else:
+                thread_weight = weight
+
+            if thread_weight <= 0:
+                continue
+
+            codes = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            codes.reverse()
+
+            try:
+                trie = thread_id_to_trie[thread_id]
+            except KeyError:
+                thread_name = thread.name if thread is not None else 'Thread-%s' % (thread_id,)
+                trie = thread_id_to_trie[thread_id] = _StackTrie(thread_name)
+            trie.add(codes, thread_weight)
+
+        if use_cpu_clock:
+            self._thread_id_to_cpu_time = thread_id_to_cpu_time
+        self.samples += 1
+
+    def stop(self):
+        '''
+        Stops sampling (the collected samples are still available afterwards).
+        '''
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(max(1., self.interval * 2))
+
+    def _get_tries(self):
+        # Only available after stopped (there's no lock as the sampler thread is the only
+        # one changing it).
+        return sorted(dict_iter_values(self._thread_id_to_trie), key=lambda trie: trie.thread_name)
+
+    def to_collapsed(self):
+        '''
+        :return str:
+            One line per stack with the thread name and the frames (from the outermost to the
+            innermost) separated by ';' followed by the weight in microseconds.
+        '''
+        code_to_name = {}
+
+        def get_name(code):
+            try:
+                return code_to_name[code]
+            except KeyError:
+                base = get_abs_path_real_path_and_base_from_file(code.co_filename)[2]
+                name = code_to_name[code] = ('%s (%s:%s)' % (code.co_name, base, code.co_firstlineno)).replace(';', ',')
+                return name
+
+        lines = []
+        for trie in self._get_tries():
+            thread_name = trie.thread_name.replace(';', ',')
+            for codes, weight in trie.iter_stacks():
+                lines.append('%s %s' % (';'.join([thread_name] + [get_name(code) for code in codes]), weight))
+        lines.sort()
+        return '\n'.join(lines)
+
+    def to_speedscope(self):
+        '''
+        :return dict:
+            The profile in the speedscope file format (one sampled profile per thread).
+        '''
+        frames = []
+        code_to_frame_index = {}
+
+        def get_frame_index(code):
+            try:
+                return code_to_frame_index[code]
+            except KeyError:
+                frame_index = code_to_frame_index[code] = len(frames)
+                frames.append({
+                    'name': code.co_name,
+                    'file': get_abs_path_real_path_and_base_from_file(code.co_filename)[0],
+                    'line': code.co_firstlineno,
+                })
+                return frame_index
+
+        profiles = []
+        for trie in self._get_tries():
+            samples = []
+            weights = []
+            for codes, weight in trie.iter_stacks():
+                samples.append([get_frame_index(code) for code in codes])
+                weights.append(weight)
+
+            profiles.append({
+                'type': 'sampled',
+                'name': trie.thread_name,
+                'unit': 'microseconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights,
+            })
+
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'exporter': 'pydevd',
+            'name': 'pydevd sampling profile (%s clock)' % (self.clock,),
+            'activeProfileIndex': 0,
+            'shared': {'frames': frames},
+            'profiles': profiles,
+        }
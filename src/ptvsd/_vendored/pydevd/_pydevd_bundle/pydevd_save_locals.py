@@ -10,6 +10,8 @@ try:
 except:
     frame_type = type(sys._getframe())
 
+_MISSING = object()
+
 
 def is_save_locals_available():
     return save_locals_impl is not None
@@ -33,6 +35,46 @@ def save_locals(frame):
             pass
 
 
+def take_locals_snapshot(frame, f_locals):
+    """
+    :param dict f_locals:
+        The `frame.f_locals` which will be used to execute some code (note that it must be the
+        same dict: accessing `frame.f_locals` again would overwrite the changes done in it).
+
+    :return dict|None:
+        A shallow copy of the locals to be passed to `save_locals_if_changed` after the code
+        is executed (None if the locals of the frame are its globals, in which case there's
+        nothing to save).
+    """
+    if f_locals is frame.f_globals:
+        return None
+    return f_locals.copy()
+
+
+def save_locals_if_changed(frame, f_locals, snapshot):
+    """
+    Same as `save_locals`, but only done if some variable in `f_locals` was added, removed or
+    bound to a different object after the snapshot was taken (objects changed in-place don't
+    need to be saved as the frame already references them).
+
+    :return bool:
+        Whether the locals were saved.
+    """
+    if snapshot is None:
+        return False
+
+    if len(snapshot) == len(f_locals):
+        get = snapshot.get
+        for key, value in f_locals.items():
+            if get(key, _MISSING) is not value:
+                break
+        else:
+            return False
+
+    save_locals(frame)
+    return True
+
+
 def make_save_locals_impl():
     """
     Factory for the 'save_locals_impl' method. This may seem like a complicated pattern but it is essential that the method is created at
@@ -8,9 +8,11 @@ else:
     trace._warn = lambda *args: None  # workaround for http://bugs.python.org/issue17143 (PY-8706)
 
 import os
+from _pydev_imps._pydev_saved_modules import threading
+from _pydev_imps._pydev_saved_modules import time
 from _pydevd_bundle.pydevd_comm import CMD_SIGNATURE_CALL_TRACE, NetCommand
 from _pydevd_bundle import pydevd_xml
-from _pydevd_bundle.pydevd_constants import xrange, dict_iter_items
+from _pydevd_bundle.pydevd_constants import xrange, dict_iter_items, dict_iter_values
 from _pydevd_bundle.pydevd_utils import get_clsname_for_code
 
 
@@ -87,10 +89,19 @@ def _modname(path):
 
 class SignatureFactory(object):
 
+    # If True, `on_call`/`on_return` are used instead of sending a message for each call.
+    is_sampling = False
+
     def __init__(self):
         self._caller_cache = {}
         self.cache = CallSignatureCache()
 
+    def flush(self, dbg):
+        '''
+        Sends the signatures which are still pending (nothing to do here as signatures are sent
+        as soon as they're collected).
+        '''
+
     def create_signature(self, frame, filename, with_args=True):
         try:
             _, modulename, funcname = self.file_module_function_of(frame)
@@ -130,6 +141,157 @@ class SignatureFactory(object):
         return filename, modulename, funcname
 
 
+class _SampledSignature(object):
+
+    def __init__(self, file, name, arg_names):
+        self.file = file
+        self.name = name
+        self.arg_names = arg_names
+        # One set of types for each argument.
+        self.arg_types = [set() for _ in arg_names]
+        self.return_types = set()
+        self.calls_since_sample = 0
+        self.last_sample_time = 0.
+        # Whether some type was found after the last flush.
+        self.changed = False
+
+    def to_signature(self):
+        signature = Signature(self.file, self.name)
+        for name, types in zip(self.arg_names, self.arg_types):
+            signature.add_arg(name, _union_of(types))
+        if self.return_types:
+            signature.return_type = _union_of(self.return_types)
+        return signature
+
+
+def _union_of(types):
+    if len(types) == 1:
+        return next(iter(types))
+    return 'Union[%s]' % (', '.join(sorted(types)),)
+
+
+class SamplingSignatureFactory(SignatureFactory):
+    '''
+    Instead of creating a signature for each call, the calls of each code object are sampled
+    (at most once every `sample_calls` calls and/or once every `sample_interval` seconds) and
+    the types found for each argument and for the return are aggregated (as a union of types).
+
+    The aggregated signatures which changed are sent in a single message on `flush()`
+    (which is also done automatically on sampled calls every `flush_interval` seconds).
+    '''
+
+    is_sampling = True
+
+    MAX_SAMPLED_FRAMES = 1000
+
+    def __init__(self, sample_calls=100, sample_interval=1., flush_interval=1.):
+        '''
+        :param int sample_calls:
+            Sample a code object once every `sample_calls` calls (0 to sample only based on time).
+
+        :param float sample_interval:
+            Sample a code object if `sample_interval` seconds elapsed since its last sample
+            (0 to sample only based on the number of calls).
+        '''
+        SignatureFactory.__init__(self)
+        self.cache = None
+        self.sample_calls = sample_calls
+        self.sample_interval = sample_interval
+        self.flush_interval = flush_interval
+
+        self._code_to_sampled = {}
+        # (id(frame), frame.f_code) -> _SampledSignature for the frames whose return type must be
+        # collected (entries whose return isn't seen -- i.e.: if the frame stops being traced -- are
+        # discarded when there are more than MAX_SAMPLED_FRAMES entries).
+        self._frame_key_to_sampled = {}
+        self._lock = threading.Lock()
+        self._last_flush_time = time.time()
+
+    def _should_sample(self, sampled):
+        sampled.calls_since_sample += 1
+        if self.sample_calls and sampled.calls_since_sample >= self.sample_calls:
+            return True
+        if self.sample_interval and time.time() - sampled.last_sample_time >= self.sample_interval:
+            return True
+        return False
+
+    def on_call(self, dbg, frame, filename):
+        '''
+        :return bool:
+            True if the call was sampled and its return must be traced.
+        '''
+        code = frame.f_code
+        sampled = self._code_to_sampled.get(code)
+        if sampled is None:
+            try:
+                _, _, funcname = self.file_module_function_of(frame)
+            except:
+                pydev_log.exception()
+                return False
+            sampled = self._code_to_sampled[code] = _SampledSignature(
+                filename, funcname, code.co_varnames[:code.co_argcount])
+
+        elif not self._should_sample(sampled):
+            return False
+
+        now = time.time()
+        sampled.calls_since_sample = 0
+        sampled.last_sample_time = now
+        try:
+            f_locals = frame.f_locals
+            arg_types = [get_type_of_value(f_locals[name], recursive=True) for name in sampled.arg_names]
+        except:
+            pydev_log.exception()
+            return False
+
+        with self._lock:
+            for types, arg_type in zip(sampled.arg_types, arg_types):
+                if arg_type not in types:
+                    types.add(arg_type)
+                    sampled.changed = True
+
+        if now - self._last_flush_time >= self.flush_interval:
+            self.flush(dbg)
+
+        if dbg.break_on_caught_exceptions or dbg.has_plugin_exception_breaks:
+            # A frame which can be skipped is only traced for exceptions in this case (so,
+            # its return isn't seen).
+            return False
+
+        frame_key_to_sampled = self._frame_key_to_sampled
+        if len(frame_key_to_sampled) >= self.MAX_SAMPLED_FRAMES:
+            frame_key_to_sampled.clear()
+        frame_key_to_sampled[(id(frame), code)] = sampled
+        return True
+
+    def on_return(self, dbg, frame, filename, return_value):
+        sampled = self._frame_key_to_sampled.pop((id(frame), frame.f_code), None)
+        if sampled is None:
+            return False
+
+        return_type = get_type_of_value(return_value, recursive=True)
+        if return_type not in sampled.return_types:
+            with self._lock:
+                sampled.return_types.add(return_type)
+                sampled.changed = True
+        return True
+
+    def flush(self, dbg):
+        '''
+        Sends the signatures which changed since the last flush in a single message.
+        '''
+        with self._lock:
+            self._last_flush_time = time.time()
+            signatures = []
+            for sampled in dict_iter_values(self._code_to_sampled):
+                if sampled.changed:
+                    sampled.changed = False
+                    signatures.append(sampled.to_signature())
+
+        if signatures and dbg.writer is not None:
+            dbg.writer.add_command(create_signatures_message(signatures))
+
+
 def get_signature_info(signature):
     return signature.file, signature.name, ' '.join([arg[1] for arg in signature.args])
 
@@ -158,23 +320,33 @@ class CallSignatureCache(object):
 
 
 def create_signature_message(signature):
+    return create_signatures_message([signature])
+
+
+def create_signatures_message(signatures):
     cmdTextList = ["<xml>"]
 
-    cmdTextList.append('<call_signature file="%s" name="%s">' % (pydevd_xml.make_valid_xml_value(signature.file), pydevd_xml.make_valid_xml_value(signature.name)))
+    for signature in signatures:
+        cmdTextList.append('<call_signature file="%s" name="%s">' % (pydevd_xml.make_valid_xml_value(signature.file), pydevd_xml.make_valid_xml_value(signature.name)))
 
-    for arg in signature.args:
-        cmdTextList.append('<arg name="%s" type="%s"></arg>' % (pydevd_xml.make_valid_xml_value(arg[0]), pydevd_xml.make_valid_xml_value(arg[1])))
+        for arg in signature.args:
+            cmdTextList.append('<arg name="%s" type="%s"></arg>' % (pydevd_xml.make_valid_xml_value(arg[0]), pydevd_xml.make_valid_xml_value(arg[1])))
 
-    if signature.return_type is not None:
-        cmdTextList.append('<return type="%s"></return>' % (pydevd_xml.make_valid_xml_value(signature.return_type)))
+        if signature.return_type is not None:
+            cmdTextList.append('<return type="%s"></return>' % (pydevd_xml.make_valid_xml_value(signature.return_type)))
 
-    cmdTextList.append("</call_signature></xml>")
+        cmdTextList.append("</call_signature>")
+
+    cmdTextList.append("</xml>")
     cmdText = ''.join(cmdTextList)
     return NetCommand(CMD_SIGNATURE_CALL_TRACE, 0, cmdText)
 
 
 def send_signature_call_trace(dbg, frame, filename):
     if dbg.signature_factory and dbg.in_project_scope(filename):
+        if dbg.signature_factory.is_sampling:
+            return dbg.signature_factory.on_call(dbg, frame, filename)
+
         signature = dbg.signature_factory.create_signature(frame, filename)
         if signature is not None:
             if dbg.signature_factory.cache is not None:
@@ -193,6 +365,9 @@ def send_signature_call_trace(dbg, frame, filename):
 
 def send_signature_return_trace(dbg, frame, filename, return_value):
     if dbg.signature_factory and dbg.in_project_scope(filename):
+        if dbg.signature_factory.is_sampling:
+            return dbg.signature_factory.on_return(dbg, frame, filename, return_value)
+
         signature = dbg.signature_factory.create_signature(frame, filename, with_args=False)
         signature.return_type = get_type_of_value(return_value, recursive=True)
         dbg.writer.add_command(create_signature_message(signature))
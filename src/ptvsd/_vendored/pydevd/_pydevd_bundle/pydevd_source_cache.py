@@ -0,0 +1,201 @@
+'''
+Cache of the sources sent to the client (for 'source' requests).
+
+The client asks for the same source whenever it renders a stack with it, so, the contents
+are cached (keyed by the modification time and size of the file, so, a changed file is read
+again) up to a maximum number of characters (the least recently used contents are evicted).
+
+Big files are decoded directly from a memory mapped file (to avoid an intermediary copy of
+the bytes) and files inside a .zip/.egg are read from the archive.
+'''
+from collections import OrderedDict
+import codecs
+import io
+import itertools
+import linecache
+import os
+
+from _pydev_bundle import pydev_log
+from _pydev_imps._pydev_saved_modules import threading
+from _pydevd_bundle.pydevd_constants import IS_PY2, SOURCE_CACHE_MAX_SIZE
+import pydevd_file_utils
+
+try:
+    import mmap
+except ImportError:
+    mmap = None  # i.e.: Jython
+
+try:
+    from tokenize import detect_encoding
+except ImportError:
+    detect_encoding = None  # Python 2 (contents are kept as bytes).
+
+# Files with at least this size (in bytes) are memory mapped to be read.
+MMAP_MIN_SIZE = 1024 * 1024
+
+# Default number of characters sent in a 'pydevdSourceChunk' response.
+DEFAULT_SOURCE_CHUNK_SIZE = 1024 * 1024
+
+
+def _get_encoding(head):
+    if detect_encoding is None:
+        return None
+    try:
+        return detect_encoding(io.BytesIO(head).readline)[0]
+    except SyntaxError:
+        # i.e.: invalid coding cookie (or not a python file).
+        return 'utf-8'
+
+
+def _decode(contents, encoding):
+    '''
+    :param bytes|memoryview contents:
+        The bytes to be decoded.
+    '''
+    if encoding is None:
+        contents = bytes(contents)
+    else:
+        contents = codecs.decode(contents, encoding, 'replace')
+
+    # Same as reading in text mode (universal newlines).
+    if '\r' in contents:
+        contents = contents.replace('\r\n', '\n').replace('\r', '\n')
+    return contents
+
+
+def _read_file(filename, size):
+    with open(filename, 'rb') as stream:
+        if mmap is None or size < MMAP_MIN_SIZE:
+            contents = stream.read()
+            return _decode(contents, _get_encoding(contents[:1024]))
+
+        mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            encoding = _get_encoding(mapped[:1024])
+            if IS_PY2:
+                return _decode(mapped[:], encoding)
+
+            view = memoryview(mapped)
+            try:
+                return _decode(view, encoding)
+            finally:
+                view.release()
+        finally:
+            mapped.close()
+
+
+def _read_from_linecache(filename):
+    # The file might not exist at all, but, it might still be available in the linecache
+    # (i.e.: an IPython cell).
+    lines = (linecache.getline(filename, i) for i in itertools.count(1))
+    lines = itertools.takewhile(bool, lines)  # empty lines are '\n', EOF is ''
+
+    # If we didn't get at least one line back, return None so that it's reported as
+    # an error and not as an empty file.
+    return ''.join(lines) or None
+
+
+class SourceCache(object):
+
+    def __init__(self, max_size=SOURCE_CACHE_MAX_SIZE):
+        '''
+        :param int max_size:
+            The maximum number of characters kept in the cache (contents bigger than that
+            aren't cached).
+        '''
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+        # filename -> (key, contents)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_cached(self, filename, key):
+        with self._lock:
+            entry = self._cache.pop(filename, None)
+            if entry is None:
+                return None
+
+            if entry[0] != key:
+                self.size -= len(entry[1])
+                return None
+
+            # Reinsert as the most recently used.
+            self._cache[filename] = entry
+            return entry[1]
+
+    def _add_to_cache(self, filename, key, contents):
+        if len(contents) > self.max_size:
+            return
+
+        with self._lock:
+            old_entry = self._cache.pop(filename, None)
+            if old_entry is not None:
+                self.size -= len(old_entry[1])
+
+            while self._cache and self.size + len(contents) > self.max_size:
+                _filename, (_key, evicted) = self._cache.popitem(last=False)
+                self.size -= len(evicted)
+
+            self._cache[filename] = (key, contents)
+            self.size += len(contents)
+
+    def get_contents(self, filename):
+        '''
+        :return str|None:
+            The contents of the given file or None if it's not available.
+        '''
+        try:
+            stat = os.stat(filename)
+        except (OSError, IOError):
+            stat = None
+
+        if stat is not None:
+
+            def read():
+                return _read_file(filename, stat.st_size)
+
+        else:
+            zip_file_and_member = pydevd_file_utils.get_zip_file_and_inner_path(filename)
+            if zip_file_and_member is None:
+                return _read_from_linecache(filename)
+
+            zip_file_obj, member_name = zip_file_and_member
+            try:
+                stat = os.stat(zip_file_obj.filename)
+            except (OSError, IOError):
+                return _read_from_linecache(filename)
+
+            def read():
+                contents = zip_file_obj.read(member_name)
+                return _decode(contents, _get_encoding(contents[:1024]))
+
+        key = (stat.st_mtime, stat.st_size)
+        contents = self._get_cached(filename, key)
+        if contents is not None:
+            self.hits += 1
+            return contents
+
+        self.misses += 1
+        try:
+            contents = read()
+        except:
+            pydev_log.debug('Unable to read: %s', filename)
+            return _read_from_linecache(filename)
+
+        self._add_to_cache(filename, key, contents)
+        return contents
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.size = 0
+
+
+_source_cache = SourceCache()
+
+
+def get_source_cache():
+    return _source_cache
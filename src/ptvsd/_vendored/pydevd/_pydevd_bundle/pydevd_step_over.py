@@ -0,0 +1,87 @@
+'''
+Tracing used while a step over is in progress.
+
+Usually the thread trace function creates a `PyDBFrame` for each frame called (only to
+discover later on that it could be skipped). When stepping over a line which calls into
+heavy code this is a big overhead, so, while the step over is in progress, the thread
+trace function is replaced by a `StepOverTracer`, which leaves the called frames untraced
+unless they're in a file with some breakpoint (the frame being stepped and its callers
+already have their `f_trace` set, so, their line/return events are still received).
+
+The regular tracing is restored as soon as the step over finishes or is changed (i.e.:
+when returning from the stepped frame the step over becomes a step into).
+'''
+from _pydevd_bundle.pydevd_comm_constants import CMD_STEP_OVER, CMD_STEP_OVER_MY_CODE
+from _pydevd_bundle.pydevd_constants import STATE_RUN
+from pydevd_file_utils import get_abs_path_real_path_and_base_from_frame, NORM_PATHS_AND_BASE_CONTAINER
+import pydevd_tracing
+
+
+class StepOverTracer(object):
+
+    def __init__(self, py_db, info, thread_trace_func):
+        '''
+        :param PyDB py_db:
+            The debugger.
+
+        :param PyDBAdditionalThreadInfo info:
+            The info of the thread doing the step over.
+
+        :param thread_trace_func:
+            The trace function to be restored when the step over finishes.
+        '''
+        self._py_db = py_db
+        self._info = info
+        self._thread_trace_func = thread_trace_func
+        self._mtime = py_db.mtime
+
+        # co_filename -> bool (whether the file has some breakpoint).
+        self._filename_to_has_breakpoints = {}
+
+    def _restore_thread_trace_func(self, frame, event, arg):
+        pydevd_tracing.SetTrace(self._thread_trace_func)
+        return self._thread_trace_func(frame, event, arg)
+
+    def _has_breakpoints(self, frame):
+        co_filename = frame.f_code.co_filename
+        try:
+            return self._filename_to_has_breakpoints[co_filename]
+        except KeyError:
+            try:
+                abs_path_real_path_and_base = NORM_PATHS_AND_BASE_CONTAINER[co_filename]
+            except:
+                abs_path_real_path_and_base = get_abs_path_real_path_and_base_from_frame(frame)
+
+            has_breakpoints = self._filename_to_has_breakpoints[co_filename] = bool(
+                self._py_db.breakpoints.get(abs_path_real_path_and_base[1]))
+            return has_breakpoints
+
+    def __call__(self, frame, event, arg):
+        # Note: only 'call' events get here (the other events go to the frame.f_trace).
+        info = self._info
+        py_db = self._py_db
+        if info.pydev_step_cmd not in (CMD_STEP_OVER, CMD_STEP_OVER_MY_CODE) or \
+                info.pydev_state != STATE_RUN or py_db._finish_debugging_session:
+            # The step over finished (or some other command was issued for the thread).
+            return self._restore_thread_trace_func(frame, event, arg)
+
+        if self._mtime != py_db.mtime:
+            # Breakpoints changed while stepping.
+            if not py_db.can_skip_callees_on_step_over():
+                return self._restore_thread_trace_func(frame, event, arg)
+            self._mtime = py_db.mtime
+            self._filename_to_has_breakpoints.clear()
+
+        stop_frame = info.pydev_step_stop
+        if frame is stop_frame:
+            # i.e.: a generator being stepped over is resumed.
+            return self._thread_trace_func(frame, event, arg)
+
+        if py_db.show_return_values and frame.f_back is stop_frame:
+            # Return values of the frames called from the stepped frame must be shown.
+            return self._thread_trace_func(frame, event, arg)
+
+        if self._has_breakpoints(frame):
+            return self._thread_trace_func(frame, event, arg)
+
+        return None
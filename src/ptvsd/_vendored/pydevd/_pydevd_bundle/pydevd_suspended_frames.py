@@ -142,6 +142,7 @@ class _ObjectVariable(_AbstractVariable):
         if children_variable is None:
             return None
 
+        py_db.suspended_frames_manager.clear_completions_caches()
         var_data = children_variable.get_var_data()
         evaluate_name = var_data.get('evaluateName')
 
@@ -257,6 +258,15 @@ class _FramesTracker(object):
 
         self._variable_reference_to_variable = {}
 
+        # Completions indexes reused while suspended (see: _pydev_completer.generate_completions).
+        self.completions_cache = {}
+
+        # Debug consoles reused while suspended (see: pydevd_console.get_interactive_console).
+        self.console_cache = {}
+
+        # Heap snapshot used for referrers queries while suspended (see: pydevd_memory_inspector).
+        self.heap_snapshot = None
+
     def _register_variable(self, variable):
         variable_reference = variable.get_variable_reference()
         self._variable_reference_to_variable[variable_reference] = variable
@@ -339,6 +349,9 @@ class _FramesTracker(object):
             self._main_thread_id = None
             self._suspended_frames_manager = None
             self._variable_reference_to_variable.clear()
+            self.completions_cache.clear()
+            self.console_cache.clear()
+            self.heap_snapshot = None
 
     def get_topmost_frame_and_frame_id_to_line(self, thread_id):
         with self._lock:
@@ -411,6 +424,15 @@ class SuspendedFramesManager(object):
     def get_frame_tracker(self, thread_id):
         return self._thread_id_to_tracker.get(thread_id)
 
+    def clear_completions_caches(self):
+        '''
+        Called when code is executed in a suspended frame or a variable is changed, so that
+        the completions are computed again (the caches of all the suspended threads are
+        cleared as the globals or the objects changed may be shared by other frames).
+        '''
+        for _thread_id, tracker in list(dict_iter_items(self._thread_id_to_tracker)):
+            tracker.completions_cache.clear()
+
     def get_variable(self, variable_reference):
         '''
         :raises KeyError
@@ -426,6 +448,18 @@ class SuspendedFramesManager(object):
             return None
         return tracker.get_topmost_frame_and_frame_id_to_line(thread_id)
 
+    def get_suspended_topmost_frames(self):
+        '''
+        :return list(frame):
+            The topmost frame of each suspended thread.
+        '''
+        frames = []
+        for thread_id, tracker in list(dict_iter_items(self._thread_id_to_tracker)):
+            frame_and_frame_id_to_line = tracker.get_topmost_frame_and_frame_id_to_line(thread_id)
+            if frame_and_frame_id_to_line is not None:
+                frames.append(frame_and_frame_id_to_line[0])
+        return frames
+
     @contextmanager
     def track_frames(self, py_db):
         tracker = _FramesTracker(self, py_db)
@@ -0,0 +1,166 @@
+'''
+Support to interrupt evaluations which take longer than a given time budget.
+
+Evaluations are done in the suspended thread (usually from inside the trace function, where
+tracing is disabled), so, the interruption is done from a watchdog thread by raising an
+asynchronous exception in the evaluating thread (only available in CPython).
+'''
+import sys
+
+from _pydev_bundle import pydev_log
+from _pydev_imps._pydev_saved_modules import threading
+from _pydev_imps._pydev_saved_modules import time
+from _pydevd_bundle.pydevd_comm import PyDBDaemonThread
+from _pydevd_bundle.pydevd_constants import IS_CPYTHON
+
+
+class EvaluationTimeoutError(BaseException):
+    '''
+    Raised in the evaluating thread when its time budget is exceeded (a BaseException so
+    that it's not caught by an `except Exception` in the evaluated code).
+    '''
+
+
+_set_async_exc = None
+
+
+def _get_set_async_exc():
+    global _set_async_exc
+    if _set_async_exc is None:
+        try:
+            import ctypes
+            set_async_exc = ctypes.pythonapi.PyThreadState_SetAsyncExc
+            # The thread id is an unsigned long from Python 3.7 onwards.
+            thread_id_type = ctypes.c_ulong if sys.version_info[:2] >= (3, 7) else ctypes.c_long
+
+            def set_async_exc_impl(thread_ident, exc):
+                return set_async_exc(thread_id_type(thread_ident), ctypes.py_object(exc))
+
+            _set_async_exc = set_async_exc_impl
+        except:
+            pydev_log.exception('Unable to interrupt evaluations with a time budget.')
+            _set_async_exc = False
+    return _set_async_exc
+
+
+def can_interrupt_evaluations():
+    return IS_CPYTHON and bool(_get_set_async_exc())
+
+
+def _raise_pending_interruption():
+    # The interpreter raises an asynchronous exception when it checks for pending calls, which is
+    # done at least in backward jumps (or every `sys.getcheckinterval()` instructions in Python 2),
+    # so, if the exception is still pending it's raised in this loop.
+    #
+    # Note: the exception isn't cleared with `PyThreadState_SetAsyncExc(id, NULL)` because in
+    # some versions (i.e.: 3.11) that leaves the eval breaker signaled without a pending exception,
+    # which makes traced code loop forever.
+    for _i in range(1000):
+        pass
+
+
+class EvaluationWatchdog(PyDBDaemonThread):
+    '''
+    Usage (in the thread doing the evaluations):
+
+        watchdog = EvaluationWatchdog(timeout)
+        watchdog.start()
+        try:
+            for expression in expressions:
+                try:
+                    watchdog.start_budget()
+                    try:
+                        ...  # Evaluate
+                    finally:
+                        watchdog.stop_budget()
+                except EvaluationTimeoutError:
+                    ...  # Report the timeout
+        finally:
+            watchdog.finish()
+
+    The EvaluationTimeoutError may be raised at any instruction of the evaluating thread while
+    it's being interrupted, so, the evaluating thread doesn't use locks in `stop_budget` (if the
+    exception was raised right after a lock was acquired, the lock would never be released) and the
+    watchdog sends the exception without holding its condition.
+    '''
+
+    def __init__(self, timeout):
+        '''
+        :param float timeout:
+            The time budget (in seconds) for each evaluation.
+        '''
+        PyDBDaemonThread.__init__(self)
+        self.setName('pydevd.EvaluationWatchdog')
+        self.timeout = timeout
+        self._thread_ident = threading.current_thread().ident
+        self._condition = threading.Condition()
+        self._finished = False
+
+        # Written only by the evaluating thread.
+        self._budget = None  # The id of the current budget (None if there's no evaluation running).
+        self._last_budget = 0
+        self._deadline = None
+
+        # Written only by the watchdog.
+        self._interrupting = False
+        self._interrupted_budget = None
+
+    def _on_run(self):
+        condition = self._condition
+        while True:
+            with condition:
+                while True:
+                    if self._finished or self.killReceived:
+                        return
+
+                    budget = self._budget
+                    if budget is None or budget == self._interrupted_budget:
+                        condition.wait()
+                        continue
+
+                    remaining = self._deadline - time.time()
+                    if remaining > 0:
+                        condition.wait(remaining)
+                        continue
+                    break
+
+            # Announce the interruption before checking that the budget is still the same
+            # (see: `stop_budget`).
+            self._interrupting = True
+            try:
+                if self._budget == budget:
+                    _get_set_async_exc()(self._thread_ident, EvaluationTimeoutError)
+                    self._interrupted_budget = budget
+            finally:
+                self._interrupting = False
+
+    def start_budget(self):
+        with self._condition:
+            self._last_budget += 1
+            self._deadline = time.time() + self.timeout
+            self._budget = self._last_budget
+            self._condition.notify()
+
+    def stop_budget(self):
+        '''
+        Must be called in the evaluating thread right after the evaluation (even if it
+        raised an exception).
+
+        Note: an EvaluationTimeoutError may still be raised while this function runs (if the
+        budget was exceeded and it wasn't raised yet), but never after it returns.
+        '''
+        budget = self._budget
+        self._budget = None
+
+        # Wait for an interruption in progress (after this point the watchdog can't interrupt
+        # this budget anymore as it checks the budget after announcing the interruption).
+        while self._interrupting:
+            time.sleep(0.001)
+
+        if self._interrupted_budget == budget:
+            _raise_pending_interruption()
+
+    def finish(self):
+        with self._condition:
+            self._finished = True
+            self._condition.notify()
@@ -375,6 +375,9 @@ class ThreadTracer(object):
         # cdef bint is_stepping;
         # cdef tuple abs_path_real_path_and_base;
         # cdef PyDBAdditionalThreadInfo additional_info;
+        # cdef dict user_code_index;
+        # cdef int is_user_code;
+        # cdef int back_is_user_code;
         # ENDIF
 
         # DEBUG = 'code_to_debug' in frame.f_code.co_filename
@@ -406,6 +409,30 @@ class ThreadTracer(object):
             if py_db.asyncio_analyser is not None:
                 py_db.asyncio_analyser.log_event(frame)
 
+            if pydev_step_cmd == CMD_STEP_INTO_MY_CODE:
+                # Fast path: library code called from library code is skipped with just a lookup
+                # in the user code index (which is per file, keyed by the normalized real path).
+                user_code_index = py_db.user_code_index
+                try:
+                    is_user_code = user_code_index[NORM_PATHS_AND_BASE_CONTAINER[frame.f_code.co_filename][1]]
+                except KeyError:
+                    is_user_code = py_db.index_user_code(frame)
+
+                if not is_user_code:
+                    back_frame = frame.f_back
+                    if back_frame is None:
+                        back_is_user_code = 0
+                    else:
+                        try:
+                            back_is_user_code = user_code_index[NORM_PATHS_AND_BASE_CONTAINER[back_frame.f_code.co_filename][1]]
+                        except KeyError:
+                            back_is_user_code = py_db.index_user_code(back_frame)
+
+                    if not back_is_user_code:
+                        if not _global_notify_skipped_step_in:
+                            notify_skipped_step_in_because_of_filters(py_db, frame)
+                        return None if event == 'call' else NO_FTRACE
+
             # Note: it's important that the context name is also given because we may hit something once
             # in the global context and another in the local context.
             frame_cache_key = (frame.f_code.co_firstlineno, frame.f_code.co_name, frame.f_code.co_filename)
@@ -12,6 +12,7 @@ try:
 except ImportError:
     from io import StringIO
 import sys  # @Reimport
+import types
 
 from _pydev_imps._pydev_saved_modules import threading
 import traceback
@@ -203,10 +204,160 @@ def custom_operation(dbg, thread_id, frame_id, scope, attrs, style, code_or_file
         pydev_log.exception()
 
 
+# (expression, mode) -> (code, names used in nested scopes)
+_compiled_cache = {}
+_MAX_COMPILED_CACHE_SIZE = 500
+
+
+def _iter_nested_codes(code):
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield const
+            for nested in _iter_nested_codes(const):
+                yield nested
+
+
+def _compile_cached(expression, mode):
+    '''
+    :return tuple(code, frozenset(str)):
+        The compiled expression and the names which may be accessed as globals by the scopes
+        nested in it (i.e.: lambdas, generators and comprehensions).
+
+    Note: the IDE evaluates the same (watch/hover) expressions on each stop, so, compiled
+    expressions are cached (compiling doesn't depend on the frame where it's evaluated).
+    '''
+    key = (expression, mode)
+    try:
+        return _compiled_cache[key]
+    except KeyError:
+        code = compile(expression, '<string>', mode)
+        nested_names = set()
+        for nested in _iter_nested_codes(code):
+            nested_names.update(nested.co_names)
+
+        if len(_compiled_cache) >= _MAX_COMPILED_CACHE_SIZE:
+            _compiled_cache.clear()
+        ret = _compiled_cache[key] = (code, frozenset(nested_names))
+        return ret
+
+
+class _EvalGlobals(dict):
+    '''
+    Globals used to evaluate code with nested scopes which use names from the frame locals
+    (nested scopes only see the globals and not the locals passed to `eval`). It only holds
+    those locals and the actual globals are resolved through `__missing__`.
+    '''
+
+    def __init__(self, f_globals, names_from_locals):
+        dict.__init__(self, names_from_locals)
+        self._f_globals = f_globals
+
+    def __missing__(self, key):
+        return self._f_globals[key]
+
+
+class _EvalLocals(object):
+    '''
+    Locals used along with `_EvalGlobals`: names are resolved in the frame locals and then in
+    the frame globals (the `_EvalGlobals` is not consulted by the top-level code as it's accessed
+    as a regular dict) and assignments go to the frame locals.
+    '''
+
+    def __init__(self, f_locals, f_globals):
+        self._f_locals = f_locals
+        self._f_globals = f_globals
+
+    def __getitem__(self, key):
+        try:
+            return self._f_locals[key]
+        except KeyError:
+            return self._f_globals[key]
+
+    def __setitem__(self, key, value):
+        self._f_locals[key] = value
+
+    def __delitem__(self, key):
+        del self._f_locals[key]
+
+    def __contains__(self, key):
+        return key in self._f_locals or key in self._f_globals
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        keys = set(self._f_globals)
+        keys.update(self._f_locals)
+        return list(keys)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+
+_layered_namespace_supported = None
+
+
+def _is_layered_namespace_supported():
+    '''
+    Checks whether a dict subclass used as globals has its `__missing__` called when names are
+    accessed as globals (i.e.: CPython 2 always accesses the globals as an exact dict).
+    '''
+    global _layered_namespace_supported
+    if _layered_namespace_supported is None:
+        try:
+            f_globals = {'a': 1}
+            _layered_namespace_supported = eval(
+                '[a for _ in (1,)]', _EvalGlobals(f_globals, {}), _EvalLocals({}, f_globals)) == [1]
+        except Exception:
+            _layered_namespace_supported = False
+    return _layered_namespace_supported
+
+
+def _get_eval_namespace(frame, compiled):
+    '''
+    :param tuple(code, frozenset(str))|None compiled:
+        The result of `_compile_cached` (None if the expression couldn't be compiled).
+
+    :return tuple(dict, mapping):
+        The globals and locals to be used to evaluate the expression in the given frame.
+    '''
+    f_globals = frame.f_globals
+    f_locals = frame.f_locals
+    if f_locals is f_globals:
+        # i.e.: module-level frame.
+        return f_globals, f_locals
+
+    if compiled is not None:
+        nested_names = compiled[1]
+        if not nested_names:
+            return f_globals, f_locals
+
+        names_from_locals = dict((name, f_locals[name]) for name in nested_names if name in f_locals)
+        if not names_from_locals:
+            return f_globals, f_locals
+
+        if _is_layered_namespace_supported():
+            return _EvalGlobals(f_globals, names_from_locals), _EvalLocals(f_locals, f_globals)
+
+    # Not using frame.f_globals because of https://sourceforge.net/tracker2/?func=detail&aid=2541355&group_id=85796&atid=577329
+    # (Names not resolved in generator expression in method)
+    # See message: http://mail.python.org/pipermail/python-list/2009-January/526522.html
+    updated_globals = {}
+    updated_globals.update(f_globals)
+    updated_globals.update(f_locals)  # locals later because it has precedence over the actual globals
+    return updated_globals, f_locals
+
+
 def eval_in_context(expression, globals, locals):
     result = None
     try:
-        result = eval(expression, globals, locals)
+        result = eval(_compile_cached(expression, 'eval')[0], globals, locals)
     except Exception:
         s = StringIO()
         traceback.print_exc(file=s)
@@ -247,35 +398,40 @@ def evaluate_expression(dbg, frame, expression, is_exec):
     if frame is None:
         return
 
-    # Not using frame.f_globals because of https://sourceforge.net/tracker2/?func=detail&aid=2541355&group_id=85796&atid=577329
-    # (Names not resolved in generator expression in method)
-    # See message: http://mail.python.org/pipermail/python-list/2009-January/526522.html
-    updated_globals = {}
-    updated_globals.update(frame.f_globals)
-    updated_globals.update(frame.f_locals)  # locals later because it has precedence over the actual globals
-
+    updated_globals = updated_locals = None
     try:
         expression = str(expression.replace('@LINE@', '\n'))
 
         if is_exec:
+            if dbg is not None:
+                dbg.suspended_frames_manager.clear_completions_caches()
             try:
                 # try to make it an eval (if it is an eval we can print it, otherwise we'll exec it and
                 # it will have whatever the user actually did)
-                compiled = compile(expression, '<string>', 'eval')
+                compiled = _compile_cached(expression, 'eval')
             except:
-                Exec(expression, updated_globals, frame.f_locals)
+                compiled = _compile_cached(expression, 'exec')
+                updated_globals, updated_locals = _get_eval_namespace(frame, compiled)
+                Exec(compiled[0], updated_globals, updated_locals)
                 pydevd_save_locals.save_locals(frame)
             else:
-                result = eval(compiled, updated_globals, frame.f_locals)
+                updated_globals, updated_locals = _get_eval_namespace(frame, compiled)
+                result = eval(compiled[0], updated_globals, updated_locals)
                 if result is not None:  # Only print if it's not None (as python does)
                     sys.stdout.write('%s\n' % (result,))
             return
 
         else:
-            return eval_in_context(expression, updated_globals, frame.f_locals)
+            try:
+                compiled = _compile_cached(expression, 'eval')
+            except:
+                compiled = None  # The error is reported by eval_in_context.
+            updated_globals, updated_locals = _get_eval_namespace(frame, compiled)
+            return eval_in_context(expression, updated_globals, updated_locals)
     finally:
         # Should not be kept alive if an exception happens and this frame is kept in the stack.
         del updated_globals
+        del updated_locals
         del frame
 
 
@@ -287,6 +443,7 @@ def change_attr_expression(frame, attr, expression, dbg, value=SENTINEL_VALUE):
 
     try:
         expression = expression.replace('@LINE@', '\n')
+        dbg.suspended_frames_manager.clear_completions_caches()
 
         if dbg.plugin and value is SENTINEL_VALUE:
             result = dbg.plugin.change_variable(frame, attr, expression)
@@ -31,7 +31,7 @@ try:
 except:
     import builtins as __builtin__  # @UnresolvedImport
 
-from _pydev_bundle.pydev_console_utils import BaseInterpreterInterface, BaseStdIn
+from _pydev_bundle.pydev_console_utils import BaseInterpreterInterface, BaseStdIn, compile_command_cached
 from _pydev_bundle.pydev_console_utils import CodeFragment
 
 IS_PYTHON_3_ONWARDS = sys.version_info[0] >= 3
@@ -552,6 +552,7 @@ def console_exec(thread_id, frame_id, expression, dbg):
     """returns 'False' in case expression is partially correct
     """
     frame = dbg.find_frame(thread_id, frame_id)
+    dbg.suspended_frames_manager.clear_completions_caches()
 
     is_multiline = expression.count('@LINE@') > 1
     expression = str(expression.replace('@LINE@', '\n'))
@@ -559,21 +560,24 @@ def console_exec(thread_id, frame_id, expression, dbg):
     # Not using frame.f_globals because of https://sourceforge.net/tracker2/?func=detail&aid=2541355&group_id=85796&atid=577329
     # (Names not resolved in generator expression in method)
     # See message: http://mail.python.org/pipermail/python-list/2009-January/526522.html
+    f_locals = frame.f_locals
     updated_globals = {}
     updated_globals.update(frame.f_globals)
-    updated_globals.update(frame.f_locals)  # locals later because it has precedence over the actual globals
+    updated_globals.update(f_locals)  # locals later because it has precedence over the actual globals
+
+    locals_snapshot = pydevd_save_locals.take_locals_snapshot(frame, f_locals)
 
     if IPYTHON:
-        need_more = exec_code(CodeFragment(expression), updated_globals, frame.f_locals, dbg)
+        need_more = exec_code(CodeFragment(expression), updated_globals, f_locals, dbg)
         if not need_more:
-            pydevd_save_locals.save_locals(frame)
+            pydevd_save_locals.save_locals_if_changed(frame, f_locals, locals_snapshot)
         return need_more
 
     interpreter = ConsoleWriter()
 
     if not is_multiline:
         try:
-            code = compile_command(expression)
+            code = compile_command_cached(compile_command, expression)
         except (OverflowError, SyntaxError, ValueError):
             # Case 1
             interpreter.showsyntaxerror()
@@ -587,14 +591,14 @@ def console_exec(thread_id, frame_id, expression, dbg):
     # Case 3
 
     try:
-        Exec(code, updated_globals, frame.f_locals)
+        Exec(code, updated_globals, f_locals)
 
     except SystemExit:
         raise
     except:
         interpreter.showtraceback()
     else:
-        pydevd_save_locals.save_locals(frame)
+        pydevd_save_locals.save_locals_if_changed(frame, f_locals, locals_snapshot)
     return False
 
 
@@ -36,21 +36,24 @@ from _pydevd_bundle.pydevd_comm_constants import (CMD_THREAD_SUSPEND, CMD_STEP_I
 from _pydevd_bundle.pydevd_constants import (IS_JYTH_LESS25, get_thread_id, get_current_thread_id,
     dict_keys, dict_iter_items, DebugInfoHolder, PYTHON_SUSPEND, STATE_SUSPEND, STATE_RUN, get_frame,
     clear_cached_thread_id, INTERACTIVE_MODE_AVAILABLE, SHOW_DEBUG_INFO_ENV, IS_PY34_OR_GREATER, IS_PY2, NULL,
-    NO_FTRACE, IS_IRONPYTHON, JSON_PROTOCOL, IS_CPYTHON)
+    NO_FTRACE, IS_IRONPYTHON, JSON_PROTOCOL, IS_CPYTHON, DEFER_TRACING, dict_iter_values,
+    SIGNATURES_SAMPLE_CALLS, SIGNATURES_SAMPLE_INTERVAL)
 from _pydevd_bundle.pydevd_defaults import PydevdCustomization
 from _pydevd_bundle.pydevd_custom_frames import CustomFramesContainer, custom_frames_container_init
 from _pydevd_bundle.pydevd_dont_trace_files import DONT_TRACE, PYDEV_FILE
+from _pydevd_bundle.pydevd_excepthooks import install_excepthooks, uninstall_excepthooks
 from _pydevd_bundle.pydevd_extension_api import DebuggerEventHandler
 from _pydevd_bundle.pydevd_frame_utils import add_exception_to_frame, remove_exception_from_frame
 from _pydevd_bundle.pydevd_kill_all_pydevd_threads import kill_all_pydev_threads
 from _pydevd_bundle.pydevd_net_command_factory_xml import NetCommandFactory
+from _pydevd_bundle.pydevd_step_over import StepOverTracer
 from _pydevd_bundle.pydevd_trace_dispatch import (
     trace_dispatch as _trace_dispatch, global_cache_skips, global_cache_frame_skips, fix_top_level_trace_and_get_trace_func)
 from _pydevd_bundle.pydevd_utils import save_main_module, is_current_thread_main_thread
 from _pydevd_frame_eval.pydevd_frame_eval_main import (
     frame_eval_func, dummy_trace_dispatch)
 import pydev_ipython  # @UnusedImport
-from pydevd_concurrency_analyser.pydevd_concurrency_logger import ThreadingLogger, AsyncioLogger, send_message, cur_time
+from pydevd_concurrency_analyser.pydevd_concurrency_logger import ThreadingLogger, AsyncioLogger, record_event, cur_time
 from pydevd_concurrency_analyser.pydevd_thread_wrappers import wrap_threads
 from pydevd_file_utils import get_abs_path_real_path_and_base_from_frame, NORM_PATHS_AND_BASE_CONTAINER, get_abs_path_real_path_and_base_from_file
 from pydevd_file_utils import get_fullname, rPath, get_package_dir
@@ -64,7 +67,8 @@ from _pydevd_bundle.pydevd_comm import(InternalConsoleExec,
     InternalSendCurrExceptionTraceProceeded, run_as_pydevd_daemon_thread)
 
 from _pydevd_bundle.pydevd_breakpoints import stop_on_unhandled_exception
-from _pydevd_bundle.pydevd_collect_try_except_info import collect_try_except_info
+from _pydevd_bundle.pydevd_collect_try_except_info import collect_try_except_info_cached
+from _pydevd_bundle.pydevd_code_lines import get_code_line_table
 from _pydevd_bundle.pydevd_suspended_frames import SuspendedFramesManager
 from socket import SHUT_RDWR
 from _pydevd_bundle.pydevd_api import PyDevdAPI
@@ -482,6 +486,16 @@ class PyDB(object):
 
         self._local_thread_trace_func = threading.local()
 
+        # If True, the tracing is only set when something requires it (see: DEFER_TRACING).
+        self.defer_tracing = DEFER_TRACING
+        self._tracing_deferred = False
+        self._tracing_deferred_lock = thread.allocate_lock()
+
+        # The trace function for the threads while the tracing is deferred (None if the tracing
+        # can later be set for all the threads, otherwise a function which only checks whether
+        # the tracing was started on each call).
+        self._deferred_trace_func = None
+
         # Bind many locals to the debugger because upon teardown those names may become None
         # in the namespace (and thus can't be relied upon unless the reference was previously
         # saved).
@@ -513,7 +527,7 @@ class PyDB(object):
         self.threading_current_thread = threading.currentThread
         self.set_additional_thread_info = set_additional_thread_info
         self.stop_on_unhandled_exception = stop_on_unhandled_exception
-        self.collect_try_except_info = collect_try_except_info
+        self.collect_try_except_info = collect_try_except_info_cached
         self.get_exception_breakpoint = get_exception_breakpoint
         self._dont_trace_get_file_type = DONT_TRACE.get
         self.PYDEV_FILE = PYDEV_FILE
@@ -523,6 +537,18 @@ class PyDB(object):
         self._apply_filter_cache = {}
         self._ignore_system_exit_codes = set()
 
+        # co_filename -> 1 if it's user code or 0 if it's skipped when stepping into my code
+        # (see: `index_user_code`).
+        self.user_code_index = {}
+
+        # Breakpoint condition (str) -> compiled code object.
+        self._compiled_conditions_cache = {}
+
+        # Exception type -> exception breakpoint (or None) for the break_on_caught_exceptions
+        # in _caught_exception_breakpoint_cache_source (see: get_caught_exception_breakpoint).
+        self._caught_exception_breakpoint_cache = {}
+        self._caught_exception_breakpoint_cache_source = None
+
     def on_configuration_done(self):
         '''
         Note: only called when using the DAP (Debug Adapter Protocol).
@@ -535,6 +561,60 @@ class PyDB(object):
         '''
         self._on_configuration_done_event.clear()
 
+    def inherit_state_from_forked_parent(self, parent_py_db):
+        '''
+        Called in a forked child to reuse the configuration of the debugger in the parent
+        (which is already in the child's memory) instead of waiting for the client to
+        send it all again.
+
+        :param PyDB parent_py_db:
+            The debugger which was active in the parent process before the fork.
+        '''
+        self.cmd_factory = parent_py_db.cmd_factory
+        self.mtime = parent_py_db.mtime
+
+        self.breakpoints = parent_py_db.breakpoints
+        self.file_to_id_to_line_breakpoint = parent_py_db.file_to_id_to_line_breakpoint
+        self.file_to_id_to_plugin_breakpoint = parent_py_db.file_to_id_to_plugin_breakpoint
+        self.break_on_uncaught_exceptions = parent_py_db.break_on_uncaught_exceptions
+        self.break_on_caught_exceptions = parent_py_db.break_on_caught_exceptions
+        self.has_plugin_line_breaks = parent_py_db.has_plugin_line_breaks
+        self.has_plugin_exception_breaks = parent_py_db.has_plugin_exception_breaks
+        self.plugin = parent_py_db.plugin
+        self._set_breakpoints_with_id = parent_py_db._set_breakpoints_with_id
+        self.filename_to_lines_where_exceptions_are_ignored = parent_py_db.filename_to_lines_where_exceptions_are_ignored
+
+        self.skip_on_exceptions_thrown_in_same_context = parent_py_db.skip_on_exceptions_thrown_in_same_context
+        self.ignore_exceptions_thrown_in_lines_with_ignore_exception = \
+            parent_py_db.ignore_exceptions_thrown_in_lines_with_ignore_exception
+        self.skip_suspend_on_breakpoint_exception = parent_py_db.skip_suspend_on_breakpoint_exception
+        self.skip_print_breakpoint_exception = parent_py_db.skip_print_breakpoint_exception
+        self.disable_property_trace = parent_py_db.disable_property_trace
+        self.disable_property_getter_trace = parent_py_db.disable_property_getter_trace
+        self.disable_property_setter_trace = parent_py_db.disable_property_setter_trace
+        self.disable_property_deleter_trace = parent_py_db.disable_property_deleter_trace
+        self.multi_threads_single_notification = parent_py_db.multi_threads_single_notification
+        self.stepping_resumes_all_threads = parent_py_db.stepping_resumes_all_threads
+        self.show_return_values = parent_py_db.show_return_values
+        self.redirect_output = parent_py_db.redirect_output
+        self._ignore_system_exit_codes = parent_py_db._ignore_system_exit_codes
+        if 'dont_trace_external_files' in parent_py_db.__dict__:
+            # Only available if customized through PyDevdAPI.set_dont_trace_start_end_patterns.
+            self.dont_trace_external_files = parent_py_db.dont_trace_external_files
+
+        # Filters and the caches computed from them (the file type cache and the
+        # normalized paths cache are module-level, so, they're already shared).
+        self._files_filtering = parent_py_db._files_filtering
+        self._in_project_scope_cache = parent_py_db._in_project_scope_cache
+        self._exclude_by_filter_cache = parent_py_db._exclude_by_filter_cache
+        self._apply_filter_cache = parent_py_db._apply_filter_cache
+        self.user_code_index = parent_py_db.user_code_index
+        self._compiled_conditions_cache = parent_py_db._compiled_conditions_cache
+        self._exclude_filters_enabled = parent_py_db._exclude_filters_enabled
+        self._is_libraries_filter_enabled = parent_py_db._is_libraries_filter_enabled
+        self.is_files_filter_enabled = parent_py_db.is_files_filter_enabled
+        self.defer_tracing = parent_py_db.defer_tracing
+
     def set_ignore_system_exit_codes(self, ignore_system_exit_codes):
         assert isinstance(ignore_system_exit_codes, (list, tuple, set))
         self._ignore_system_exit_codes = set(ignore_system_exit_codes)
@@ -560,7 +640,12 @@ class PyDB(object):
             if not condition:
                 return False
 
-            return eval(condition, new_frame.f_globals, new_frame.f_locals)
+            try:
+                compiled = self._compiled_conditions_cache[condition]
+            except KeyError:
+                compiled = self._compiled_conditions_cache[condition] = compile(condition, '<string>', 'eval')
+
+            return eval(compiled, new_frame.f_globals, new_frame.f_locals)
         except Exception as e:
             if IS_PY2:
                 # Must be bytes on py2.
@@ -658,6 +743,9 @@ class PyDB(object):
         return not _CACHE_FILE_TYPE
 
     def get_thread_local_trace_func(self):
+        if self._tracing_deferred:
+            return self._deferred_trace_func
+
         try:
             thread_trace_func = self._local_thread_trace_func.thread_trace_func
         except AttributeError:
@@ -713,11 +801,99 @@ class PyDB(object):
             return
 
         self.mtime += 1
+        self.user_code_index.clear()
+        if self._tracing_deferred and self._requires_tracing():
+            self.start_deferred_tracing()
+
         if not removed:
             # When removing breakpoints we can leave tracing as was, but if a breakpoint was added
             # we have to reset the tracing for the existing functions to be re-evaluated.
             self.set_tracing_for_untraced_contexts()
 
+    def _requires_tracing(self):
+        '''
+        :return bool:
+            Whether some breakpoint requires tracing (stopping on unhandled exceptions doesn't
+            require it as the excepthooks can be used when the tracing is deferred).
+        '''
+        for id_to_breakpoint in dict_iter_values(self.file_to_id_to_line_breakpoint):
+            if id_to_breakpoint:
+                return True
+
+        return bool(
+            self.break_on_caught_exceptions or
+            self.has_plugin_line_breaks or
+            self.has_plugin_exception_breaks
+        )
+
+    def can_skip_callees_on_step_over(self):
+        '''
+        :return bool:
+            Whether the frames called while stepping over may be left untraced when they're not
+            in a file with some line breakpoint (see: `pydevd_step_over.StepOverTracer`).
+        '''
+        return (
+            self.frame_eval_func is None and
+            self.signature_factory is None and
+            self.thread_analyser is None and
+            self.asyncio_analyser is None and
+            not self.break_on_caught_exceptions and
+            not self.has_plugin_line_breaks and
+            not self.has_plugin_exception_breaks
+        )
+
+    def defer_tracing_if_possible(self):
+        '''
+        Called when the debugger starts running the program: if `self.defer_tracing` is set and
+        nothing requires tracing, no tracing is set until `start_deferred_tracing` is called.
+
+        :return bool:
+            Whether the tracing was deferred.
+        '''
+        if not self.defer_tracing or self._requires_tracing():
+            return False
+
+        if self.frame_eval_func is not None or self.thread_analyser is not None or self.asyncio_analyser is not None:
+            return False
+
+        if pydevd_tracing.can_set_trace_to_threads():
+            self._deferred_trace_func = None
+        else:
+            # It's not possible to set the tracing for the existing threads later on, so, a trace
+            # function is still needed (but it has no cost per line, only per call).
+            self._deferred_trace_func = self._deferred_trace_dispatch
+
+        install_excepthooks()
+        self._tracing_deferred = True
+        pydev_log.debug('Tracing deferred until needed.')
+        return True
+
+    def _deferred_trace_dispatch(self, frame, event, arg):
+        if self._tracing_deferred:
+            return None
+        return self.trace_dispatch(frame, event, arg)
+
+    def start_deferred_tracing(self):
+        '''
+        Sets the tracing for all the threads if it was deferred (when some breakpoint is added or
+        a pause/step is requested).
+        '''
+        with self._tracing_deferred_lock:
+            if not self._tracing_deferred:
+                return
+            self._tracing_deferred = False
+
+        pydev_log.debug('Starting deferred tracing.')
+        try:
+            # not available in jython!
+            threading.settrace(self.trace_dispatch)  # for all future threads
+        except:
+            pass
+
+        if self._deferred_trace_func is None:
+            pydevd_tracing.set_trace_to_threads(self.trace_dispatch, pydevd_utils.get_non_pydevd_threads())
+        self.set_tracing_for_untraced_contexts()
+
     def set_tracing_for_untraced_contexts(self, ignore_current_thread=False):
         # Enable the tracing for existing threads (because there may be frames being executed that
         # are currently untraced).
@@ -779,10 +955,77 @@ class PyDB(object):
 
             return cache[filename]
 
+    def _is_user_code_file(self, abs_real_path_and_basename, module_name):
+        '''
+        File-level version of `apply_files_filter(..., force_check_project_scope=True)`.
+
+        :return bool:
+            True if code in the given file should be traced when stepping into my code.
+        '''
+        if self.get_file_type(abs_real_path_and_basename) == self.PYDEV_FILE:
+            return False
+
+        if self.plugin is not None and (self.has_plugin_line_breaks or self.has_plugin_exception_breaks):
+            # Plugins decide per frame.
+            return True
+
+        filename = abs_real_path_and_basename[1]
+        if self.breakpoints.get(filename):
+            # Breakpoints in the file must still be hit.
+            return True
+
+        if self._exclude_filters_enabled:
+            exclude_by_filter = self._files_filtering.exclude_by_filter(filename, module_name)
+            if exclude_by_filter is not None:
+                return not exclude_by_filter
+
+        return self.in_project_scope(filename)
+
+    def index_user_code(self, frame):
+        '''
+        Adds the file of the given frame to `self.user_code_index` (which is keyed by the
+        normalized real path of the file).
+
+        :return int:
+            1 if it's user code and 0 otherwise.
+        '''
+        abs_real_path_and_basename = get_abs_path_real_path_and_base_from_frame(frame)
+        is_user_code = self._is_user_code_file(abs_real_path_and_basename, frame.f_globals.get('__name__', ''))
+        self.user_code_index[abs_real_path_and_basename[1]] = is_user_code = 1 if is_user_code else 0
+        return is_user_code
+
+    def index_loaded_user_code(self):
+        '''
+        Indexes the files of the modules already loaded (the files of modules imported
+        afterwards are indexed as their code is first called).
+        '''
+        user_code_index = self.user_code_index
+        for module_name, module in list(dict_iter_items(sys.modules)):
+            filename = getattr(module, '__file__', None)
+            if not filename:
+                continue
+
+            if filename.endswith('.pyo'):
+                filename = filename[:-1]
+
+            elif not filename.endswith(('.py', '.pyc')):
+                continue  # i.e.: compiled extension.
+
+            try:
+                # Note: the path is normalized as the `co_filename` of the frames is when
+                # looking up the index (so, .pyc files, symlinks and relative paths match).
+                abs_real_path_and_basename = get_abs_path_real_path_and_base_from_file(filename)
+                if abs_real_path_and_basename[1] not in user_code_index:
+                    user_code_index[abs_real_path_and_basename[1]] = \
+                        1 if self._is_user_code_file(abs_real_path_and_basename, module_name) else 0
+            except:
+                pydev_log.exception('Error indexing: %s', filename)
+
     def _clear_filters_caches(self):
         self._in_project_scope_cache.clear()
         self._exclude_by_filter_cache.clear()
         self._apply_filter_cache.clear()
+        self.user_code_index.clear()
         self._exclude_filters_enabled = self._files_filtering.use_exclude_filters()
         self._is_libraries_filter_enabled = self._files_filtering.use_libraries_filter()
         self.is_files_filter_enabled = self._exclude_filters_enabled or self._is_libraries_filter_enabled
@@ -804,7 +1047,14 @@ class PyDB(object):
         :return: True if it should be excluded, False if it should be included and None
             if no rule matched the given file.
         '''
-        cache_key = (filename, frame.f_code.co_name)
+        # The result only depends on the file (and on the module name if some filter
+        # filters by module), so, it's computed once per file and not per function.
+        module_name = None
+        if self._files_filtering.require_module:
+            module_name = frame.f_globals.get('__name__', '')
+            cache_key = (filename, module_name)
+        else:
+            cache_key = filename
         try:
             return self._exclude_by_filter_cache[cache_key]
         except KeyError:
@@ -815,9 +1065,6 @@ class PyDB(object):
             if self.get_file_type(abs_real_path_and_basename) == self.PYDEV_FILE:
                 cache[cache_key] = True
             else:
-                module_name = None
-                if self._files_filtering.require_module:
-                    module_name = frame.f_globals.get('__name__', '')
                 cache[cache_key] = self._files_filtering.exclude_by_filter(filename, module_name)
 
             return cache[cache_key]
@@ -939,6 +1186,7 @@ class PyDB(object):
 
     def initialize_network(self, sock, terminate_on_socket_close=True):
         assert sock is not None
+        _dispatch_debugger_modules_loaded()
         try:
             sock.settimeout(None)  # infinite, no timeouts from now on - jython does not have it
         except:
@@ -1310,6 +1558,26 @@ class PyDB(object):
 
         return eb
 
+    def get_caught_exception_breakpoint(self, exctype):
+        '''
+        Same as `get_exception_breakpoint(exctype, self.break_on_caught_exceptions)`, but cached
+        per exception type (as exceptions may be raised and caught millions of times and finding
+        the breakpoint requires checking the subclasses of each configured exception).
+        '''
+        break_on_caught_exceptions = self.break_on_caught_exceptions
+        cache = self._caught_exception_breakpoint_cache
+        if self._caught_exception_breakpoint_cache_source is not break_on_caught_exceptions:
+            # Note: break_on_caught_exceptions is replaced (never changed in-place) when the
+            # exception breakpoints change.
+            cache = self._caught_exception_breakpoint_cache = {}
+            self._caught_exception_breakpoint_cache_source = break_on_caught_exceptions
+
+        try:
+            return cache[exctype]
+        except KeyError:
+            exception_breakpoint = cache[exctype] = self.get_exception_breakpoint(exctype, break_on_caught_exceptions)
+            return exception_breakpoint
+
     def _mark_suspend(self, thread, stop_reason):
         info = set_additional_thread_info(thread)
         info.suspend_type = PYTHON_SUSPEND
@@ -1350,6 +1618,8 @@ class PyDB(object):
         info = self._mark_suspend(thread, stop_reason)
 
         if is_pause:
+            self.start_deferred_tracing()
+
             # Must set tracing after setting the state to suspend.
             frame = info.get_topmost_frame(thread)
             if frame is not None:
@@ -1439,9 +1709,15 @@ class PyDB(object):
 
             if func_name == '*' or curr_func_name == func_name:
                 line = next_line
-                frame.f_trace = self.trace_dispatch
-                frame.f_lineno = line
-                stop = True
+                line_table = get_code_line_table(frame.f_code)
+                jump_error = line_table.get_jump_error(frame.f_lasti, line) if line_table is not None else None
+                if jump_error:
+                    # Rejected without changing the frame (which would raise a ValueError anyways).
+                    response_msg = jump_error
+                else:
+                    frame.f_trace = self.trace_dispatch
+                    frame.f_lineno = line
+                    stop = True
             else:
                 response_msg = "jump is available only within the bottom frame"
         return stop, old_line, response_msg
@@ -1477,6 +1753,10 @@ class PyDB(object):
 
         thread_id = get_current_thread_id(thread)
 
+        if self.signature_factory is not None:
+            # Signatures collected until this point should be available while suspended.
+            self.signature_factory.flush(self)
+
         # Send the suspend message
         message = thread.additional_info.pydev_message
         suspend_type = thread.additional_info.trace_suspend_type
@@ -1550,11 +1830,16 @@ class PyDB(object):
             info.pydev_step_stop = None
             info.pydev_smart_step_stop = None
             self.set_trace_for_frame_and_parents(frame)
+            if info.pydev_step_cmd == CMD_STEP_INTO_MY_CODE and not self.user_code_index:
+                self.index_loaded_user_code()
 
         elif info.pydev_step_cmd in (CMD_STEP_OVER, CMD_STEP_OVER_MY_CODE):
             info.pydev_step_stop = frame
             info.pydev_smart_step_stop = None
             self.set_trace_for_frame_and_parents(frame)
+            if self.can_skip_callees_on_step_over():
+                # The frames called while stepping over don't need to be traced.
+                pydevd_tracing.SetTrace(StepOverTracer(self, info, self.get_thread_local_trace_func()))
 
         elif info.pydev_step_cmd == CMD_SMART_STEP_INTO:
             info.pydev_step_stop = None
@@ -1691,13 +1976,17 @@ class PyDB(object):
 
     def prepare_to_run(self):
         ''' Shared code to prepare debugging by installing traces and registering threads '''
+        self.defer_tracing_if_possible()
         self.patch_threads()
         self.start_auxiliary_daemon_threads()
 
     def patch_threads(self):
         try:
             # not available in jython!
-            threading.settrace(self.trace_dispatch)  # for all future threads
+            if self._tracing_deferred:
+                threading.settrace(self._deferred_trace_func)  # for all future threads
+            else:
+                threading.settrace(self.trace_dispatch)  # for all future threads
         except:
             pass
 
@@ -1799,11 +2088,11 @@ class PyDB(object):
         if self.thread_analyser is not None:
             wrap_threads()
             self.thread_analyser.set_start_time(cur_time())
-            send_message("threading_event", 0, t.getName(), thread_id, "thread", "start", file, 1, None, parent=thread_id)
+            record_event("threading_event", 0, t.getName(), thread_id, "thread", "start", file, 1, None, parent=thread_id)
 
         if self.asyncio_analyser is not None:
             # we don't have main thread in asyncio graph, so we should add a fake event
-            send_message("asyncio_event", 0, "Task", "Task", "thread", "stop", file, 1, frame=None, parent=None)
+            record_event("asyncio_event", 0, "Task", "Task", "thread", "stop", file, 1, frame=None, parent=None)
 
         try:
             if INTERACTIVE_MODE_AVAILABLE:
@@ -1865,6 +2154,8 @@ class PyDB(object):
             pass
 
         self.check_output_redirect()
+        if self.signature_factory is not None:
+            self.signature_factory.flush(self)
         cmd = self.cmd_factory.make_exit_message()
         self.writer.add_command(cmd)
 
@@ -2156,25 +2447,35 @@ def _locked_settrace(
         while not debugger.ready_to_run:
             time.sleep(0.1)  # busy wait until we receive run command
 
-        # Set the tracing only
-        debugger.set_trace_for_frame_and_parents(get_frame().f_back)
-
-        with CustomFramesContainer.custom_frames_lock:  # @UndefinedVariable
-            for _frameId, custom_frame in dict_iter_items(CustomFramesContainer.custom_frames):
-                debugger.set_trace_for_frame_and_parents(custom_frame.frame)
+        if not suspend and debugger.defer_tracing_if_possible():
+            # No tracing is set for now (it's set when needed).
+            debugger.start_auxiliary_daemon_threads()
 
-        debugger.start_auxiliary_daemon_threads()
-
-        if trace_only_current_thread:
+            if not trace_only_current_thread:
+                # Trace future threads (when the tracing is started).
+                debugger.patch_threads()
             debugger.enable_tracing()
+
         else:
-            # Trace future threads.
-            debugger.patch_threads()
+            # Set the tracing only
+            debugger.set_trace_for_frame_and_parents(get_frame().f_back)
 
-            debugger.enable_tracing(debugger.trace_dispatch, apply_to_all_threads=True)
+            with CustomFramesContainer.custom_frames_lock:  # @UndefinedVariable
+                for _frameId, custom_frame in dict_iter_items(CustomFramesContainer.custom_frames):
+                    debugger.set_trace_for_frame_and_parents(custom_frame.frame)
+
+            debugger.start_auxiliary_daemon_threads()
+
+            if trace_only_current_thread:
+                debugger.enable_tracing()
+            else:
+                # Trace future threads.
+                debugger.patch_threads()
 
-            # As this is the first connection, also set tracing for any untraced threads
-            debugger.set_tracing_for_untraced_contexts(ignore_current_thread=True)
+                debugger.enable_tracing(debugger.trace_dispatch, apply_to_all_threads=True)
+
+                # As this is the first connection, also set tracing for any untraced threads
+                debugger.set_tracing_for_untraced_contexts(ignore_current_thread=True)
 
         # Stop the tracing as the last thing before the actual shutdown for a clean exit.
         atexit.register(stoptrace)
@@ -2182,6 +2483,7 @@ def _locked_settrace(
     else:
         # ok, we're already in debug mode, with all set, so, let's just set the break
         debugger = get_global_debugger()
+        debugger.start_deferred_tracing()
 
         debugger.set_trace_for_frame_and_parents(get_frame().f_back)
 
@@ -2223,6 +2525,7 @@ def stoptrace():
 
         from _pydev_bundle.pydev_monkey import undo_patch_thread_modules
         undo_patch_thread_modules()
+        uninstall_excepthooks()
 
         debugger = get_global_debugger()
 
@@ -2299,8 +2602,14 @@ def dispatch():
 def settrace_forked():
     '''
     When creating a fork from a process in the debugger, we need to reset the whole debugger environment!
+
+    The configuration of the parent (breakpoints, filters and related caches) is inherited by the
+    new debugger, so, if the parent was already configured the child doesn't need to wait for the
+    client to send it again before running.
     '''
-    from _pydevd_bundle.pydevd_constants import GlobalDebuggerHolder
+    from _pydevd_bundle.pydevd_constants import GlobalDebuggerHolder, get_protocol, set_protocol
+    parent_py_db = GlobalDebuggerHolder.global_dbg
+    protocol = get_protocol()
     GlobalDebuggerHolder.global_dbg = None
     threading.current_thread().additional_info = None
     PyDBDaemonThread.created_pydb_daemon_threads = {}
@@ -2320,6 +2629,14 @@ def settrace_forked():
         if clear_thread_local_info is not None:
             clear_thread_local_info()
 
+        wait_for_ready_to_run = True
+        if parent_py_db is not None and parent_py_db.ready_to_run:
+            py_db = PyDB()
+            set_protocol(protocol)  # PyDB() resets it to the default.
+            py_db.inherit_state_from_forked_parent(parent_py_db)
+            wait_for_ready_to_run = False
+        parent_py_db = None
+
         settrace(
                 host,
                 port=port,
@@ -2327,6 +2644,7 @@ def settrace_forked():
                 trace_only_current_thread=False,
                 overwrite_prev_trace=True,
                 patch_multiprocessing=True,
+                wait_for_ready_to_run=wait_for_ready_to_run,
         )
 
 
@@ -2353,8 +2671,13 @@ def apply_debugger_options(setup_options):
             sys.stderr.write("Collecting run-time type information is not supported for Jython\n")
         else:
             # Only import it if we're going to use it!
-            from _pydevd_bundle.pydevd_signature import SignatureFactory
-            debugger.signature_factory = SignatureFactory()
+            if SIGNATURES_SAMPLE_CALLS > 0 or SIGNATURES_SAMPLE_INTERVAL > 0:
+                from _pydevd_bundle.pydevd_signature import SamplingSignatureFactory
+                debugger.signature_factory = SamplingSignatureFactory(
+                    SIGNATURES_SAMPLE_CALLS, SIGNATURES_SAMPLE_INTERVAL)
+            else:
+                from _pydevd_bundle.pydevd_signature import SignatureFactory
+                debugger.signature_factory = SignatureFactory()
 
     if setup_options['qt-support']:
         enable_qt_support(setup_options['qt-support'])
@@ -2365,11 +2688,20 @@ def patch_stdin(debugger):
     orig_stdin = sys.stdin
     sys.stdin = DebugConsoleStdIn(debugger, orig_stdin)
 
-# Dispatch on_debugger_modules_loaded here, after all primary debugger modules are loaded
 
+_debugger_modules_loaded_dispatched = False
+
+
+def _dispatch_debugger_modules_loaded():
+    # Dispatch on_debugger_modules_loaded on the first connection (instead of when pydevd is imported)
+    # so that the extensions aren't loaded just by importing pydevd.
+    global _debugger_modules_loaded_dispatched
+    if _debugger_modules_loaded_dispatched:
+        return
+    _debugger_modules_loaded_dispatched = True
 
-for handler in pydevd_extension_utils.extensions_of_type(DebuggerEventHandler):
-    handler.on_debugger_modules_loaded(debugger_version=__version__)
+    for handler in pydevd_extension_utils.extensions_of_type(DebuggerEventHandler):
+        handler.on_debugger_modules_loaded(debugger_version=__version__)
 
 
 #=======================================================================================================================
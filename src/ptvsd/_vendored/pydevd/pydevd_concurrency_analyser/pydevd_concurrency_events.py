@@ -0,0 +1,210 @@
+'''
+Storage for the events collected by the concurrency analyser (see: pydevd_concurrency_logger).
+
+The events are recorded in a preallocated ring buffer (parallel arrays) where the threads,
+locks, event names and code locations are kept as numeric ids, so, recording an event
+is cheap (when the buffer is full the oldest events are overwritten).
+
+The events are exported in bulk (on request) in the Chrome trace event format, which can
+be opened in chrome://tracing or https://ui.perfetto.dev.
+'''
+from array import array
+import itertools
+import os
+
+from _pydev_imps._pydev_saved_modules import threading
+
+DEFAULT_CAPACITY = 65536
+
+# Lock events (as recorded by the loggers) which start waiting for a lock, acquire it and
+# release it (locks used in a `with` statement generate `__enter__`/`__exit__` events).
+_LOCK_WAIT_EVENTS = frozenset(['acquire_begin', '__enter___begin'])
+_LOCK_ACQUIRED_EVENTS = frozenset(['acquire_end', '__enter___end'])
+_LOCK_RELEASE_EVENTS = frozenset(['release', 'release_begin', '__exit___begin'])
+
+
+class _IdTable(object):
+
+    def __init__(self):
+        self._key_to_id = {}
+        self.keys = []
+        self._lock = threading.Lock()
+
+    def get_id(self, key):
+        try:
+            return self._key_to_id[key]
+        except KeyError:
+            with self._lock:
+                try:
+                    return self._key_to_id[key]
+                except KeyError:
+                    self.keys.append(key)
+                    new_id = self._key_to_id[key] = len(self.keys) - 1
+                    return new_id
+
+
+class ConcurrencyEvents(object):
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._counter = itertools.count()
+        self._recorded = 0
+
+        self._times = array('d', [0.]) * capacity
+        self._kinds = array('i', [0]) * capacity
+        self._names = array('i', [0]) * capacity
+        self._threads = array('i', [0]) * capacity
+        self._locks = array('i', [0]) * capacity
+        self._locations = array('i', [0]) * capacity
+        self._parents = array('i', [0]) * capacity
+
+        # (event_class, type)
+        self._kinds_table = _IdTable()
+        self._names_table = _IdTable()
+        self._threads_table = _IdTable()
+        # The thread number -> the last name seen for it (written with the lock held).
+        self._thread_id_to_name = {}
+        self._lock = threading.Lock()
+        self._locks_table = _IdTable()
+        # (filename, line)
+        self._locations_table = _IdTable()
+
+    def record(self, event_class, time, name, thread_id, type, event, file, line, lock_id=None, parent=None):
+        '''
+        :param str event_class:
+            'threading_event' or 'asyncio_event'.
+
+        :param int time:
+            Time of the event in microseconds (relative to the start of the analysis).
+
+        :param str name:
+            Name of the thread.
+
+        :param str type:
+            'thread' or 'lock'.
+
+        :param str event:
+            The event (i.e.: 'start', 'stop', 'acquire_begin', 'acquire_end', 'release', ...).
+        '''
+        # itertools.count() is atomic, so, each thread gets its own slot.
+        recorded = next(self._counter)
+        i = recorded % self.capacity
+
+        thread_num = self._threads_table.get_id(thread_id)
+        if self._thread_id_to_name.get(thread_num) != name:
+            with self._lock:
+                self._thread_id_to_name[thread_num] = name
+
+        self._times[i] = time
+        self._kinds[i] = self._kinds_table.get_id((event_class, type))
+        self._names[i] = self._names_table.get_id(event)
+        self._threads[i] = thread_num
+        self._locks[i] = -1 if lock_id is None else self._locks_table.get_id(lock_id)
+        self._locations[i] = self._locations_table.get_id((file, line))
+        self._parents[i] = -1 if parent is None else self._threads_table.get_id(parent)
+        if recorded >= self._recorded:
+            self._recorded = recorded + 1
+
+    def __len__(self):
+        return min(self._recorded, self.capacity)
+
+    @property
+    def dropped(self):
+        '''
+        The number of events which were overwritten because the buffer was full.
+        '''
+        return max(0, self._recorded - self.capacity)
+
+    def to_chrome_trace(self):
+        '''
+        :return dict:
+            The recorded events in the Chrome trace event format.
+
+            A wait for a lock is shown as an async slice (per thread and lock) from the start of
+            the acquire until it's acquired and holding a lock as an async slice (per lock) from
+            that point until it's released. Other events are shown as instant events in the thread.
+        '''
+        pid = os.getpid()
+        with self._lock:
+            thread_id_to_name = self._thread_id_to_name.copy()
+
+        trace_events = []
+        for thread_num in range(len(self._threads_table.keys)):
+            trace_events.append({
+                'ph': 'M',
+                'name': 'thread_name',
+                'pid': pid,
+                'tid': thread_num,
+                'args': {'name': thread_id_to_name.get(thread_num, self._threads_table.keys[thread_num])},
+            })
+
+        kinds = self._kinds_table.keys
+        names = self._names_table.keys
+        thread_ids = self._threads_table.keys
+        locations = self._locations_table.keys
+
+        recorded = self._recorded
+        for recorded_i in range(recorded - len(self), recorded):
+            i = recorded_i % self.capacity
+            event_class, event_type = kinds[self._kinds[i]]
+            category = event_class.replace('_event', '')
+            event = names[self._names[i]]
+            tid = self._threads[i]
+            filename, line = locations[self._locations[i]]
+            lock_num = self._locks[i]
+            parent_num = self._parents[i]
+
+            trace_event = {
+                'cat': category,
+                'pid': pid,
+                'tid': tid,
+                'ts': self._times[i],
+                'args': {'file': filename, 'line': line},
+            }
+            if parent_num != -1:
+                trace_event['args']['parent'] = thread_ids[parent_num]
+
+            if event_type == 'lock' and lock_num != -1:
+                trace_event['args']['lock'] = lock_num
+                if event in _LOCK_WAIT_EVENTS:
+                    trace_event.update(ph='b', name='wait lock %s' % (lock_num,), id='%s-%s' % (lock_num, tid))
+
+                elif event in _LOCK_ACQUIRED_EVENTS:
+                    trace_event.update(ph='e', name='wait lock %s' % (lock_num,), id='%s-%s' % (lock_num, tid))
+                    trace_events.append(trace_event)
+                    trace_event = trace_event.copy()
+                    trace_event.update(ph='b', name='hold lock %s' % (lock_num,), id=str(lock_num))
+
+                elif event in _LOCK_RELEASE_EVENTS:
+                    trace_event.update(ph='e', name='hold lock %s' % (lock_num,), id=str(lock_num))
+
+                else:
+                    trace_event.update(ph='i', s='t', name='%s lock %s' % (event, lock_num))
+            else:
+                trace_event.update(ph='i', s='t', name='%s %s' % (event_type, event))
+
+            trace_events.append(trace_event)
+
+        return {
+            'traceEvents': trace_events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'dropped': self.dropped},
+        }
+
+
+_concurrency_events = None
+_concurrency_events_lock = threading.Lock()
+
+
+def get_concurrency_events():
+    '''
+    :return ConcurrencyEvents:
+        The buffer where the concurrency analyser records events (created on first use as
+        it's only needed when the analyser is enabled).
+    '''
+    global _concurrency_events
+    if _concurrency_events is None:
+        with _concurrency_events_lock:
+            if _concurrency_events is None:
+                _concurrency_events = ConcurrencyEvents()
+    return _concurrency_events
@@ -4,8 +4,9 @@ from _pydev_bundle._pydev_filesystem_encoding import getfilesystemencoding
 from _pydev_imps._pydev_saved_modules import threading
 from _pydevd_bundle import pydevd_xml
 from _pydevd_bundle.pydevd_constants import GlobalDebuggerHolder
-from _pydevd_bundle.pydevd_constants import get_thread_id, IS_PY3K
+from _pydevd_bundle.pydevd_constants import get_thread_id, IS_PY3K, is_json_protocol
 from _pydevd_bundle.pydevd_net_command import NetCommand
+from pydevd_concurrency_analyser.pydevd_concurrency_events import get_concurrency_events
 from pydevd_concurrency_analyser.pydevd_thread_wrappers import ObjectWrapper, wrap_attr
 import pydevd_file_utils
 from _pydev_bundle import pydev_log
@@ -26,6 +27,11 @@ THREAD_METHODS = ['start', '_stop', 'join']
 LOCK_METHODS = ['__init__', 'acquire', 'release', '__enter__', '__exit__']
 QUEUE_METHODS = ['put', 'get']
 
+# Only calls to those may generate some event (checked before anything else as the
+# loggers are called for every call traced).
+THREADING_METHODS_TO_LOG = frozenset(THREAD_METHODS + ['pydev_after_run_call', '__init__', 'call_begin', 'call_end'])
+ASYNCIO_METHODS_TO_LOG = frozenset(['set_result', 'acquire', 'release', 'put', 'get', '_put', '_get'])
+
 # return time since epoch in milliseconds
 cur_time = lambda: int(round(time.time() * 1000000))
 
@@ -107,9 +113,23 @@ def send_message(event_class, time, name, thread_id, type, event, file, line, fr
         dbg.writer.add_command(NetCommand(145, 0, text))
 
 
+def record_event(event_class, time, name, thread_id, type, event, file, line, frame, lock_id=None, parent=None):
+    '''
+    Records an event of the concurrency analyser.
+
+    With the JSON protocol the event is recorded in the concurrency events ring buffer (see:
+    `pydevd_concurrency_events`), which is exported in bulk when requested by the client.
+    With the other protocols it's sent to the client right away (as before).
+    '''
+    if is_json_protocol():
+        get_concurrency_events().record(event_class, time, name, thread_id, type, event, file, line, lock_id, parent)
+    else:
+        send_message(event_class, time, name, thread_id, type, event, file, line, frame, lock_id=lock_id, parent=parent)
+
+
 def log_new_thread(global_debugger, t):
     event_time = cur_time() - global_debugger.thread_analyser.start_time
-    send_message("threading_event", event_time, t.getName(), get_thread_id(t), "thread",
+    record_event("threading_event", event_time, t.getName(), get_thread_id(t), "thread",
              "start", "code_name", 0, None, parent=get_thread_id(t))
 
 
@@ -122,6 +142,9 @@ class ThreadingLogger:
         self.start_time = time
 
     def log_event(self, frame):
+        if frame.f_code.co_name not in THREADING_METHODS_TO_LOG:
+            return
+
         write_log = False
         self_obj = None
         if "self" in frame.f_locals:
@@ -171,7 +194,7 @@ class ThreadingLogger:
 
                         if real_method == "start":
                             parent = get_thread_id(t)
-                        send_message("threading_event", event_time, name, thread_id, "thread",
+                        record_event("threading_event", event_time, name, thread_id, "thread",
                         real_method, back.f_code.co_filename, back.f_lineno, back, parent=parent)
                         # print(event_time, self_obj.getName(), thread_id, "thread",
                         #       real_method, back.f_code.co_filename, back.f_lineno)
@@ -191,7 +214,7 @@ class ThreadingLogger:
                                     send_massage = False
                                     # we can't detect stop after join in Python 2 yet
                                 if send_massage:
-                                    send_message("threading_event", event_time, "Thread", my_thread_id, "thread",
+                                    record_event("threading_event", event_time, "Thread", my_thread_id, "thread",
                                                  "stop", my_back.f_code.co_filename, my_back.f_lineno, my_back, parent=None)
 
                 if self_obj.__class__ == ObjectWrapper:
@@ -204,8 +227,8 @@ class ThreadingLogger:
                         # back_back_base is the file, where the method was called froms
                         return
                     if method_name == "__init__":
-                        send_message("threading_event", event_time, t.getName(), get_thread_id(t), "lock",
-                                     method_name, back.f_code.co_filename, back.f_lineno, back, lock_id=str(id(frame.f_locals["self"])))
+                        record_event("threading_event", event_time, t.getName(), get_thread_id(t), "lock",
+                                     method_name, back.f_code.co_filename, back.f_lineno, back, lock_id=id(frame.f_locals["self"]))
                     if "attr" in frame.f_locals and \
                             (frame.f_locals["attr"] in LOCK_METHODS or
                             frame.f_locals["attr"] in QUEUE_METHODS):
@@ -219,13 +242,13 @@ class ThreadingLogger:
                         if real_method == "release_end":
                             # do not log release end. Maybe use it later
                             return
-                        send_message("threading_event", event_time, t.getName(), get_thread_id(t), "lock",
-                        real_method, back.f_code.co_filename, back.f_lineno, back, lock_id=str(id(self_obj)))
+                        record_event("threading_event", event_time, t.getName(), get_thread_id(t), "lock",
+                        real_method, back.f_code.co_filename, back.f_lineno, back, lock_id=id(self_obj))
 
                         if real_method in ("put_end", "get_end"):
                             # fake release for queue, cause we don't call it directly
-                            send_message("threading_event", event_time, t.getName(), get_thread_id(t), "lock",
-                                         "release", back.f_code.co_filename, back.f_lineno, back, lock_id=str(id(self_obj)))
+                            record_event("threading_event", event_time, t.getName(), get_thread_id(t), "lock",
+                                         "release", back.f_code.co_filename, back.f_lineno, back, lock_id=id(self_obj))
                         # print(event_time, t.getName(), get_thread_id(t), "lock",
                         #       real_method, back.f_code.co_filename, back.f_lineno)
 
@@ -266,8 +289,6 @@ class AsyncioLogger:
         return None
 
     def log_event(self, frame):
-        event_time = cur_time() - self.start_time
-
         # Debug loop iterations
         # if isinstance(self_obj, asyncio.base_events.BaseEventLoop):
         #     if method_name == "_run_once":
@@ -277,6 +298,12 @@ class AsyncioLogger:
             return
         back = frame.f_back
 
+        # Note: a task start is logged for any method called from Task.__init__.
+        if frame.f_code.co_name not in ASYNCIO_METHODS_TO_LOG and back.f_code.co_name != "__init__":
+            return
+
+        event_time = cur_time() - self.start_time
+
         if "self" in frame.f_locals:
             self_obj = frame.f_locals["self"]
             if isinstance(self_obj, asyncio.Task):
@@ -284,14 +311,14 @@ class AsyncioLogger:
                 if method_name == "set_result":
                     task_id = id(self_obj)
                     task_name = self.task_mgr.get(str(task_id))
-                    send_message("asyncio_event", event_time, task_name, task_name, "thread", "stop", frame.f_code.co_filename,
+                    record_event("asyncio_event", event_time, task_name, task_name, "thread", "stop", frame.f_code.co_filename,
                                  frame.f_lineno, frame)
 
                 method_name = back.f_code.co_name
                 if method_name == "__init__":
                     task_id = id(self_obj)
                     task_name = self.task_mgr.get(str(task_id))
-                    send_message("asyncio_event", event_time, task_name, task_name, "thread", "start", frame.f_code.co_filename,
+                    record_event("asyncio_event", event_time, task_name, task_name, "thread", "start", frame.f_code.co_filename,
                                  frame.f_lineno, frame)
 
             method_name = frame.f_code.co_name
@@ -302,8 +329,8 @@ class AsyncioLogger:
 
                     if method_name == "acquire":
                         if not self_obj._waiters and not self_obj.locked():
-                            send_message("asyncio_event", event_time, task_name, task_name, "lock",
-                                         method_name + "_begin", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=str(id(self_obj)))
+                            record_event("asyncio_event", event_time, task_name, task_name, "lock",
+                                         method_name + "_begin", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=id(self_obj))
                         if self_obj.locked():
                             method_name += "_begin"
                         else:
@@ -311,8 +338,8 @@ class AsyncioLogger:
                     elif method_name == "release":
                         method_name += "_end"
 
-                    send_message("asyncio_event", event_time, task_name, task_name, "lock",
-                                 method_name, frame.f_code.co_filename, frame.f_lineno, frame, lock_id=str(id(self_obj)))
+                    record_event("asyncio_event", event_time, task_name, task_name, "lock",
+                                 method_name, frame.f_code.co_filename, frame.f_lineno, frame, lock_id=id(self_obj))
 
             if isinstance(self_obj, asyncio.Queue):
                 if method_name in ("put", "get", "_put", "_get"):
@@ -320,20 +347,20 @@ class AsyncioLogger:
                     task_name = self.task_mgr.get(str(task_id))
 
                     if method_name == "put":
-                        send_message("asyncio_event", event_time, task_name, task_name, "lock",
-                                     "acquire_begin", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=str(id(self_obj)))
+                        record_event("asyncio_event", event_time, task_name, task_name, "lock",
+                                     "acquire_begin", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=id(self_obj))
                     elif method_name == "_put":
-                        send_message("asyncio_event", event_time, task_name, task_name, "lock",
-                                     "acquire_end", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=str(id(self_obj)))
-                        send_message("asyncio_event", event_time, task_name, task_name, "lock",
-                                     "release", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=str(id(self_obj)))
+                        record_event("asyncio_event", event_time, task_name, task_name, "lock",
+                                     "acquire_end", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=id(self_obj))
+                        record_event("asyncio_event", event_time, task_name, task_name, "lock",
+                                     "release", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=id(self_obj))
                     elif method_name == "get":
                         back = frame.f_back
                         if back.f_code.co_name != "send":
-                            send_message("asyncio_event", event_time, task_name, task_name, "lock",
-                                         "acquire_begin", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=str(id(self_obj)))
+                            record_event("asyncio_event", event_time, task_name, task_name, "lock",
+                                         "acquire_begin", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=id(self_obj))
                         else:
-                            send_message("asyncio_event", event_time, task_name, task_name, "lock",
-                                         "acquire_end", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=str(id(self_obj)))
-                            send_message("asyncio_event", event_time, task_name, task_name, "lock",
-                                         "release", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=str(id(self_obj)))
+                            record_event("asyncio_event", event_time, task_name, task_name, "lock",
+                                         "acquire_end", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=id(self_obj))
+                            record_event("asyncio_event", event_time, task_name, task_name, "lock",
+                                         "release", frame.f_code.co_filename, frame.f_lineno, frame, lock_id=id(self_obj))
@@ -42,7 +42,8 @@ r'''
 '''
 
 from _pydev_bundle import pydev_log
-from _pydevd_bundle.pydevd_constants import IS_PY2, IS_PY3K, DebugInfoHolder, IS_WINDOWS, IS_JYTHON
+from _pydevd_bundle.pydevd_constants import IS_PY2, IS_PY3K, DebugInfoHolder, IS_WINDOWS, IS_JYTHON, \
+    PATH_CACHE_SIZE, dict_iter_items
 from _pydev_bundle._pydev_filesystem_encoding import getfilesystemencoding
 from _pydevd_bundle.pydevd_comm_constants import file_system_encoding, filesystem_encoding_is_utf8
 from _pydev_bundle.pydev_log import error_once
@@ -65,6 +66,107 @@ try:
 except NameError:
     FileNotFoundError = IOError  # noqa
 
+_MISSING = object()
+
+
+class PathCache(dict):
+    '''
+    A dict used to cache path computations which keeps at most `max_size` entries.
+
+    The eviction approximates LRU with 2 generations: when the current generation is full it
+    becomes the old generation (and the previous old generation is discarded) and an entry found
+    in the old generation is promoted back to the current one, so, only entries which weren't
+    used for a whole generation are evicted (a lookup which hits the current generation is still
+    a dict lookup).
+
+    Note: `cache[key]` isn't overridden (so that it's still a plain dict lookup), so, its hits
+    in the current generation aren't counted (the stats only have the `promotions` of entries
+    found in the old generation and the `get_hits` of `get()` in the current generation).
+
+    Note: the counters are updated without a lock, so, they're approximate when multiple
+    threads use the same cache.
+    '''
+
+    def __init__(self, name, max_size=PATH_CACHE_SIZE):
+        dict.__init__(self)
+        self.name = name
+        self.max_size = max_size
+        self._generation_size = max(1, max_size // 2)
+        self._old = {}
+        self.promotions = 0
+        self.get_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __missing__(self, key):
+        # Called by `cache[key]` if the key isn't in the current generation.
+        value = self._old.pop(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            raise KeyError(key)
+        self.promotions += 1
+        self[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        if dict.__len__(self) >= self._generation_size and not dict.__contains__(self, key):
+            self.evictions += len(self._old)
+            self._old = dict.copy(self)
+            dict.clear(self)
+        dict.__setitem__(self, key, value)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self._old
+
+    def get(self, key, default=None):
+        value = dict.get(self, key, _MISSING)
+        if value is not _MISSING:
+            self.get_hits += 1
+            return value
+        try:
+            return self.__missing__(key)
+        except KeyError:
+            return default
+
+    def clear(self):
+        dict.clear(self)
+        self._old = {}
+
+    def get_stats(self):
+        return {
+            'size': dict.__len__(self) + len(self._old),
+            'max_size': self.max_size,
+            'promotions': self.promotions,
+            'get_hits': self.get_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+# Cache name -> PathCache
+_path_caches = {}
+
+
+def _create_path_cache(name):
+    # Note: a cache created with the name of an existing cache replaces it.
+    cache = _path_caches[name] = PathCache(name)
+    return cache
+
+
+def get_path_caches_stats():
+    '''
+    :return dict(str, dict):
+        The name of each cache used to normalize/translate paths mapped to its stats (with the
+        'size', 'max_size', 'promotions', 'get_hits', 'misses' and 'evictions' keys -- see: PathCache).
+    '''
+    return dict((name, cache.get_stats()) for name, cache in dict_iter_items(_path_caches))
+
+
+def clear_path_caches():
+    for cache in list(_path_caches.values()):
+        cache.clear()
+
+
 try:
     rPath = os.path.realpath  # @UndefinedVariable
 except:
@@ -142,7 +244,7 @@ if sys.platform == 'win32':
         # issue is if the user actually changes the case of an existing file on windows while
         # the debugger is executing (as this seems very unlikely and the cache can save a
         # reasonable time -- especially on mapped drives -- it seems nice to have it).
-        _listdir_cache = {}
+        _listdir_cache = _create_path_cache('listdir')
 
         def _resolve_listing(resolved, iter_parts, cache=_listdir_cache):
             while True:  # Note: while True to make iterative and not recursive
@@ -304,8 +406,8 @@ def set_ide_os(os):
 
 
 # Caches filled as requested during the debug session.
-NORM_PATHS_CONTAINER = {}
-NORM_PATHS_AND_BASE_CONTAINER = {}
+NORM_PATHS_CONTAINER = _create_path_cache('norm_paths')
+NORM_PATHS_AND_BASE_CONTAINER = _create_path_cache('norm_paths_and_base')
 
 
 def _NormFile(filename):
@@ -366,47 +468,94 @@ def _NormPath(filename, normpath):
     return r
 
 
-_ZIP_SEARCH_CACHE = {}
+_ZIP_SEARCH_CACHE = _create_path_cache('zip_search')
 _NOT_FOUND_SENTINEL = object()
 
 
-def exists(file):
-    if os.path.exists(file):
-        return file
-
+def _split_zip_path(file):
+    '''
+    :return tuple(str, str)|None:
+        The path to the .zip/.egg and the path inside it or None if the path isn't inside
+        a .zip/.egg.
+    '''
     ind = file.find('.zip')
     if ind == -1:
         ind = file.find('.egg')
 
-    if ind != -1:
-        ind += 4
-        zip_path = file[:ind]
-        inner_path = file[ind:]
-        if inner_path.startswith("!"):
-            # Note (fabioz): although I can replicate this by creating a file ending as
-            # .zip! or .egg!, I don't really know what's the real-world case for this
-            # (still kept as it was added by @jetbrains, but it should probably be reviewed
-            # later on).
-            # Note 2: it goes hand-in-hand with '_NormPath'.
-            inner_path = inner_path[1:]
-            zip_path = zip_path + '!'
+    if ind == -1:
+        return None
 
-        zip_file_obj = _ZIP_SEARCH_CACHE.get(zip_path, _NOT_FOUND_SENTINEL)
-        if zip_file_obj is None:
-            return False
-        elif zip_file_obj is _NOT_FOUND_SENTINEL:
-            try:
-                import zipfile
-                zip_file_obj = zipfile.ZipFile(zip_path, 'r')
-                _ZIP_SEARCH_CACHE[zip_path] = zip_file_obj
-            except:
-                _ZIP_SEARCH_CACHE[zip_path] = _NOT_FOUND_SENTINEL
-                return False
+    ind += 4
+    zip_path = file[:ind]
+    inner_path = file[ind:]
+    if inner_path.startswith("!"):
+        # Note (fabioz): although I can replicate this by creating a file ending as
+        # .zip! or .egg!, I don't really know what's the real-world case for this
+        # (still kept as it was added by @jetbrains, but it should probably be reviewed
+        # later on).
+        # Note 2: it goes hand-in-hand with '_NormPath'.
+        inner_path = inner_path[1:]
+        zip_path = zip_path + '!'
+
+    if inner_path.startswith('/') or inner_path.startswith('\\'):
+        inner_path = inner_path[1:]
+    return zip_path, inner_path
 
+
+def _get_zip_file_obj(zip_path):
+    '''
+    :return zipfile.ZipFile|None|False:
+        The (cached) zip file or a false value if it can't be opened.
+    '''
+    zip_file_obj = _ZIP_SEARCH_CACHE.get(zip_path, _NOT_FOUND_SENTINEL)
+    if zip_file_obj is None:
+        return False
+    elif zip_file_obj is _NOT_FOUND_SENTINEL:
         try:
-            if inner_path.startswith('/') or inner_path.startswith('\\'):
-                inner_path = inner_path[1:]
+            import zipfile
+            zip_file_obj = zipfile.ZipFile(zip_path, 'r')
+            _ZIP_SEARCH_CACHE[zip_path] = zip_file_obj
+        except:
+            _ZIP_SEARCH_CACHE[zip_path] = _NOT_FOUND_SENTINEL
+            return False
+    return zip_file_obj
+
+
+def get_zip_file_and_inner_path(file):
+    '''
+    :return tuple(zipfile.ZipFile, str)|None:
+        The zip file and the name of the member which has the contents of the given file
+        (which must be a path inside a .zip/.egg) or None if it can't be found.
+    '''
+    split = _split_zip_path(file)
+    if split is None:
+        return None
+
+    zip_path, inner_path = split
+    zip_file_obj = _get_zip_file_obj(zip_path)
+    if not zip_file_obj:
+        return None
+
+    member_name = inner_path.replace('\\', '/')
+    try:
+        zip_file_obj.getinfo(member_name)
+    except KeyError:
+        return None
+    return zip_file_obj, member_name
+
+
+def exists(file):
+    if os.path.exists(file):
+        return file
+
+    split = _split_zip_path(file)
+    if split is not None:
+        zip_path, inner_path = split
+        zip_file_obj = _get_zip_file_obj(zip_path)
+        if not zip_file_obj:
+            return False
 
+        try:
             _info = zip_file_obj.getinfo(inner_path.replace('\\', '/'))
 
             return join(zip_path, inner_path)
@@ -430,7 +579,7 @@ try:
         sys.stderr.write('-------------------------------------------------------------------------------\n')
         sys.stderr.flush()
 
-        NORM_SEARCH_CACHE = {}
+        NORM_SEARCH_CACHE = _create_path_cache('norm_search')
 
         initial_norm_paths = _NormPaths
 
@@ -483,13 +632,16 @@ def _path_to_expected_str(filename):
     return filename
 
 
-def _original_file_to_client(filename, cache={}):
+_original_file_to_client_cache = _create_path_cache('file_to_client')
+
+
+def _original_file_to_client(filename, cache=_original_file_to_client_cache):
     try:
         return cache[filename]
     except KeyError:
         translated = _path_to_expected_str(get_path_with_real_case(_AbsFile(filename)))
         cache[filename] = translated
-    return cache[filename]
+        return translated
 
 
 _original_file_to_server = _NormFile
@@ -507,6 +659,48 @@ def _fix_path(path, sep):
     return path
 
 
+class PathPrefixTrie(object):
+    '''
+    Maps path prefixes to values so that the value of the longest prefix of a path is found
+    in time proportional to the number of segments in the path (and not to the number of
+    prefixes).
+
+    Prefixes match only whole segments (i.e.: `/foo` matches `/foo` and `/foo/bar` but not
+    `/foobar`).
+    '''
+
+    def __init__(self, sep):
+        self.sep = sep
+        # Each node is a list with [value, children], where `children` maps a segment to
+        # the child node.
+        self._root = [_MISSING, {}]
+
+    def add(self, prefix, value):
+        '''
+        Note: if the same prefix is added more than once, the first value is kept.
+        '''
+        node = self._root
+        for segment in prefix.split(self.sep):
+            children = node[1]
+            try:
+                node = children[segment]
+            except KeyError:
+                node = children[segment] = [_MISSING, {}]
+        if node[0] is _MISSING:
+            node[0] = value
+
+    def get_longest_prefix_value(self, path, default=None):
+        found = default
+        node = self._root
+        for segment in path.split(self.sep):
+            node = node[1].get(segment)
+            if node is None:
+                break
+            if node[0] is not _MISSING:
+                found = node[0]
+        return found
+
+
 _last_client_server_paths_set = []
 
 _source_reference_to_server_filename = {}
@@ -540,8 +734,8 @@ def setup_client_server_paths(paths):
     python_sep = '\\' if IS_WINDOWS else '/'
     eclipse_sep = '\\' if _ide_os == 'WINDOWS' else '/'
 
-    norm_filename_to_server_container = {}
-    norm_filename_to_client_container = {}
+    norm_filename_to_server_container = _create_path_cache('mapped_file_to_server')
+    norm_filename_to_client_container = _create_path_cache('mapped_file_to_client')
     initial_paths = list(paths)
     paths_from_eclipse_to_python = initial_paths[:]
 
@@ -566,6 +760,14 @@ def setup_client_server_paths(paths):
         norm_file_to_server = _original_file_to_server
         return
 
+    # When more than one mapping matches, the longest one is used (if the same path is mapped
+    # more than once the first mapping is used).
+    client_prefixes_trie = PathPrefixTrie(eclipse_sep)
+    server_prefixes_trie = PathPrefixTrie(python_sep)
+    for i, (eclipse_prefix, server_prefix) in enumerate(paths_from_eclipse_to_python):
+        client_prefixes_trie.add(eclipse_prefix, i)
+        server_prefixes_trie.add(server_prefix, i)
+
     # only setup translation functions if absolutely needed!
     def _norm_file_to_server(filename, cache=norm_filename_to_server_container):
         # Eclipse will send the passed filename to be translated to the python process
@@ -579,16 +781,15 @@ def setup_client_server_paths(paths):
 
             # used to translate a path from the client to the debug server
             translated = filename
-            translated_normalized = _normcase_from_client(filename)
-            for eclipse_prefix, server_prefix in paths_from_eclipse_to_python:
-                if translated_normalized.startswith(eclipse_prefix):
-                    found_translation = True
-                    if DEBUG_CLIENT_SERVER_TRANSLATION:
-                        sys.stderr.write('pydev debugger: replacing to server: %s\n' % (filename,))
-                    translated = server_prefix + filename[len(eclipse_prefix):]
-                    if DEBUG_CLIENT_SERVER_TRANSLATION:
-                        sys.stderr.write('pydev debugger: sent to server: %s\n' % (translated,))
-                    break
+            i = client_prefixes_trie.get_longest_prefix_value(_normcase_from_client(filename))
+            if i is not None:
+                found_translation = True
+                eclipse_prefix, server_prefix = paths_from_eclipse_to_python[i]
+                if DEBUG_CLIENT_SERVER_TRANSLATION:
+                    sys.stderr.write('pydev debugger: replacing to server: %s\n' % (filename,))
+                translated = server_prefix + filename[len(eclipse_prefix):]
+                if DEBUG_CLIENT_SERVER_TRANSLATION:
+                    sys.stderr.write('pydev debugger: sent to server: %s\n' % (translated,))
             else:
                 found_translation = False
 
@@ -638,18 +839,18 @@ def setup_client_server_paths(paths):
                             'pydev debugger: _NormFile changed path (from: %s to %s)\n' % (
                                 translated_proper_case, translated))
 
-            for i, (eclipse_prefix, python_prefix) in enumerate(paths_from_eclipse_to_python):
-                if translated.startswith(python_prefix):
-                    if DEBUG_CLIENT_SERVER_TRANSLATION:
-                        sys.stderr.write('pydev debugger: replacing to client: %s\n' % (translated,))
+            i = server_prefixes_trie.get_longest_prefix_value(translated)
+            if i is not None:
+                python_prefix = paths_from_eclipse_to_python[i][1]
+                if DEBUG_CLIENT_SERVER_TRANSLATION:
+                    sys.stderr.write('pydev debugger: replacing to client: %s\n' % (translated,))
 
-                    # Note: use the non-normalized version.
-                    eclipse_prefix = initial_paths[i][0]
-                    translated = eclipse_prefix + translated_proper_case[len(python_prefix):]
-                    if DEBUG_CLIENT_SERVER_TRANSLATION:
-                        sys.stderr.write('pydev debugger: sent to client: %s\n' % (translated,))
-                    path_mapping_applied = True
-                    break
+                # Note: use the non-normalized version.
+                eclipse_prefix = initial_paths[i][0]
+                translated = eclipse_prefix + translated_proper_case[len(python_prefix):]
+                if DEBUG_CLIENT_SERVER_TRANSLATION:
+                    sys.stderr.write('pydev debugger: sent to client: %s\n' % (translated,))
+                path_mapping_applied = True
             else:
                 if DEBUG_CLIENT_SERVER_TRANSLATION:
                     sys.stderr.write('pydev debugger: to client: unable to find matching prefix for: %s in %s\n' % \
@@ -1,5 +1,9 @@
-try:
+import sys
+
+if 'pkg_resources' in sys.modules:
     __import__('pkg_resources').declare_namespace(__name__)
-except ImportError:
+else:
+    # Importing pkg_resources is slow (and this package is imported when the
+    # debugger starts), so, only use it if it was already imported.
     import pkgutil
     __path__ = pkgutil.extend_path(__path__, __name__)
@@ -105,9 +105,9 @@ def restore_sys_set_trace_func():
         TracingFunctionHolder._original_tracing = None
 
 
-def set_trace_to_threads(tracing_func, target_threads=None):
+def _get_attach_lib_filename():
     if not IS_CPYTHON or ctypes is None or sys.version_info[:2] > (3, 7):
-        return -1
+        return None
 
     if IS_WINDOWS:
         if IS_64BIT_PROCESS:
@@ -115,7 +115,7 @@ def set_trace_to_threads(tracing_func, target_threads=None):
         else:
             suffix = 'x86'
 
-        filename = os.path.join(os.path.dirname(__file__), 'pydevd_attach_to_process', 'attach_%s.dll' % (suffix,))
+        return os.path.join(os.path.dirname(__file__), 'pydevd_attach_to_process', 'attach_%s.dll' % (suffix,))
 
     elif IS_LINUX:
         if IS_64BIT_PROCESS:
@@ -123,7 +123,7 @@ def set_trace_to_threads(tracing_func, target_threads=None):
         else:
             suffix = 'x86'
 
-        filename = os.path.join(os.path.dirname(__file__), 'pydevd_attach_to_process', 'attach_linux_%s.so' % (suffix,))
+        return os.path.join(os.path.dirname(__file__), 'pydevd_attach_to_process', 'attach_linux_%s.so' % (suffix,))
 
     elif IS_MAC:
         if IS_64BIT_PROCESS:
@@ -131,10 +131,26 @@ def set_trace_to_threads(tracing_func, target_threads=None):
         else:
             suffix = 'x86.dylib'
 
-        filename = os.path.join(os.path.dirname(__file__), 'pydevd_attach_to_process', 'attach_%s' % (suffix,))
+        return os.path.join(os.path.dirname(__file__), 'pydevd_attach_to_process', 'attach_%s' % (suffix,))
 
     else:
         pydev_log.info('Unable to set trace to all threads in platform: %s', sys.platform)
+        return None
+
+
+def can_set_trace_to_threads():
+    '''
+    :return bool:
+        Whether `set_trace_to_threads` is supported (i.e.: whether it's possible to set the tracing
+        for threads other than the current one).
+    '''
+    filename = _get_attach_lib_filename()
+    return filename is not None and os.path.exists(filename)
+
+
+def set_trace_to_threads(tracing_func, target_threads=None):
+    filename = _get_attach_lib_filename()
+    if filename is None:
         return -1
 
     if not os.path.exists(filename):
@@ -509,4 +509,25 @@ class B(object):
         self.assertEqual(10, b.bar)
         self.assertRaises(Exception, setattr, b, 'foo', 20) #__slots__ can't be updated
 
+    def test_reload_only_changed_functions(self):
+        # A module with ~10k lines (2000 functions with 5 lines each) where a single function changes.
+        sample = ''.join(
+            'def func%s(a, b=%s):\n    c = a + b\n    d = c * 2\n    return [d, "%s"]\n\n' % (i, i, i)
+            for i in range(2000))
+        self.make_mod(sample=sample)
+        import x  # @UnresolvedImport
+        func0 = x.func0
+        func1 = x.func1
+        func1_defaults = func1.__defaults__
+
+        self.make_mod(sample=sample.replace('return [d, "0"]', 'return [d, "changed"]'))
+        reload_info = pydevd_reload.xreload_module(x)
+
+        self.assertTrue(reload_info.found_change)
+        self.assertEqual(2000, reload_info.functions_checked)
+        self.assertEqual(1, reload_info.functions_changed)
+        self.assertEqual([0, 'changed'], func0(0))
+        self.assertEqual([4, '1'], func1(1))
 
+        # Unchanged functions aren't touched.
+        self.assertIs(func1_defaults, func1.__defaults__)
@@ -543,3 +543,32 @@ def case_setup_flask():
                 yield writer
 
     return CaseSetup()
+
+
+class _FakeWriter(object):
+
+    def __init__(self):
+        self.commands = []
+
+    def add_command(self, cmd):
+        self.commands.append(cmd)
+
+
+class _FakePyDB(object):
+    '''
+    Stands in for PyDB in unit tests which only need to collect the commands sent to the client.
+    '''
+
+    def __init__(self):
+        self.writer = _FakeWriter()
+        self.signature_factory = None
+        self.break_on_caught_exceptions = False
+        self.has_plugin_exception_breaks = False
+
+    def in_project_scope(self, filename):
+        return True
+
+
+@pytest.fixture
+def fake_py_db():
+    return _FakePyDB()
@@ -0,0 +1,33 @@
+'''
+Checks how the time to translate client paths to server paths changes with the number of
+path mappings (the longest matching mapping is found with a prefix trie, so, it should be
+mostly the same regardless of the number of mappings).
+
+Run with: python -m tests_python.performance_check_path_mappings
+'''
+import time
+
+import pydevd_file_utils
+
+PATHS = 20000
+
+
+def check_norm_file_to_server(mappings_count):
+    pydevd_file_utils.set_ide_os('UNIX')
+    pydevd_file_utils.setup_client_server_paths([
+        ('/monorepo/services/service%s/src' % (i,), '/srv/service%s' % (i,)) for i in range(mappings_count)])
+    try:
+        # Different paths are used so that the results aren't just gotten from the cache.
+        paths = ['/monorepo/services/service%s/src/package/module%s.py' % (i % mappings_count, i) for i in range(PATHS)]
+
+        initial_time = time.time()
+        for path in paths:
+            pydevd_file_utils.norm_file_to_server(path)
+        return 'Translated %s paths with %s mappings: %.2fs' % (PATHS, mappings_count, time.time() - initial_time)
+    finally:
+        pydevd_file_utils.setup_client_server_paths([])
+
+
+if __name__ == '__main__':
+    for mappings_count in (1, 10, 100, 1000):
+        print(check_norm_file_to_server(mappings_count))
@@ -0,0 +1,10 @@
+def method():
+    a = 1
+    # Not a valid jump target.
+    a = 2  # Break here
+    print('call %s' % (a,))
+
+
+if __name__ == '__main__':
+    method()
+    print('TEST SUCEEDED!')
@@ -195,6 +195,30 @@ def test_collect_try_except_info2():
         assert lst == []
 
 
+def test_collect_try_except_info_cached(monkeypatch):
+    from _pydevd_bundle import pydevd_collect_try_except_info
+    from _pydevd_bundle.pydevd_collect_try_except_info import collect_try_except_info_cached
+
+    calls = []
+    original_collect_try_except_info = pydevd_collect_try_except_info.collect_try_except_info
+
+    def collect_try_except_info(co):
+        calls.append(co)
+        return original_collect_try_except_info(co)
+
+    monkeypatch.setattr(pydevd_collect_try_except_info, 'collect_try_except_info', collect_try_except_info)
+
+    def method():
+        try:
+            raise KeyError()
+        except KeyError:
+            pass
+
+    try_except_info = collect_try_except_info_cached(method.__code__)
+    assert collect_try_except_info_cached(method.__code__) is try_except_info
+    assert calls == [method.__code__]
+
+
 def _create_entry(instruction):
     argval = instruction.argval
     return dict(
@@ -294,3 +294,126 @@ def test_zip_paths(tmpdir):
 
         assert zipfile_path in pydevd_file_utils._ZIP_SEARCH_CACHE, '%s not in %s' % (
             zipfile_path, '\n'.join(sorted(pydevd_file_utils._ZIP_SEARCH_CACHE.keys())))
+
+
+def test_path_cache():
+    from pydevd_file_utils import PathCache
+
+    cache = PathCache('test', max_size=4)
+    for i in range(2):
+        cache[i] = str(i)
+
+    assert cache[0] == '0'
+    assert cache.get(10) is None
+    try:
+        cache[11]
+    except KeyError:
+        pass
+    else:
+        raise AssertionError('Expected KeyError.')
+
+    # The current generation is full: 0 and 1 go to the old generation.
+    cache[2] = '2'
+    assert 0 in cache
+    # 0 is promoted (which makes the current generation full again).
+    assert cache[0] == '0'
+    cache[3] = '3'
+    # 1 wasn't used, so, it was evicted.
+    assert 1 not in cache
+    assert cache[2] == '2'
+    assert cache[0] == '0'
+
+    # `cache[key]` hits in the current generation aren't counted (only promotions and `get()`).
+    assert cache.get(0) == '0'
+    assert cache.get_stats() == {
+        'size': 3,
+        'max_size': 4,
+        'promotions': 3,
+        'get_hits': 1,
+        'misses': 2,
+        'evictions': 1,
+    }
+
+    cache.clear()
+    assert 0 not in cache
+    assert cache.get_stats()['size'] == 0
+
+
+def test_path_caches_stats():
+    import pydevd_file_utils
+
+    pydevd_file_utils.clear_path_caches()
+    pydevd_file_utils.get_abs_path_real_path_and_base_from_file(__file__)
+    pydevd_file_utils.get_abs_path_real_path_and_base_from_file(__file__)
+
+    stats = pydevd_file_utils.get_path_caches_stats()
+    assert stats['norm_paths_and_base']['misses'] >= 1
+    assert stats['norm_paths_and_base']['size'] >= 1
+
+    pydevd_file_utils.clear_path_caches()
+    stats = pydevd_file_utils.get_path_caches_stats()
+    assert stats['norm_paths_and_base']['size'] == 0
+
+
+def test_path_prefix_trie():
+    from pydevd_file_utils import PathPrefixTrie
+
+    trie = PathPrefixTrie('/')
+    trie.add('', 'root')
+    trie.add('/foo', 'foo')
+    trie.add('/foo/bar', 'bar')
+    trie.add('/foo', 'ignored')  # The first value added is kept.
+
+    assert trie.get_longest_prefix_value('/foo') == 'foo'
+    assert trie.get_longest_prefix_value('/foo/') == 'foo'
+    assert trie.get_longest_prefix_value('/foo/my.py') == 'foo'
+    assert trie.get_longest_prefix_value('/foo/bar/my.py') == 'bar'
+    assert trie.get_longest_prefix_value('/foobar/my.py') == 'root'
+    assert trie.get_longest_prefix_value('relative/my.py') is None
+    assert trie.get_longest_prefix_value('relative/my.py', -1) == -1
+
+
+def test_to_server_longest_mapping(tmpdir):
+    import pydevd_file_utils
+    try:
+        if IS_WINDOWS:
+            client_root, client_lib = 'c:\\client', 'c:\\client\\lib'
+        else:
+            client_root, client_lib = '/client', '/client/lib'
+        server_root = str(tmpdir.mkdir('root'))
+        server_lib = str(tmpdir.mkdir('lib'))
+        sep = os.path.sep
+
+        pydevd_file_utils.set_ide_os('WINDOWS' if IS_WINDOWS else 'UNIX')
+        # The longest prefix is used regardless of the order of the mappings.
+        for paths in ([(client_root, server_root), (client_lib, server_lib)], [(client_lib, server_lib), (client_root, server_root)]):
+            pydevd_file_utils.setup_client_server_paths(paths)
+            assert pydevd_file_utils.norm_file_to_server(client_lib + sep + 'my.py') == \
+                pydevd_file_utils.normcase(os.path.join(server_lib, 'my.py'))
+            assert pydevd_file_utils.norm_file_to_server(client_root + sep + 'my.py') == \
+                pydevd_file_utils.normcase(os.path.join(server_root, 'my.py'))
+            assert pydevd_file_utils.norm_file_to_client(os.path.join(server_lib, 'my.py')) == client_lib + sep + 'my.py'
+    finally:
+        pydevd_file_utils.setup_client_server_paths([])
+
+
+def test_path_prefix_trie_matches_linear_scan():
+    from pydevd_file_utils import PathPrefixTrie
+
+    # Note: the timing is checked in performance_check_path_mappings.py.
+    prefixes = ['/repo/service%s/src' % (i,) for i in range(10)] + ['/repo/service1/src/nested', '/repo']
+    trie = PathPrefixTrie('/')
+    for i, prefix in enumerate(prefixes):
+        trie.add(prefix, i)
+
+    paths = ['/repo/service%s/src/module%s.py' % (i % 12, i) for i in range(30)]
+    paths += ['/repo/service1/src/nested/module.py', '/repo/service1/srcx/module.py', '/other/module.py']
+
+    def linear_scan(path):
+        found = None
+        for i, prefix in enumerate(prefixes):
+            if path.startswith(prefix + '/') and (found is None or len(prefix) > len(prefixes[found])):
+                found = i
+        return found
+
+    assert [trie.get_longest_prefix_value(path) for path in paths] == [linear_scan(path) for path in paths]
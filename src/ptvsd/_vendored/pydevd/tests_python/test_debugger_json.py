@@ -1811,6 +1811,54 @@ def test_evaluate_failures(case_setup):
         writer.finished_ok = True
 
 
+
+@pytest.mark.skipif(not IS_CPYTHON, reason='Interrupting evaluations is only available in CPython.')
+def test_evaluate_watches(case_setup):
+    with case_setup.test_file('_debugger_case_evaluate.py') as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_set_breakpoints(writer.get_line_index_with_content('Break here'))
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped()
+        stack_frames = json_hit.stack_trace_response.body.stackFrames
+        call_frame_id = stack_frames[0]['id']
+        module_frame_id = stack_frames[1]['id']
+
+        watches_request = json_facade.write_request(
+            pydevd_schema.PydevdEvaluateWatchesRequest(pydevd_schema.PydevdEvaluateWatchesArguments(
+                expressions=[
+                    {'expression': 'var_1'},
+                    {'expression': 'var_1', 'frameId': module_frame_id},
+                    {'expression': 'sum(1 for _i in range(10 ** 10))'},
+                    {'expression': 'var_1 + 1'},
+                ],
+                frameId=call_frame_id,
+                timeout=0.5,
+            )))
+        watches_response = json_facade.wait_for_response(watches_request)
+        results = watches_response.body.results
+        assert [result['expression'] for result in results] == [
+            'var_1', 'var_1', 'sum(1 for _i in range(10 ** 10))', 'var_1 + 1']
+
+        # Evaluated in the frame of the request.
+        assert results[0]['result'] == '5'
+        assert results[0].get('error') is None
+
+        # Evaluated in the frame of the watch (where var_1 isn't defined).
+        assert 'NameError' in results[1]['error']
+
+        # Interrupted (the next evaluation must not be affected).
+        assert results[2]['error'] == 'Evaluation timed out (time budget: 0.5s).'
+        assert results[2]['variablesReference'] == 0
+        assert results[3]['result'] == '6'
+        assert results[3].get('error') is None
+
+        json_facade.write_continue(wait_for_response=False)
+
+        writer.finished_ok = True
+
+
 @pytest.mark.parametrize('max_frames', ['default', 'all', 10])  # -1 = default, 0 = all, 10 = 10 frames
 def test_exception_details(case_setup, max_frames):
     with case_setup.test_file('_debugger_case_large_exception_stack.py') as writer:
@@ -1978,6 +2026,41 @@ def test_goto(case_setup):
         writer.finished_ok = True
 
 
+@pytest.mark.skipif(IS_JYTHON, reason='No goto on Jython.')
+def test_goto_invalid_target(case_setup):
+    with case_setup.test_file('_debugger_case_goto_invalid_target.py') as writer:
+        json_facade = JsonFacade(writer)
+
+        break_line = writer.get_line_index_with_content('Break here')
+        invalid_line = writer.get_line_index_with_content('Not a valid jump target')
+        json_facade.write_set_breakpoints(break_line)
+
+        json_facade.write_make_initial_run()
+
+        json_facade.wait_for_thread_stopped()
+
+        goto_targets_request = json_facade.write_request(
+            pydevd_schema.GotoTargetsRequest(pydevd_schema.GotoTargetsArguments(
+                source=pydevd_schema.Source(path=writer.TEST_FILE, sourceReference=0),
+                line=invalid_line)))
+        goto_targets_response = json_facade.wait_for_response(goto_targets_request)
+        assert not goto_targets_response.success
+        assert goto_targets_response.body.targets == []
+        assert goto_targets_response.message == 'Line %s is not a valid jump target in method.' % (invalid_line,)
+
+        goto_targets_request = json_facade.write_request(
+            pydevd_schema.GotoTargetsRequest(pydevd_schema.GotoTargetsArguments(
+                source=pydevd_schema.Source(path=writer.TEST_FILE, sourceReference=0),
+                line=break_line - 2)))
+        goto_targets_response = json_facade.wait_for_response(goto_targets_request)
+        assert goto_targets_response.success
+        assert goto_targets_response.body.targets[0]['line'] == break_line - 2
+
+        json_facade.write_continue(wait_for_response=False)
+
+        writer.finished_ok = True
+
+
 def _collect_stack_frames_ending_with(json_hit, end_with_pattern):
     stack_trace_response = json_hit.stack_trace_response
     dont_trace_frames = list(frame for frame in stack_trace_response.body.stackFrames
@@ -0,0 +1,58 @@
+pytest_plugins = [
+    str('tests_python.debugger_fixtures'),
+]
+
+
+def test_completions_index():
+    import sys
+    from _pydev_bundle._pydev_completer import generate_completions
+
+    class Obj(object):
+        dir_calls = 0
+
+        def __dir__(self):
+            Obj.dir_calls += 1
+            return ['Alpha', 'alpine', 'beta', 'method']
+
+        def method(self, a):
+            pass
+
+    obj = Obj()
+    local_var_one = local_var_two = 1
+    frame = sys._getframe()
+    completions_cache = {}
+
+    assert [c[0] for c in generate_completions(frame, 'obj.al', completions_cache)] == ['Alpha', 'alpine']
+    assert [c[0] for c in generate_completions(frame, 'obj.ALP', completions_cache)] == ['Alpha', 'alpine']
+    assert [c[0] for c in generate_completions(frame, 'obj.me', completions_cache)] == ['method']
+    assert generate_completions(frame, 'obj.me', completions_cache)[0][2] == '(self, a)'
+    assert generate_completions(frame, 'obj.z', completions_cache) == []
+    assert Obj.dir_calls == 1
+
+    assert [c[0] for c in generate_completions(frame, 'local_var_', completions_cache)] == [
+        'local_var_one', 'local_var_two']
+    assert [c[0] for c in generate_completions(frame, 'isinst', completions_cache)] == ['isinstance']
+    assert generate_completions(frame, 'undefined_var.', completions_cache) == []
+
+    # The results are the same as without the index.
+    assert sorted(generate_completions(frame, 'obj.', completions_cache)) == sorted(generate_completions(frame, 'obj.'))
+
+
+def test_completions_index_cleared_on_exec(fake_py_db):
+    import sys
+    from _pydev_bundle._pydev_completer import generate_completions
+    from _pydevd_bundle import pydevd_vars
+    from _pydevd_bundle.pydevd_suspended_frames import SuspendedFramesManager
+
+    fake_py_db.suspended_frames_manager = SuspendedFramesManager()
+    namespace = {'sys': sys, 'first_var': 1}
+    exec('frame = sys._getframe()', namespace)
+    frame = namespace.pop('frame')
+    with fake_py_db.suspended_frames_manager.track_frames(fake_py_db) as tracker:
+        tracker.track('thread1', frame, {})
+        assert [c[0] for c in generate_completions(frame, 'first_', tracker.completions_cache)] == ['first_var']
+
+        # The size of the namespace doesn't change.
+        pydevd_vars.evaluate_expression(fake_py_db, frame, 'del first_var; second_var = 1', is_exec=True)
+        assert generate_completions(frame, 'first_', tracker.completions_cache) == []
+        assert [c[0] for c in generate_completions(frame, 'second_', tracker.completions_cache)] == ['second_var']
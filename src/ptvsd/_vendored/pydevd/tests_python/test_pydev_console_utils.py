@@ -0,0 +1,18 @@
+def test_compile_command_cached():
+    import codeop
+    from _pydev_bundle.pydev_console_utils import compile_command_cached
+
+    command_compiler = codeop.CommandCompiler()
+    code = compile_command_cached(command_compiler, 'a = 1 + 2', '<console>')
+    assert code is not None
+    assert compile_command_cached(command_compiler, 'a = 1 + 2', '<console>') is code
+
+    # Incomplete input.
+    assert compile_command_cached(command_compiler, 'if True:', '<console>') is None
+
+    try:
+        compile_command_cached(command_compiler, 'a = = 1', '<console>')
+    except SyntaxError:
+        pass
+    else:
+        raise AssertionError('Expected SyntaxError.')
@@ -0,0 +1,173 @@
+import os
+import threading
+
+import pytest
+
+
+def test_inherit_state_from_forked_parent(tmpdir):
+    from pydevd import PyDB
+    from _pydevd_bundle.pydevd_filtering import ExcludeFilter
+    parent_py_db = PyDB(set_as_global=False)
+    parent_py_db.set_project_roots([str(tmpdir)])
+    parent_py_db.set_exclude_filters([ExcludeFilter('**/lib/**', True, True)])
+    parent_py_db.set_ignore_system_exit_codes([0, 1])
+    parent_py_db.break_on_caught_exceptions = {'ValueError': object()}
+    parent_py_db.in_project_scope(str(tmpdir.join('a.py')))
+
+    child_py_db = PyDB(set_as_global=False)
+    child_py_db.inherit_state_from_forked_parent(parent_py_db)
+
+    assert child_py_db.break_on_caught_exceptions is parent_py_db.break_on_caught_exceptions
+    assert child_py_db.is_files_filter_enabled
+    assert child_py_db._in_project_scope_cache == {str(tmpdir.join('a.py')): True}
+    assert child_py_db.in_project_scope(str(tmpdir.join('b.py')))
+    assert not child_py_db.in_project_scope(threading.__file__)
+    assert child_py_db.ignore_system_exit_code(SystemExit(1))
+
+
+def test_defer_tracing(monkeypatch):
+    from pydevd import PyDB
+    from _pydevd_bundle.pydevd_excepthooks import uninstall_excepthooks
+    py_db = PyDB(set_as_global=False)
+    assert not py_db.defer_tracing_if_possible()  # Not enabled by default.
+
+    py_db.defer_tracing = True
+    set_tracing_for_untraced_contexts = []
+    monkeypatch.setattr(py_db, 'set_tracing_for_untraced_contexts', lambda: set_tracing_for_untraced_contexts.append(1))
+    try:
+        assert py_db.defer_tracing_if_possible()
+        assert py_db.get_thread_local_trace_func() is py_db._deferred_trace_func
+
+        # Only stopping on unhandled exceptions doesn't require tracing.
+        py_db.add_break_on_exception('ValueError', None, None, False, True, False)
+        assert not py_db._requires_tracing()
+
+        py_db.file_to_id_to_line_breakpoint = {'a.py': {1: object()}}
+        assert py_db._requires_tracing()
+        py_db.ready_to_run = True
+        py_db.on_breakpoints_changed(removed=False)
+        assert not py_db._tracing_deferred
+        assert py_db.get_thread_local_trace_func() is not py_db._deferred_trace_func
+        assert set_tracing_for_untraced_contexts == [1, 1]
+    finally:
+        # The tracing may also have been set to the current thread.
+        py_db.disable_tracing()
+        threading.settrace(None)
+        uninstall_excepthooks()
+
+
+def test_caught_exception_breakpoint_cache():
+    from pydevd import PyDB
+    py_db = PyDB(set_as_global=False)
+    assert py_db.get_caught_exception_breakpoint(KeyError) is None
+
+    calls = []
+    original_get_exception_breakpoint = py_db.get_exception_breakpoint
+
+    def get_exception_breakpoint(exctype, exceptions):
+        calls.append(exctype)
+        return original_get_exception_breakpoint(exctype, exceptions)
+
+    py_db.get_exception_breakpoint = get_exception_breakpoint
+
+    lookup_error_breakpoint = py_db.add_break_on_exception('LookupError', None, None, True, False, False)
+    for _i in range(3):
+        assert py_db.get_caught_exception_breakpoint(KeyError) is lookup_error_breakpoint
+        assert py_db.get_caught_exception_breakpoint(ValueError) is None
+    assert calls == [KeyError, ValueError]
+
+    # Changing the breakpoints invalidates the cache.
+    key_error_breakpoint = py_db.add_break_on_exception('KeyError', None, None, True, False, False)
+    assert py_db.get_caught_exception_breakpoint(KeyError) is key_error_breakpoint
+    assert py_db.get_caught_exception_breakpoint(IndexError) is lookup_error_breakpoint
+
+
+def test_step_into_my_code_user_code_index(tmpdir, monkeypatch):
+    import sys
+    from pydevd import PyDB
+    from _pydevd_bundle import pydevd_trace_dispatch_regular
+    from _pydevd_bundle.pydevd_additional_thread_info import PyDBAdditionalThreadInfo
+    from _pydevd_bundle.pydevd_comm_constants import CMD_STEP_INTO_MY_CODE
+    from pydevd_file_utils import get_abs_path_real_path_and_base_from_file
+
+    py_db = PyDB(set_as_global=False)
+    py_db.set_project_roots([str(tmpdir.join('project'))])
+
+    # A deep library stack.
+    namespace = {}
+    lib_filename = str(tmpdir.join('lib', 'lib.py'))
+    exec(compile('def call_lib(depth):\n    if depth:\n        call_lib(depth - 1)\n', lib_filename, 'exec'), namespace)
+    call_lib = namespace['call_lib']
+
+    created_frames = []
+
+    class PyDBFrame(pydevd_trace_dispatch_regular.PyDBFrame):
+
+        def __init__(self, args):
+            created_frames.append(args[1])
+            pydevd_trace_dispatch_regular.PyDBFrame.__init__(self, args)
+
+    monkeypatch.setattr(pydevd_trace_dispatch_regular, 'PyDBFrame', PyDBFrame)
+    monkeypatch.setattr(pydevd_trace_dispatch_regular, '_global_notify_skipped_step_in', True)
+
+    additional_info = PyDBAdditionalThreadInfo()
+    additional_info.pydev_step_cmd = CMD_STEP_INTO_MY_CODE
+    additional_info.pydev_original_step_cmd = CMD_STEP_INTO_MY_CODE
+    thread_tracer = pydevd_trace_dispatch_regular.ThreadTracer(
+        (py_db, threading.current_thread(), additional_info, {}, {}))
+
+    py_db.index_loaded_user_code()
+    assert py_db.user_code_index[get_abs_path_real_path_and_base_from_file(__file__)[1]] == 0
+
+    depth = 500
+    original_trace_func = sys.gettrace()
+    sys.settrace(thread_tracer)
+    try:
+        for _i in range(20):
+            call_lib(depth)
+    finally:
+        sys.settrace(original_trace_func)
+
+    assert created_frames == []
+    lib_abs_real_path_and_basename = get_abs_path_real_path_and_base_from_file(lib_filename)
+    assert py_db.user_code_index[lib_abs_real_path_and_basename[1]] == 0
+
+    # Adding a breakpoint in the library makes it traced.
+    py_db.ready_to_run = True
+    py_db.on_breakpoints_changed()
+    assert py_db.user_code_index == {}
+    assert not py_db._is_user_code_file(lib_abs_real_path_and_basename, 'lib')
+    py_db.breakpoints[lib_abs_real_path_and_basename[1]] = {2: object()}
+    assert py_db._is_user_code_file(lib_abs_real_path_and_basename, 'lib')
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink'), reason='Requires os.symlink.')
+def test_user_code_index_normalized_paths(tmpdir, monkeypatch):
+    import sys
+    import types
+    from pydevd import PyDB
+    from pydevd_file_utils import get_abs_path_real_path_and_base_from_frame
+
+    project_dir = tmpdir.join('project')
+    project_dir.ensure(dir=True)
+    module_file = project_dir.join('mod.py')
+    module_file.write('import sys\ndef get_frame():\n    return sys._getframe()\n')
+    link_dir = tmpdir.join('link')
+    os.symlink(str(project_dir), str(link_dir))
+
+    py_db = PyDB(set_as_global=False)
+    py_db.set_project_roots([str(project_dir)])
+
+    # The module was loaded from a .pyc through a symlink whereas its code has the real path
+    # as the co_filename.
+    module = types.ModuleType('_user_code_index_module')
+    module.__file__ = str(link_dir.join('mod.pyc'))
+    monkeypatch.setitem(sys.modules, '_user_code_index_module', module)
+    py_db.index_loaded_user_code()
+
+    namespace = {}
+    exec(compile(module_file.read(), str(module_file), 'exec'), namespace)
+    frame = namespace['get_frame']()
+
+    # The lookup done by the tracer finds the entry added for the module.
+    assert py_db.user_code_index[get_abs_path_real_path_and_base_from_frame(frame)[1]] == 1
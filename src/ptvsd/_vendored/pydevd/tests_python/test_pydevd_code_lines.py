@@ -0,0 +1,94 @@
+import sys
+
+import pytest
+
+
+def test_code_line_table():
+    import sys
+    from _pydevd_bundle.pydevd_code_lines import get_code_line_table, get_code_lines
+
+    code = '''
+def func(getframe):
+    a = 1
+    for i in range(1):
+        in_loop = getframe().f_lasti
+    b = 2
+    return in_loop, getframe().f_lasti
+
+class Foo:
+    x = 1
+'''
+    namespace = {}
+    exec(compile(code, '<code_line_table>', 'exec'), namespace)
+    func = namespace['func']
+    in_loop_offset, after_loop_offset = func(sys._getframe)
+
+    line_table = get_code_line_table(func.__code__)
+    assert get_code_line_table(func.__code__) is line_table
+    assert [3, 4, 5, 6, 7] == [line for line in line_table.lines if line > 2]
+
+    assert line_table.get_jump_error(after_loop_offset, 6) is None
+    assert line_table.get_jump_error(after_loop_offset, 8) is not None
+    assert line_table.get_nearest_line(8) == 7
+    assert line_table.get_nearest_line(1) == line_table.lines[0]
+
+    if sys.version_info[0] >= 3:
+        # Jumping into a loop isn't valid, but jumping inside it or out of it is.
+        assert line_table.get_jump_error(after_loop_offset, 5) is not None
+        assert 5 not in line_table.get_jump_targets(after_loop_offset)
+        assert line_table.get_jump_error(in_loop_offset, 5) is None
+        assert line_table.get_jump_error(in_loop_offset, 7) is None
+
+    module_lines = set(get_code_lines(compile(code, '<code_line_table>', 'exec')))
+    assert set([3, 4, 5, 6, 7, 9, 10]).issubset(module_lines)
+
+
+@pytest.mark.skipif(sys.version_info[0] < 3, reason='Loops are only checked in Python 3.')
+def test_code_line_table_jump_from_for_header():
+    from _pydevd_bundle.pydevd_code_lines import get_code_line_table
+
+    code = '''
+def func():
+    visited = []
+    for i in range(3):
+        visited.append(i)
+    return visited
+'''
+    namespace = {}
+    exec(compile(code, '<code_line_table_for_header>', 'exec'), namespace)
+    func = namespace['func']
+    line_table = get_code_line_table(func.__code__)
+
+    jumps = []
+    header_events = []
+
+    def tracer(frame, event, arg):
+        if frame.f_code is not func.__code__:
+            return None
+        if event == 'line' and frame.f_lineno == 4:
+            header_events.append(frame.f_lasti)
+            if len(header_events) == 2:
+                # Second iteration: the current instruction is the FOR_ITER itself.
+                jump_error = line_table.get_jump_error(frame.f_lasti, 5)
+                try:
+                    frame.f_lineno = 5
+                except ValueError:
+                    jumped = False
+                else:
+                    jumped = True
+                jumps.append((jump_error, jumped))
+        return tracer
+
+    original_trace_func = sys.gettrace()
+    sys.settrace(tracer)
+    try:
+        visited = func()
+    finally:
+        sys.settrace(original_trace_func)
+
+    # The line table must agree with the interpreter.
+    [(jump_error, jumped)] = jumps
+    assert (jump_error is None) == jumped
+    if sys.version_info[:2] != (3, 8):
+        assert jumped
+        assert visited == [0, 0, 1, 2]
@@ -0,0 +1,67 @@
+import sys
+
+pytest_plugins = [
+    str('tests_python.debugger_fixtures'),
+]
+
+
+def test_concurrency_events_ring_buffer():
+    from pydevd_concurrency_analyser.pydevd_concurrency_events import ConcurrencyEvents
+
+    events = ConcurrencyEvents(capacity=4)
+    events.record('threading_event', 0, 'MainThread', 'tid1', 'thread', 'start', 'a.py', 1, parent='tid1')
+    events.record('threading_event', 10, 'MainThread', 'tid1', 'lock', 'acquire_begin', 'a.py', 2, lock_id=1234)
+    events.record('threading_event', 20, 'MainThread', 'tid1', 'lock', 'acquire_end', 'a.py', 2, lock_id=1234)
+    events.record('threading_event', 30, 'MainThread', 'tid1', 'lock', 'release', 'a.py', 3, lock_id=1234)
+    assert len(events) == 4
+    assert events.dropped == 0
+
+    trace_events = events.to_chrome_trace()['traceEvents']
+    assert [(e['ph'], e['name']) for e in trace_events] == [
+        ('M', 'thread_name'),
+        ('i', 'thread start'),
+        ('b', 'wait lock 0'),
+        ('e', 'wait lock 0'),
+        ('b', 'hold lock 0'),
+        ('e', 'hold lock 0'),
+    ]
+    assert trace_events[0]['args'] == {'name': 'MainThread'}
+    assert trace_events[1]['args'] == {'file': 'a.py', 'line': 1, 'parent': 'tid1'}
+    assert trace_events[2]['id'] == trace_events[3]['id'] != trace_events[4]['id'] == trace_events[5]['id']
+
+    # When full the oldest events are overwritten.
+    events.record('threading_event', 40, 'Thread-1', 'tid2', 'thread', 'start', 'a.py', 4, parent='tid1')
+    assert len(events) == 4
+    assert events.dropped == 1
+    trace = events.to_chrome_trace()
+    assert trace['otherData'] == {'dropped': 1}
+    assert [e['ts'] for e in trace['traceEvents'] if e['ph'] != 'M'] == [10, 20, 20, 30, 40]
+    assert [e['args']['name'] for e in trace['traceEvents'] if e['ph'] == 'M'] == ['MainThread', 'Thread-1']
+
+
+def test_concurrency_record_event_by_protocol(monkeypatch, fake_py_db):
+    from _pydevd_bundle import pydevd_constants
+    from _pydevd_bundle.pydevd_constants import GlobalDebuggerHolder, JSON_PROTOCOL, QUOTED_LINE_PROTOCOL
+    from pydevd_concurrency_analyser import pydevd_concurrency_events
+    from pydevd_concurrency_analyser.pydevd_concurrency_events import ConcurrencyEvents
+    from pydevd_concurrency_analyser.pydevd_concurrency_logger import record_event
+
+    commands = fake_py_db.writer.commands
+    events = ConcurrencyEvents(capacity=4)
+    monkeypatch.setattr(pydevd_concurrency_events, '_concurrency_events', events)
+    monkeypatch.setattr(GlobalDebuggerHolder, 'global_dbg', fake_py_db)
+
+    # The XML protocol streams each event to the client.
+    monkeypatch.setattr(pydevd_constants._GlobalSettings, 'protocol', QUOTED_LINE_PROTOCOL)
+    record_event('threading_event', 10, 'MainThread', 'tid1', 'lock', 'acquire_begin', 'a.py', 2, sys._getframe(), lock_id=1234)
+    assert len(events) == 0
+    [cmd] = commands
+    assert cmd.id == 145
+    assert b'lock_id="1234"' in cmd._as_bytes
+    assert b'<frame id=' in cmd._as_bytes
+
+    # The JSON protocol records it to be exported on request.
+    monkeypatch.setattr(pydevd_constants._GlobalSettings, 'protocol', JSON_PROTOCOL)
+    record_event('threading_event', 10, 'MainThread', 'tid1', 'lock', 'acquire_begin', 'a.py', 2, sys._getframe(), lock_id=1234)
+    assert len(commands) == 1
+    assert len(events) == 1
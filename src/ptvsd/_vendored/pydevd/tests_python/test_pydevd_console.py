@@ -0,0 +1,19 @@
+def test_debug_console_cache():
+    import sys
+    from _pydevd_bundle import pydevd_console
+
+    console_cache = {}
+
+    def method():
+        a = 1
+        frame = sys._getframe()
+        message = pydevd_console.execute_console_command(frame, 'thread1', '1', 'a = a + 1', console_cache=console_cache)
+        assert not message.more
+        assert a == 2
+        console = console_cache[('thread1', '1')]
+
+        message = pydevd_console.execute_console_command(frame, 'thread1', '1', 'print(a)', console_cache=console_cache)
+        assert message.console_messages == [(pydevd_console.CONSOLE_OUTPUT, '2')]
+        assert console_cache[('thread1', '1')] is console
+
+    method()
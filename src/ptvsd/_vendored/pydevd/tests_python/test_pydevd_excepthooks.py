@@ -0,0 +1,47 @@
+import threading
+
+
+def test_excepthooks_stop_on_unhandled_exception(monkeypatch):
+    import sys
+    from pydevd import PyDB
+    from _pydevd_bundle import pydevd_excepthooks
+    py_db = PyDB(set_as_global=False)
+    monkeypatch.setattr(pydevd_excepthooks, 'get_global_debugger', lambda: py_db)
+
+    stopped = []
+
+    def stop_on_unhandled_exception(py_db, thread, additional_info, arg):
+        tb = arg[2]
+        while tb.tb_next is not None:
+            tb = tb.tb_next
+        stopped.append((thread, arg[0], tb.tb_frame.f_code.co_name))
+
+    py_db.stop_on_unhandled_exception = stop_on_unhandled_exception
+
+    def raise_in_thread():
+        raise ValueError('unhandled')
+
+    pydevd_excepthooks.install_excepthooks()
+    try:
+        t = threading.Thread(target=raise_in_thread)
+        pydevd_excepthooks.wrap_thread_run(t)
+        monkeypatch.setattr(sys, 'stderr', sys.stdout)  # Don't show the (expected) traceback as an error.
+        t.start()
+        t.join()
+        assert stopped == [(t, ValueError, 'raise_in_thread')]
+
+        try:
+            raise_in_thread()
+        except ValueError:
+            sys.excepthook(*sys.exc_info())
+        assert stopped[1:] == [(threading.current_thread(), ValueError, 'raise_in_thread')]
+
+        # Reported only once per thread.
+        try:
+            raise_in_thread()
+        except ValueError:
+            sys.excepthook(*sys.exc_info())
+        assert len(stopped) == 2
+    finally:
+        pydevd_excepthooks.uninstall_excepthooks()
+        threading.current_thread().additional_info.suspended_at_unhandled = False
@@ -187,3 +187,160 @@ def test_rules_to_exclude_filter(tmpdir):
         ExcludeFilter(name='bar.foo', exclude=False, is_path=False),
         ExcludeFilter(name='bar', exclude=True, is_path=False),
     ]
+
+
+def _check_matches_reference(patterns, paths):
+    # The (uncompiled) recursive matching which was used before the exclude filters were
+    # compiled (kept to check that the compiled version matches the same things).
+    import fnmatch
+    import glob
+    if not patterns and not paths:
+        return True
+
+    if (not patterns and paths) or (patterns and not paths):
+        return False
+
+    pattern = patterns[0]
+    path = paths[0]
+
+    if not glob.has_magic(pattern):
+        if pattern != path:
+            return False
+
+    elif pattern == '**':
+        if len(patterns) == 1:
+            return True  # if ** is the last one it matches anything to the right.
+
+        for i in range(len(paths)):
+            # Recursively check the remaining patterns as the
+            # current pattern could match any number of paths.
+            if _check_matches_reference(patterns[1:], paths[i:]):
+                return True
+
+    elif not fnmatch.fnmatch(path, pattern):
+        # Current part doesn't match.
+        return False
+
+    return _check_matches_reference(patterns[1:], paths[1:])
+
+
+def _exclude_by_filter_reference(exclude_filters, filename, module_name):
+    for exclude_filter in exclude_filters:
+        if exclude_filter.is_path:
+            patterns = exclude_filter.name.split('/')
+            paths = filename.split('/')
+            if patterns and patterns[0] == '':
+                patterns = patterns[1:]
+            if paths and paths[0] == '':
+                paths = paths[1:]
+            if _check_matches_reference(patterns, paths):
+                return exclude_filter.exclude
+        else:
+            if exclude_filter.name == module_name or module_name.startswith(exclude_filter.name + '.'):
+                return exclude_filter.exclude
+    return None
+
+
+def test_many_exclude_filters():
+    import sys
+    import time
+    from _pydevd_bundle.pydevd_filtering import FilesFiltering
+    from _pydevd_bundle.pydevd_filtering import ExcludeFilter
+    from _pydevd_bundle.pydevd_filtering import _CompiledExcludeFilters
+
+    # 200 rules (which is more than the groups supported in a single regexp in Python 2).
+    exclude_filters = []
+    for i in range(50):
+        exclude_filters.append(ExcludeFilter('/project/pkg%s/**' % (i,), i % 2 == 0, True))
+        exclude_filters.append(ExcludeFilter('**/vendored%s/*.py' % (i,), True, True))
+        exclude_filters.append(ExcludeFilter('/lib/**/mod%s?.py' % (i,), False, True))
+        exclude_filters.append(ExcludeFilter('pkg%s.sub' % (i,), i % 3 == 0, False))
+    exclude_filters.append(ExcludeFilter('/project/**', False, True))
+    exclude_filters.append(ExcludeFilter('pkg1', True, False))
+
+    checks = []
+    for i in range(60):
+        checks.append(('/project/pkg%s/a/b.py' % (i,), 'pkg%s.a.b' % (i,)))
+        checks.append(('/other/vendored%s/c.py' % (i,), 'pkg%s.sub.c' % (i,)))
+        checks.append(('/lib/x/y/mod%sz.py' % (i,), 'pkg%s' % (i,)))
+        checks.append(('/lib/mod%s.py' % (i,), 'pkg%ssub' % (i,)))
+        checks.append(('/project/other%s.py' % (i,), 'pkg1.sub.a'))
+        checks.append(('/unmatched/file%s.py' % (i,), 'unmatched'))
+
+    compiled = _CompiledExcludeFilters(exclude_filters, '/', None)
+    for filename, module_name in checks:
+        assert compiled.exclude_by_filter(filename, module_name) == _exclude_by_filter_reference(
+            exclude_filters, filename, module_name), 'Mismatch for: %s (%s)' % (filename, module_name)
+
+    files_filtering = FilesFiltering()
+    files_filtering.set_exclude_filters(exclude_filters)
+    assert files_filtering.require_module
+
+    def time_it(exclude_by_filter):
+        initial_time = time.time()
+        for _ in range(10):
+            for filename, module_name in checks:
+                exclude_by_filter(filename, module_name)
+        return time.time() - initial_time
+
+    reference_time = time_it(lambda filename, module_name: _exclude_by_filter_reference(
+        exclude_filters, filename, module_name))
+    compiled_time = time_it(compiled.exclude_by_filter)
+    sys.stdout.write('Exclude filters (%s rules, %s checks): %.3fs (uncompiled: %.3fs)\n' % (
+        len(exclude_filters), len(checks) * 10, compiled_time, reference_time))
+
+
+def test_in_project_roots_matches_whole_path_parts(tmpdir):
+    import os.path
+    from _pydevd_bundle.pydevd_filtering import FilesFiltering
+    files_filtering = FilesFiltering()
+
+    project_dir = str(tmpdir.mkdir('project'))
+    other_dir = str(tmpdir.mkdir('project2'))
+    library_dir = str(tmpdir.join('project').mkdir('lib'))
+    files_filtering.set_project_roots([project_dir])
+    files_filtering.set_library_roots([library_dir])
+
+    assert files_filtering.in_project_roots(os.path.join(project_dir, 'a.py'))
+    assert not files_filtering.in_project_roots(os.path.join(library_dir, 'a.py'))
+    assert files_filtering.in_project_roots(os.path.join(project_dir, 'library', 'a.py'))
+
+    # A root must match whole path parts (i.e.: /project is not a root of /project2).
+    assert not files_filtering.in_project_roots(os.path.join(other_dir, 'a.py'))
+
+
+def test_default_library_roots_shared(monkeypatch):
+    import json
+    import os
+    from _pydevd_bundle.pydevd_filtering import FilesFiltering
+    from _pydevd_bundle.pydevd_filtering import DEFAULT_LIBRARY_ROOTS_ENV
+
+    monkeypatch.setattr(FilesFiltering, '_default_interpreter_library_roots', None)
+    monkeypatch.delenv(DEFAULT_LIBRARY_ROOTS_ENV, raising=False)
+    default_library_roots = FilesFiltering._get_default_library_roots()
+
+    # Only shared when subprocesses are also debugged.
+    assert DEFAULT_LIBRARY_ROOTS_ENV not in os.environ
+    FilesFiltering.share_default_library_roots()
+    shared = os.environ[DEFAULT_LIBRARY_ROOTS_ENV]
+
+    # A subprocess reuses it (and removes it from its environment).
+    calls = []
+    monkeypatch.setattr(FilesFiltering, '_default_interpreter_library_roots', None)
+    monkeypatch.setattr(FilesFiltering, '_compute_default_interpreter_library_roots', classmethod(
+        lambda cls: calls.append(1)))
+    assert FilesFiltering._get_default_library_roots() == default_library_roots
+    assert FilesFiltering._get_default_library_roots() == default_library_roots
+    assert not calls
+    assert DEFAULT_LIBRARY_ROOTS_ENV not in os.environ
+
+    # It's not reused by a different interpreter (or with a different user site).
+    monkeypatch.setattr(FilesFiltering, '_compute_default_interpreter_library_roots', classmethod(
+        lambda cls: calls.append(1) or []))
+    for i in (0, -1):
+        other = json.loads(shared)
+        other['interpreter'][i] = 'other'
+        monkeypatch.setattr(FilesFiltering, '_default_interpreter_library_roots', None)
+        monkeypatch.setenv(DEFAULT_LIBRARY_ROOTS_ENV, json.dumps(other))
+        FilesFiltering._get_default_library_roots()
+    assert calls == [1, 1]
@@ -0,0 +1,36 @@
+class _ReferrersTestClass(object):
+    pass
+
+
+def test_heap_snapshot():
+    import sys
+    from _pydevd_bundle.pydevd_memory_inspector import HeapSnapshot
+
+    class Container(object):
+        pass
+
+    obj = _ReferrersTestClass()
+    container = Container()
+    container.attr = obj
+    lst = [1, obj]
+    this_module = sys.modules[__name__]
+    this_module._heap_snapshot_root = {'key': lst}
+    try:
+        heap_snapshot = HeapSnapshot()
+        assert heap_snapshot.objects_count > 0
+        assert heap_snapshot.references_count > 0
+
+        referrers = heap_snapshot.get_referrers(obj)
+        assert (container, 'attr') in referrers
+        assert (lst, 'list[1]') in referrers
+        assert len(heap_snapshot.get_referrers(obj, max_results=1)) == 1
+
+        # Objects created after the snapshot have no referrers.
+        assert heap_snapshot.get_referrers(_ReferrersTestClass()) == []
+
+        path = heap_snapshot.get_path_to_root(lst)
+        assert [found_as for (_referrer, found_as) in path][-2:] == ['_heap_snapshot_root', '__dict__']
+        assert path[-1][0] is this_module
+        assert path[0] == (this_module._heap_snapshot_root, 'key')
+    finally:
+        del this_module._heap_snapshot_root
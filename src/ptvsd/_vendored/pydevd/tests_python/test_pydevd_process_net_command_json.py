@@ -0,0 +1,61 @@
+def test_valid_breakpoint_lines_cache(tmpdir, monkeypatch):
+    import os
+    from _pydevd_bundle import pydevd_process_net_command_json
+    from _pydevd_bundle.pydevd_process_net_command_json import _get_valid_breakpoint_lines
+
+    monkeypatch.setattr(pydevd_process_net_command_json, '_valid_breakpoint_lines_cache', type(
+        pydevd_process_net_command_json._valid_breakpoint_lines_cache)())
+    monkeypatch.setattr(pydevd_process_net_command_json, '_MAX_VALID_BREAKPOINT_LINES_CACHE_SIZE', 2)
+
+    original_get_module_code = pydevd_process_net_command_json._get_module_code
+    compiled = []
+
+    def _get_module_code(filename):
+        compiled.append(filename)
+        return original_get_module_code(filename)
+
+    monkeypatch.setattr(pydevd_process_net_command_json, '_get_module_code', _get_module_code)
+
+    f = tmpdir.join('valid_lines.py')
+    f.write('a = 1\n\ndef method():\n    b = 2\n\n    return b\n')
+    filename = str(f)
+    assert _get_valid_breakpoint_lines(filename) == [1, 3, 4, 6]
+    assert _get_valid_breakpoint_lines(filename) == [1, 3, 4, 6]
+    assert compiled == [filename]
+
+    # Changed: must be recomputed.
+    f.write('a = 1\nb = 2\n')
+    stat = os.stat(filename)
+    os.utime(filename, (stat.st_atime, stat.st_mtime + 10))
+    assert _get_valid_breakpoint_lines(filename) == [1, 2]
+    assert compiled == [filename, filename]
+
+    # The cache is bounded (the least recently used is removed).
+    others = []
+    for i in range(2):
+        other = tmpdir.join('other%s.py' % (i,))
+        other.write('c = 3\n')
+        others.append(str(other))
+        _get_valid_breakpoint_lines(str(other))
+    assert list(pydevd_process_net_command_json._valid_breakpoint_lines_cache) == others
+
+
+def test_valid_breakpoint_lines_from_loaded_module(tmpdir, monkeypatch):
+    import sys
+    from _pydevd_bundle.pydevd_process_net_command_json import _get_module_code
+
+    f = tmpdir.join('_loaded_module_for_lines.py')
+    f.write('a = 1\nb = 2\n')
+    monkeypatch.syspath_prepend(str(tmpdir))
+    import _loaded_module_for_lines
+    try:
+        if getattr(_loaded_module_for_lines, '__loader__', None) is not None:
+            # The import system loader is used (which reuses the .pyc if up to date).
+            calls = []
+            loader = _loaded_module_for_lines.__loader__
+            original_get_code = loader.get_code
+            monkeypatch.setattr(loader, 'get_code', lambda name: calls.append(name) or original_get_code(name))
+            assert _get_module_code(str(f)).co_filename == original_get_code(loader.name).co_filename
+            assert calls
+    finally:
+        sys.modules.pop('_loaded_module_for_lines', None)
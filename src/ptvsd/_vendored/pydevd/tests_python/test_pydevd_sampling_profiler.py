@@ -0,0 +1,77 @@
+import threading
+
+
+def test_sampling_profiler():
+    import json
+    import time
+    from _pydevd_bundle._debug_adapter import pydevd_base_schema
+    from _pydevd_bundle.pydevd_process_net_command_json import _PyDevJsonCommandProcessor
+
+    processor = _PyDevJsonCommandProcessor(pydevd_base_schema.from_json)
+
+    def request(command, arguments):
+        cmd = getattr(processor, 'on_%s_request' % (command.lower(),))(None, pydevd_base_schema.from_dict(
+            {'type': 'request', 'command': command, 'seq': 1, 'arguments': arguments}))
+        return json.loads(cmd._as_bytes.decode('utf-8'))
+
+    assert not request('pydevdStopProfiling', {})['success']
+    assert not request('pydevdStartProfiling', {'clock': 'invalid'})['success']
+    assert request('pydevdStartProfiling', {'interval': 0.001})['success']
+    assert not request('pydevdStartProfiling', {})['success']  # Already started.
+
+    finish = time.time() + 0.3
+
+    def busy_loop_in_thread():
+        while time.time() < finish:
+            pass
+
+    t = threading.Thread(target=busy_loop_in_thread, name='BusyThread')
+    t.start()
+    t.join()
+
+    response = request('pydevdStopProfiling', {'format': 'speedscope'})
+    assert response['success']
+    body = response['body']
+    assert body['format'] == 'speedscope'
+    assert body['samples'] > 0
+
+    profile = json.loads(body['profile'])
+    frames = profile['shared']['frames']
+    profile_names = [p['name'] for p in profile['profiles']]
+    assert 'BusyThread' in profile_names
+    assert 'pydevd.SamplingProfiler' not in profile_names
+
+    busy_thread_profile = profile['profiles'][profile_names.index('BusyThread')]
+    assert len(busy_thread_profile['samples']) == len(busy_thread_profile['weights'])
+    busy_stacks = [s for s in busy_thread_profile['samples'] if frames[s[-1]]['name'] == 'busy_loop_in_thread']
+    assert busy_stacks
+    assert frames[busy_stacks[0][-1]]['file'].endswith('test_pydevd_sampling_profiler.py')
+
+    # Collapsed format (with the cpu clock, where a waiting thread has less weight).
+    from _pydevd_bundle.pydevd_sampling_profiler import can_use_cpu_clock
+    if not can_use_cpu_clock():
+        assert not request('pydevdStartProfiling', {'clock': 'cpu'})['success']
+        return
+
+    assert request('pydevdStartProfiling', {'interval': 0.001, 'clock': 'cpu'})['success']
+    finish = time.time() + 0.3
+
+    def sleep_in_thread():
+        while time.time() < finish:
+            time.sleep(0.01)
+
+    t = threading.Thread(target=sleep_in_thread, name='SleepThread')
+    t.start()
+    busy_loop_in_thread()
+    t.join()
+    response = request('pydevdStopProfiling', {})
+    assert response['body']['format'] == 'collapsed'
+    lines = response['body']['profile'].splitlines()
+    assert any('busy_loop_in_thread (test_pydevd_sampling_profiler.py:' in line for line in lines)
+    thread_name_to_weight = {}
+    for line in lines:
+        stack, weight = line.rsplit(' ', 1)
+        assert int(weight) > 0
+        thread_name = stack.split(';')[0]
+        thread_name_to_weight[thread_name] = thread_name_to_weight.get(thread_name, 0) + int(weight)
+    assert thread_name_to_weight.get('SleepThread', 0) * 10 < thread_name_to_weight['MainThread']
@@ -0,0 +1,64 @@
+import sys
+
+pytest_plugins = [
+    str('tests_python.debugger_fixtures'),
+]
+
+
+def test_sampling_signature_factory(fake_py_db):
+    from _pydevd_bundle.pydevd_comm import unquote_plus
+    from _pydevd_bundle.pydevd_signature import (
+        SamplingSignatureFactory, send_signature_call_trace, send_signature_return_trace)
+
+    dbg = fake_py_db
+    dbg.signature_factory = SamplingSignatureFactory(sample_calls=3, sample_interval=0, flush_interval=1000)
+    sampled = []
+
+    def func(a, b):
+        frame = sys._getframe()
+        if send_signature_call_trace(dbg, frame, 'file.py'):
+            sampled.append(a)
+            ret = a if a % 2 else str(a)
+            send_signature_return_trace(dbg, frame, 'file.py', ret)
+
+    for i in range(7):
+        func(i, None)
+
+    # The first call and then once every 3 calls.
+    assert sampled == [0, 3, 6]
+    assert dbg.writer.commands == []
+
+    dbg.signature_factory.flush(dbg)
+    assert len(dbg.writer.commands) == 1
+    text = unquote_plus(dbg.writer.commands[0]._as_bytes.decode('utf-8'))
+    assert text.count('<call_signature ') == 1
+    assert 'name="func"' in text
+    assert '<arg name="a" type="int">' in text
+    assert '<arg name="b" type="NoneType">' in text
+    assert '<return type="Union[int, str]">' in text
+
+    # Nothing changed: nothing else is sent.
+    dbg.signature_factory.flush(dbg)
+    assert len(dbg.writer.commands) == 1
+    assert dbg.signature_factory._frame_key_to_sampled == {}
+
+    # Returns which aren't seen don't accumulate.
+    dbg.signature_factory.MAX_SAMPLED_FRAMES = 2
+    dbg.signature_factory.sample_calls = 1
+    frame = sys._getframe()
+    for _i in range(5):
+        assert send_signature_call_trace(dbg, frame, 'file.py')
+        assert len(dbg.signature_factory._frame_key_to_sampled) <= 2
+
+    # A return from a frame with the same id but another code isn't matched.
+    frame_key_to_sampled = dbg.signature_factory._frame_key_to_sampled
+    frame_key_to_sampled.clear()
+    frame_key_to_sampled[(id(frame), func.__code__)] = dbg.signature_factory._code_to_sampled[func.__code__]
+    assert not send_signature_return_trace(dbg, frame, 'file.py', None)
+    assert len(frame_key_to_sampled) == 1
+
+    # With exception breakpoints the return isn't traced (the arguments are still sampled).
+    dbg.signature_factory._frame_key_to_sampled.clear()
+    dbg.break_on_caught_exceptions = True
+    assert not send_signature_call_trace(dbg, frame, 'file.py')
+    assert dbg.signature_factory._frame_key_to_sampled == {}
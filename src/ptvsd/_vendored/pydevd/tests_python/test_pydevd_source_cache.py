@@ -0,0 +1,49 @@
+def test_source_cache(tmpdir, monkeypatch):
+    import os
+    import zipfile
+    from _pydevd_bundle import pydevd_source_cache
+    from _pydevd_bundle.pydevd_source_cache import SourceCache
+
+    source_cache = SourceCache(max_size=30)
+
+    filename = str(tmpdir.join('my.py'))
+    with open(filename, 'wb') as stream:
+        stream.write(b'# coding: latin-1\r\nx = "\xe1"\n')
+    expected = u'# coding: latin-1\nx = "\xe1"\n'
+
+    assert source_cache.get_contents(filename) == expected
+    assert source_cache.get_contents(filename) == expected
+    assert (source_cache.hits, source_cache.misses) == (1, 1)
+
+    # Changed files are read again.
+    with open(filename, 'wb') as stream:
+        stream.write(b'x = 10\n')
+    os.utime(filename, (1, 1))
+    assert source_cache.get_contents(filename) == u'x = 10\n'
+    assert (source_cache.hits, source_cache.misses) == (1, 2)
+
+    # Big files are memory mapped (and are not cached if bigger than the max size).
+    monkeypatch.setattr(pydevd_source_cache, 'MMAP_MIN_SIZE', 1)
+    big_filename = str(tmpdir.join('big.py'))
+    with open(big_filename, 'wb') as stream:
+        stream.write(b'y = 20\n' * 10)
+    assert source_cache.get_contents(big_filename) == u'y = 20\n' * 10
+    assert source_cache.size == 7
+
+    # The least recently used contents are evicted.
+    other_filename = str(tmpdir.join('other.py'))
+    with open(other_filename, 'wb') as stream:
+        stream.write(b'z = 30\n' * 4)
+    assert source_cache.get_contents(other_filename) == u'z = 30\n' * 4
+    assert source_cache.size == 28
+    assert source_cache.get_contents(filename) == u'x = 10\n'
+    assert source_cache.size == 7
+
+    zip_filename = str(tmpdir.join('my.zip'))
+    with zipfile.ZipFile(zip_filename, 'w') as zip_file:
+        zip_file.writestr('pkg/mod.py', 'w = 40\n')
+    assert source_cache.get_contents(os.path.join(zip_filename, 'pkg', 'mod.py')) == u'w = 40\n'
+    assert source_cache.get_contents(os.path.join(zip_filename, 'pkg', 'mod.py')) == u'w = 40\n'
+    assert source_cache.hits == 2
+
+    assert source_cache.get_contents(str(tmpdir.join('not_there.py'))) is None
@@ -0,0 +1,51 @@
+def test_step_over_tracer():
+    import sys
+    from _pydevd_bundle.pydevd_comm_constants import CMD_STEP_OVER
+    from _pydevd_bundle.pydevd_constants import STATE_RUN
+    from _pydevd_bundle.pydevd_step_over import StepOverTracer
+    from pydevd_file_utils import get_abs_path_real_path_and_base_from_file
+
+    class _Info(object):
+        pydev_step_cmd = CMD_STEP_OVER
+        pydev_state = STATE_RUN
+        pydev_step_stop = None
+
+    class _PyDB(object):
+        mtime = 0
+        show_return_values = False
+        _finish_debugging_session = False
+        breakpoints = {get_abs_path_real_path_and_base_from_file(__file__)[1]: {1: object()}}
+
+        def can_skip_callees_on_step_over(self):
+            return True
+
+    traced = []
+
+    def thread_trace_func(frame, event, arg):
+        traced.append(frame.f_code.co_name)
+        return None
+
+    def with_breakpoints():
+        return 1
+
+    namespace = {}
+    exec(compile('def without_breakpoints():\n    return 1\n', '<without_breakpoints>', 'exec'), namespace)
+    without_breakpoints = namespace['without_breakpoints']
+
+    info = _Info()
+    step_over_tracer = StepOverTracer(_PyDB(), info, thread_trace_func)
+    original_trace_func = sys.gettrace()
+    sys.settrace(step_over_tracer)
+    try:
+        without_breakpoints()
+        with_breakpoints()
+        assert sys.gettrace() is step_over_tracer
+
+        # When the step over finishes the regular tracing is restored.
+        info.pydev_step_cmd = -1
+        without_breakpoints()
+        assert sys.gettrace() is thread_trace_func
+    finally:
+        sys.settrace(original_trace_func)
+
+    assert traced == ['with_breakpoints', 'without_breakpoints']
@@ -0,0 +1,31 @@
+import pytest
+
+from _pydevd_bundle.pydevd_constants import IS_CPYTHON
+
+
+@pytest.mark.skipif(not IS_CPYTHON, reason='Interrupting evaluations is only available in CPython.')
+def test_evaluation_watchdog():
+    import sys
+    from _pydevd_bundle import pydevd_vars
+    from _pydevd_bundle.pydevd_timeout import EvaluationWatchdog, EvaluationTimeoutError
+
+    frame = sys._getframe()
+    watchdog = EvaluationWatchdog(.2)
+    watchdog.start()
+    results = []
+    try:
+        for expression in ('1 + 1', 'sum(1 for _ in iter(int, 1))', '2 + 2'):
+            try:
+                watchdog.start_budget()
+                try:
+                    results.append(pydevd_vars.evaluate_expression(None, frame, expression, is_exec=False))
+                finally:
+                    watchdog.stop_budget()
+            except EvaluationTimeoutError:
+                results.append('timeout')
+    finally:
+        watchdog.finish()
+
+    assert results == [2, 'timeout', 4]
+    watchdog.join(2)
+    assert not watchdog.is_alive()
@@ -0,0 +1,28 @@
+def test_evaluate_expression_namespace():
+    import sys
+    from _pydevd_bundle import pydevd_vars
+    from _pydevd_bundle.pydevd_xml import ExceptionOnEvaluate
+
+    def check(local_var):
+        frame = sys._getframe()
+        evaluate = lambda expression: pydevd_vars.evaluate_expression(None, frame, expression, is_exec=False)
+
+        # The globals aren't copied if there's no nested scope using the locals.
+        assert pydevd_vars._get_eval_namespace(frame, pydevd_vars._compile_cached('local_var', 'eval')) == (
+            frame.f_globals, frame.f_locals)
+        assert evaluate('local_var + 1') == 11
+        assert evaluate('[local_var + i for i in range(2)]') == [10, 11]
+        assert list(evaluate('(local_var + len(sys.path[:0]) for i in range(1))')) == [10]
+        assert evaluate('list(map(lambda x: x + local_var, [1]))') == [11]
+        assert isinstance(evaluate('[undefined_var for i in range(1)]'), ExceptionOnEvaluate)
+        assert isinstance(evaluate('local_var +'), ExceptionOnEvaluate)
+
+        pydevd_vars.evaluate_expression(None, frame, 'new_var = [local_var for i in range(1)]', is_exec=True)
+        assert frame.f_locals['new_var'] == [10]
+
+    pydevd_vars._compiled_cache.clear()
+    check(10)
+    assert ('local_var + 1', 'eval') in pydevd_vars._compiled_cache
+    code, nested_names = pydevd_vars._compiled_cache[('[local_var + i for i in range(2)]', 'eval')]
+    if sys.version_info[:2] < (3, 12):  # Comprehensions are inlined from Python 3.12 onwards.
+        assert 'local_var' in nested_names
@@ -91,6 +91,42 @@ class TestSetLocals(unittest.TestCase):
         self.assertEqual(50, a)
 
 
+def test_save_locals_if_changed(monkeypatch):
+    import sys
+    from _pydevd_bundle import pydevd_save_locals
+
+    saved = []
+    monkeypatch.setattr(pydevd_save_locals, 'save_locals', lambda frame: saved.append(frame))
+
+    def method():
+        a = [1]
+        frame = sys._getframe()
+        f_locals = frame.f_locals
+        snapshot = pydevd_save_locals.take_locals_snapshot(frame, f_locals)
+
+        # Changing objects in-place doesn't need to be saved.
+        exec('a.append(2)', frame.f_globals, f_locals)
+        assert not pydevd_save_locals.save_locals_if_changed(frame, f_locals, snapshot)
+        assert a == [1, 2]
+
+        exec('a = 10', frame.f_globals, f_locals)
+        assert pydevd_save_locals.save_locals_if_changed(frame, f_locals, snapshot)
+
+        snapshot = pydevd_save_locals.take_locals_snapshot(frame, f_locals)
+        exec('b = 20', frame.f_globals, f_locals)
+        assert pydevd_save_locals.save_locals_if_changed(frame, f_locals, snapshot)
+        return frame
+
+    frame = method()
+    assert saved == [frame, frame]
+
+    # Module-level frames use the globals as locals (nothing to save).
+    module_frame = sys._getframe()
+    while module_frame.f_locals is not module_frame.f_globals:
+        module_frame = module_frame.f_back
+    assert pydevd_save_locals.take_locals_snapshot(module_frame, module_frame.f_locals) is None
+
+
 if __name__ == '__main__':
     suite = unittest.TestSuite()
 #    suite.addTest(TestSetLocals('test_set_locals_using_dict'))
@@ -0,0 +1,73 @@
+'''
+Checks the time it takes for the debugger to start up (this is paid for each debugged
+process, including each worker in multiprocessing pools).
+
+Note: timings are reported (use `pytest -s` to see them), but only the structural
+properties (i.e.: which modules are imported eagerly) are asserted, as timings are too
+dependent on the machine running the tests.
+'''
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tests_python.debug_constants import IS_CPYTHON
+
+PYDEVD_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import_times(code):
+    '''
+    :return dict(str->int):
+        Module name -> cumulative import time (in microseconds), as reported by `-X importtime`.
+    '''
+    env = os.environ.copy()
+    env['PYTHONPATH'] = PYDEVD_ROOT
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', code], stderr=subprocess.STDOUT, env=env, cwd=PYDEVD_ROOT)
+    if not isinstance(output, str):
+        output = output.decode('utf-8', 'replace')
+
+    import_times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        try:
+            _self_time, cumulative, module_name = line[len('import time:'):].split('|')
+            import_times[module_name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # Header line.
+    return import_times
+
+
+@pytest.mark.skipif(not IS_CPYTHON or sys.version_info[:2] < (3, 7), reason='-X importtime requires CPython 3.7 onwards.')
+def test_import_time_pydevd():
+    import_times = _import_times('import pydevd')
+    sys.stdout.write('Import time (pydevd): %.1fms\n' % (import_times['pydevd'] / 1000.,))
+
+    # The debug adapter protocol schema is only needed when the json protocol is used.
+    assert '_pydevd_bundle._debug_adapter.pydevd_schema' not in import_times
+    assert '_pydevd_bundle.pydevd_net_command_factory_json' not in import_times
+    assert '_pydevd_bundle.pydevd_process_net_command_json' not in import_times
+
+    # Plugins are only loaded when some plugin breakpoint is added.
+    assert 'pydevd_plugins.django_debug' not in import_times
+    assert 'pydevd_plugins.jinja2_debug' not in import_times
+
+    if 'pkg_resources' not in _import_times('pass'):
+        # Resolving the pydevd_plugins namespace shouldn't import pkg_resources (which is slow).
+        assert 'pkg_resources' not in import_times
+
+
+@pytest.mark.skipif(not IS_CPYTHON or sys.version_info[:2] < (3, 7), reason='-X importtime requires CPython 3.7 onwards.')
+def test_import_time_schema_on_first_use():
+    import_times = _import_times('from _pydevd_bundle._debug_adapter import pydevd_base_schema')
+    assert '_pydevd_bundle._debug_adapter.pydevd_schema' not in import_times
+
+    # The schema is only loaded when the first message is parsed.
+    import_times = _import_times(
+        'from _pydevd_bundle._debug_adapter import pydevd_base_schema\n'
+        'pydevd_base_schema.from_dict({"type": "request", "command": "threads", "seq": 1})\n'
+    )
+    assert '_pydevd_bundle._debug_adapter.pydevd_schema' in import_times
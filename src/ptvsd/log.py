@@ -4,6 +4,8 @@
 
 from __future__ import print_function, absolute_import, unicode_literals
 
+import atexit
+import collections
 import contextlib
 import functools
 import io
@@ -32,6 +34,26 @@ file = None
 formatter = Formatter()
 tls = threading.local()
 
+pending = collections.deque()
+"""Formatted log entries that haven't been written yet. Entries are appended by write()
+on the calling thread, and are written by the log writer thread; appending to and
+popping from a deque are atomic, so this does not need a lock.
+"""
+
+MAX_PENDING = 10000
+"""If there are more pending entries than this (i.e. the log writer thread can't keep
+up), write() writes them on the calling thread instead.
+"""
+
+ring_buffer = None
+"""If not None, a deque of formatted log messages that are kept in memory instead of
+being written to the file, until an error is logged or flush() is called.
+"""
+
+_writer_thread = None
+_writer_hooks_registered = False
+_has_pending = threading.Event()
+
 
 if sys.version_info >= (3, 5):
     clock = time.monotonic
@@ -50,6 +72,12 @@ def is_enabled():
 
 
 def write(category, fmt, *args, **kwargs):
+    """Logs a message. The message is formatted on the calling thread, but written to
+    the file by the log writer thread.
+
+    Warnings and errors are written synchronously, and are also printed to stderr.
+    """
+
     assert category in 'DIWE'
     if not file and category not in 'WE':
         return
@@ -69,16 +97,68 @@ def write(category, fmt, *args, **kwargs):
     if current_handler():
         prefix += '(while handling {}){}'.format(current_handler(), indent)
 
-    message = prefix + message + '\n\n'
+    pending.append((category, prefix + message + '\n\n'))
+    if _writer_thread is None or category in 'WE' or len(pending) > MAX_PENDING:
+        _write_pending()
+    else:
+        _has_pending.set()
+
+
+def _write_pending():
     with lock:
-        if file:
-            file.write(message)
-            file.flush()
-        if category in 'WE':
+        written = False
+        while True:
             try:
-                sys.__stderr__.write(message)
-            except:
-                pass
+                entry = pending.popleft()
+            except IndexError:
+                break
+
+            category, message = entry
+            if ring_buffer is not None:
+                ring_buffer.append(message)
+                if category == 'E':
+                    written = _write_ring_buffer() or written
+            elif file:
+                file.write(message)
+                written = True
+
+            if category in 'WE':
+                try:
+                    sys.__stderr__.write(message)
+                except:
+                    pass
+
+        if written:
+            file.flush()
+
+
+def _write_ring_buffer():
+    # Must be called with the lock held.
+    if not file:
+        return False
+    while ring_buffer:
+        file.write(ring_buffer.popleft())
+    return True
+
+
+def _log_writer():
+    this_thread = threading.current_thread()
+    while _writer_thread is this_thread:
+        _has_pending.wait()
+        _has_pending.clear()
+        _write_pending()
+
+
+def flush():
+    """Writes all pending log entries. If the ring buffer is in use, its contents are
+    written to the file as well.
+    """
+
+    _write_pending()
+    if ring_buffer is not None:
+        with lock:
+            if _write_ring_buffer():
+                file.flush()
 
 
 debug = functools.partial(write, 'D')
@@ -117,11 +197,14 @@ def escaped_exceptions(f):
 
 
 def to_file():
-    global file
+    global file, ring_buffer
 
     if ptvsd.options.log_dir and not file:
         filename = ptvsd.options.log_dir + '/ptvsd-{}.log'.format(os.getpid())
         file = io.open(filename, 'w', encoding='utf-8')
+        if ptvsd.options.log_ring_buffer:
+            ring_buffer = collections.deque(maxlen=ptvsd.options.log_ring_buffer)
+        _start_writer()
 
     info(
         '{0} {1}\n{2} {3} ({4}-bit)\nptvsd {5}',
@@ -134,6 +217,63 @@ def to_file():
     )
 
 
+def _start_writer():
+    global _writer_thread, _writer_hooks_registered
+
+    if _writer_thread is not None:
+        return
+
+    from ptvsd._util import new_hidden_thread
+    _writer_thread = new_hidden_thread('LogWriter', _log_writer)
+    _writer_thread.start()
+
+    if not _writer_hooks_registered:
+        _writer_hooks_registered = True
+        atexit.register(flush)
+        if hasattr(os, 'register_at_fork'):
+            # The lock is held while forking, so that the child doesn't inherit it while some
+            # other thread is writing.
+            os.register_at_fork(
+                before=lock.acquire,
+                after_in_parent=lock.release,
+                after_in_child=_after_fork_in_child,
+            )
+
+
+def _stop_writer():
+    """Stops the log writer thread after it writes the pending entries. Entries logged
+    afterwards are written synchronously.
+    """
+
+    global _writer_thread
+
+    writer_thread = _writer_thread
+    if writer_thread is None:
+        return
+
+    _writer_thread = None
+    _has_pending.set()
+    if writer_thread.is_alive() and writer_thread is not threading.current_thread():
+        writer_thread.join()
+    _write_pending()
+
+
+def _after_fork_in_child():
+    """The writer thread doesn't exist in a forked child, so entries are written
+    synchronously there. The entries inherited from the parent are discarded, as the
+    parent writes them itself.
+    """
+
+    global _writer_thread, _has_pending
+
+    _writer_thread = None
+    _has_pending = threading.Event()  # Its lock may have been held while forking too.
+    pending.clear()
+    if ring_buffer is not None:
+        ring_buffer.clear()
+    lock.release()
+
+
 def current_handler():
     try:
         return tls.current_handler
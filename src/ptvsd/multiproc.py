@@ -54,8 +54,16 @@ set to True, indicating that the subprocess should wait for that connection befo
 proceeding. If no incoming connection is expected, it is set to False, indicating
 that the subprocess shall proceed executing user code immediately.
 
-subprocess_queue.task_done() must be invoked for every subprocess_queue.get(), for
-the corresponding subprocess_response to be delivered back to the subprocess.
+subprocess_done(subprocess_response) must be invoked for every subprocess_queue.get(),
+for the corresponding subprocess_response to be delivered back to the subprocess.
+Entries are completed independently of each other, so many subprocesses can be
+registering at the same time without waiting for one another.
+"""
+
+_pending_responses = {}
+"""Maps id(subprocess_response) to a threading.Event that is set once that entry
+in subprocess_queue has been processed; subprocess_lock must be used to synchronize
+access.
 """
 
 root_start_request = None
@@ -73,7 +81,9 @@ def listen_for_subprocesses():
     global subprocess_listener_socket
     assert subprocess_listener_socket is None
 
-    subprocess_listener_socket = create_server('localhost', 0)
+    # Pools such as multiprocessing.Pool spawn many workers at once, and all of them
+    # connect back at about the same time; make sure they don't get refused.
+    subprocess_listener_socket = create_server('localhost', 0, backlog=socket.SOMAXCONN)
     ptvsd.log.debug(
         'Listening for subprocess notifications on port {0}.',
         subprocess_listener_port())
@@ -159,8 +169,11 @@ def _handle_subprocess(n, stream):
                 self._pid)
 
             response = {'incomingConnection': False}
+            done = threading.Event()
+            with subprocess_lock:
+                _pending_responses[id(response)] = done
             subprocess_queue.put((arguments, response))
-            subprocess_queue.join()
+            done.wait()
             return response
 
         def disconnect(self):
@@ -174,6 +187,18 @@ def _handle_subprocess(n, stream):
     channel.start()
 
 
+def subprocess_done(subprocess_response):
+    """Marks the subprocess_queue entry with the specified subprocess_response as
+    processed, and unblocks the corresponding subprocess.
+    """
+
+    with subprocess_lock:
+        done = _pending_responses.pop(id(subprocess_response), None)
+    subprocess_queue.task_done()
+    if done is not None:
+        done.set()
+
+
 def notify_root(port):
     assert options.subprocess_of
 
@@ -10,11 +10,27 @@ import os
 """ptvsd command-line options that need to be globally available.
 """
 
+
+def _positive_int_from_env(name):
+    # Invalid values are ignored rather than failing on import.
+    try:
+        value = int(os.getenv(name, '0'))
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
 log_dir = os.getenv('PTVSD_LOG_DIR')
 """If not None, debugger logs its activity to a file named ptvsd-<pid>.log in
 the specified directory, where <pid> is the return value of os.getpid().
 """
 
+log_ring_buffer = _positive_int_from_env('PTVSD_LOG_RING_BUFFER')
+"""If not None, and log_dir is specified, the last log_ring_buffer log messages are
+kept in memory, and only written to the log file when an error is logged, or when
+ptvsd.log.flush() is called.
+"""
+
 target_kind = None
 """One of: None, 'file', 'module', 'code', or 'pid'.
 """
@@ -70,7 +70,7 @@ def is_socket(sock):
     return isinstance(sock, socket.socket)
 
 
-def create_server(host, port, timeout=None):
+def create_server(host, port, timeout=None, backlog=1):
     """Return a local server socket listening on the given port."""
     if host is None:
         host = 'localhost'
@@ -79,7 +79,7 @@ def create_server(host, port, timeout=None):
         server.bind((host, port))
         if timeout is not None:
             server.settimeout(timeout)
-        server.listen(1)
+        server.listen(backlog)
     except Exception:
         server.close()
         raise
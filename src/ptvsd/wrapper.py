@@ -908,7 +908,7 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
             else:
                 subprocess_response['incomingConnection'] = True
 
-            multiproc.subprocess_queue.task_done()
+            multiproc.subprocess_done(subprocess_response)
 
     # async helpers
 
@@ -1115,6 +1115,24 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
     def on_modules(self, request, args):
         self._forward_request_to_pydevd(request, args)
 
+    def on_pydevdStartProfiling(self, request, args):
+        self._forward_request_to_pydevd(request, args)
+
+    def on_pydevdStopProfiling(self, request, args):
+        self._forward_request_to_pydevd(request, args)
+
+    def on_pydevdGetConcurrencyEvents(self, request, args):
+        self._forward_request_to_pydevd(request, args)
+
+    def on_pydevdEvaluateWatches(self, request, args):
+        self._forward_request_to_pydevd(request, args)
+
+    def on_pydevdSourceChunk(self, request, args):
+        self._forward_request_to_pydevd(request, args)
+
+    def on_pydevdGetReferrers(self, request, args):
+        self._forward_request_to_pydevd(request, args)
+
     @async_handler
     def on_pause(self, request, args):
         # Pause requests cannot be serviced until pydevd is fully initialized.
@@ -0,0 +1,125 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root
+# for license information.
+
+from __future__ import print_function, with_statement, absolute_import, unicode_literals
+
+import collections
+import io
+import pytest
+import threading
+
+import ptvsd.log
+
+
+pytestmark = pytest.mark.timeout(5)
+
+
+@pytest.fixture
+def log_file(monkeypatch):
+    f = io.StringIO()
+    monkeypatch.setattr(ptvsd.log, 'file', f)
+    monkeypatch.setattr(ptvsd.log, 'ring_buffer', None)
+    monkeypatch.setattr(ptvsd.log, '_writer_thread', None)
+    yield f
+    ptvsd.log.flush()
+
+
+def test_write_deferred(log_file, monkeypatch):
+    # Pretend that there's a writer thread, but don't actually run it.
+    monkeypatch.setattr(ptvsd.log, '_writer_thread', threading.current_thread())
+
+    body = {'command': 'next'}
+    ptvsd.log.debug('sent {0!j}', body)
+    body['command'] = 'continue'
+    assert log_file.getvalue() == ''
+
+    ptvsd.log.flush()
+    assert 'sent {\n' in log_file.getvalue()
+    assert '"command": "next"' in log_file.getvalue()
+
+
+def test_write_errors_immediately(log_file, monkeypatch):
+    monkeypatch.setattr(ptvsd.log, '_writer_thread', threading.current_thread())
+
+    ptvsd.log.debug('first')
+    ptvsd.log.error('second')
+    output = log_file.getvalue()
+    assert output.index('first') < output.index('second')
+    assert output.startswith('D')
+
+
+def test_invalid_format_string(log_file):
+    with pytest.raises(IndexError):
+        ptvsd.log.info('{0} {1}', 'a')
+    assert 'invalid format string' in log_file.getvalue()
+
+
+def test_ring_buffer(log_file, monkeypatch):
+    monkeypatch.setattr(ptvsd.log, 'ring_buffer', collections.deque(maxlen=3))
+
+    for i in range(10):
+        ptvsd.log.info('message {0}', i)
+    assert log_file.getvalue() == ''
+
+    ptvsd.log.flush()
+    output = log_file.getvalue()
+    assert 'message 6' not in output
+    assert 'message 7' in output
+    assert 'message 9' in output
+
+    ptvsd.log.info('message {0}', 10)
+    assert 'message 10' not in log_file.getvalue()
+    ptvsd.log.error('failure')
+    output = log_file.getvalue()
+    assert output.index('message 10') < output.index('failure')
+
+
+def test_writer_thread(log_file):
+    ptvsd.log._start_writer()
+    try:
+        ptvsd.log.info('from writer')
+        ptvsd.log.flush()
+        assert 'from writer' in log_file.getvalue()
+    finally:
+        ptvsd.log._stop_writer()
+
+
+def test_stop_writer(log_file, monkeypatch):
+    registered = []
+    monkeypatch.setattr(ptvsd.log, '_writer_hooks_registered', False)
+    monkeypatch.setattr(ptvsd.log.atexit, 'register', registered.append)
+    if hasattr(ptvsd.log.os, 'register_at_fork'):
+        monkeypatch.setattr(ptvsd.log.os, 'register_at_fork', lambda **kwargs: registered.append(kwargs))
+
+    for _ in range(2):
+        ptvsd.log._start_writer()
+        writer_thread = ptvsd.log._writer_thread
+        ptvsd.log.info('pending')
+        ptvsd.log._stop_writer()
+
+        assert not writer_thread.is_alive()
+        assert ptvsd.log._writer_thread is None
+
+    # Hooks are only registered on the first start.
+    assert registered[0] == ptvsd.log.flush
+    assert len(registered) == (2 if hasattr(ptvsd.log.os, 'register_at_fork') else 1)
+    assert log_file.getvalue().count('pending') == 2
+
+
+def test_after_fork_in_child(log_file, monkeypatch):
+    monkeypatch.setattr(ptvsd.log, '_writer_thread', threading.current_thread())
+    ptvsd.log.info('from parent')
+
+    # As if forked while the lock is held by the "before" fork hook.
+    ptvsd.log.lock.acquire()
+    ptvsd.log._after_fork_in_child()
+
+    assert not ptvsd.log.lock.locked()
+    assert ptvsd.log._writer_thread is None
+    assert not ptvsd.log.pending
+
+    ptvsd.log.info('from child')
+    output = log_file.getvalue()
+    assert 'from child' in output
+    assert 'from parent' not in output
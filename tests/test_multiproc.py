@@ -0,0 +1,94 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root
+# for license information.
+
+from __future__ import print_function, with_statement, absolute_import
+
+import pytest
+import threading
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from ptvsd import multiproc
+from ptvsd.messaging import JsonIOStream, JsonMessageChannel
+from ptvsd.socket import create_client, close_socket
+
+
+pytestmark = pytest.mark.timeout(30)
+
+FAKE_CHILDREN = 256
+
+
+@pytest.fixture
+def listener():
+    multiproc.listen_for_subprocesses()
+    try:
+        yield multiproc.subprocess_listener_port()
+    finally:
+        multiproc.stop_listening_for_subprocesses()
+        with multiproc.subprocess_lock:
+            multiproc.subprocesses.clear()
+
+
+def _fake_child(port, pid):
+    sock = create_client()
+    sock.connect(('localhost', port))
+    stream = JsonIOStream.from_socket(sock, 'fake-child-%d' % pid)
+    channel = JsonMessageChannel(stream)
+    channel.start()
+    request = channel.send_request('ptvsd_subprocess', {
+        'parentProcessId': 1,
+        'processId': pid,
+        'port': 0,
+    })
+    return channel, sock, request
+
+
+def test_concurrent_registration(listener):
+    # The first child to be registered is held back by the IDE side; all the
+    # others must still be able to complete their registration meanwhile.
+    children = [None] * FAKE_CHILDREN
+
+    def spawn(i):
+        children[i] = _fake_child(listener, 100000 + i)
+
+    spawners = [threading.Thread(target=spawn, args=(i,)) for i in range(FAKE_CHILDREN)]
+    for t in spawners:
+        t.start()
+    for t in spawners:
+        t.join()
+
+    held_back = None
+    seen = set()
+    while len(seen) < FAKE_CHILDREN:
+        request, response = multiproc.subprocess_queue.get(timeout=10)
+        assert request['rootProcessId'] > 0
+        seen.add(request['processId'])
+        if held_back is None:
+            held_back = request['processId'], response
+            continue
+        response['incomingConnection'] = True
+        multiproc.subprocess_done(response)
+
+    with pytest.raises(queue.Empty):
+        multiproc.subprocess_queue.get(timeout=0.1)
+
+    held_back_pid, held_back_response = held_back
+    held_back_request = children[held_back_pid - 100000][2]
+    for channel, sock, request in children:
+        if request is not held_back_request:
+            assert request.wait_for_response() == {'incomingConnection': True}
+    assert held_back_request.response is None
+
+    multiproc.subprocess_done(held_back_response)
+    assert held_back_request.wait_for_response() == {'incomingConnection': False}
+
+    with multiproc.subprocess_lock:
+        assert len(multiproc.subprocesses) == FAKE_CHILDREN
+
+    for channel, sock, request in children:
+        channel.close()
+        close_socket(sock)
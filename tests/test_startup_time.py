@@ -0,0 +1,83 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root
+# for license information.
+
+from __future__ import print_function, with_statement, absolute_import
+
+import os
+import pytest
+import subprocess
+import sys
+import time
+
+import ptvsd
+from .helpers import print
+
+
+pytestmark = pytest.mark.timeout(60)
+
+STARTUP_BUDGET = float(os.environ.get('PTVSD_STARTUP_BUDGET', 10))
+"""Maximum time (in seconds) allowed from spawning the process until the first line of
+user code runs. It's deliberately generous, because CI machines can be slow; the actual
+timings are printed, so that regressions are visible in the test output.
+"""
+
+
+def _time_to_first_user_line(tmpdir, argv):
+    code_to_debug = tmpdir.join('code_to_debug.py')
+    code_to_debug.write(
+        'import sys, time\n'
+        'sys.stdout.write("%r\\n" % (time.time(),))\n'
+        'sys.stdout.flush()\n'
+    )
+    code_to_debug = code_to_debug.strpath
+
+    env = os.environ.copy()
+    # Debug logging (enabled by conftest) would dominate the measurement.
+    env.pop('PYDEVD_DEBUG', None)
+    env.pop('PYDEVD_DEBUG_FILE', None)
+    env['PYTHONPATH'] = os.path.dirname(os.path.dirname(ptvsd.__file__))
+    start = time.time()
+    output = subprocess.check_output(
+        [sys.executable] + argv(code_to_debug), env=env, stderr=subprocess.STDOUT)
+    first_user_line = float(output.decode('utf-8').strip().splitlines()[-1])
+    return first_user_line - start
+
+
+def test_startup_time_launch(tmpdir):
+    elapsed = _time_to_first_user_line(
+        tmpdir,
+        lambda code_to_debug: ['-m', 'ptvsd', '--host', 'localhost', '--port', '0', code_to_debug])
+    print('Time to first user line (python -m ptvsd): %.3fs' % elapsed)
+    assert elapsed < STARTUP_BUDGET
+
+
+def test_startup_time_enable_attach(tmpdir):
+    elapsed = _time_to_first_user_line(
+        tmpdir,
+        lambda code_to_debug: [
+            '-c',
+            'import ptvsd; ptvsd.enable_attach(("localhost", 0)); exec(open(%r).read())' % code_to_debug,
+        ])
+    print('Time to first user line (ptvsd.enable_attach): %.3fs' % elapsed)
+    assert elapsed < STARTUP_BUDGET
+
+
+def test_import_pydevd_does_not_load_extensions():
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.path.dirname(os.path.dirname(ptvsd.__file__))
+    output = subprocess.check_output([
+        sys.executable,
+        '-c',
+        'import sys\n'
+        'from ptvsd._vendored import force_pydevd\n'
+        'import pydevd\n'
+        'from _pydevd_bundle import pydevd_extension_utils\n'
+        'print(pydevd_extension_utils.EXTENSION_MANAGER_INSTANCE.loaded_extensions is None)\n'
+        'print("pydevd_plugins.extensions" in sys.modules)\n'
+    ], env=env, stderr=subprocess.STDOUT)
+
+    # Extensions are only loaded on the first connection.
+    loaded_extensions_is_none, extensions_imported = output.decode('utf-8').strip().splitlines()[-2:]
+    assert loaded_extensions_is_none == 'True'
+    assert extensions_imported == 'False'